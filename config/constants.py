@@ -293,6 +293,24 @@ TUR_CEVIRI = {
     "True Adventure": "GerçekMacera"
 }
 
+# Değişken alanların tazelik süresi (saat); listede olmayan alanlar (başlık,
+# yazar, ISBN, sayfa...) değişmez kabul edilir ve yeniden çekilmez
+ALAN_TTL_SAAT = {
+    "puan": 24 * 7,
+    "oy_sayisi": 24 * 7,
+    "turu": 24 * 90,
+}
+
+# Kaynakta bulunamayan (boş dönen) değişken alanın yeniden denenme süresi (saat)
+BOS_ALAN_TTL_SAAT = 24
+
+# Değişken alanın yenilendiği kaynak
+ALAN_KAYNAGI = {
+    "puan": "goodreads",
+    "oy_sayisi": "goodreads",
+    "turu": "goodreads",
+}
+
 def veri_kalibi():
     return {
         "baslik": None, "yazar": None, "aciklama": None, "seri": None,
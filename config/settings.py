@@ -48,7 +48,39 @@ class Settings:
     CACHE_TTL: int = int(os.getenv('CACHE_TTL', 168))
     
     REQUEST_TIMEOUT: int = 15
-    RATE_LIMIT_DELAY: float = 0.5
+    RATE_LIMIT_DELAY: float = float(os.getenv('RATE_LIMIT_DELAY', 0.5))
+    
+    # Host başına aynı anda yapılabilecek istek sayısı
+    HOST_MAX_ESZAMANLI: int = int(os.getenv('HOST_MAX_ESZAMANLI', 2))
+    # Toplu aramada (search_many) kaynak grubu başına eşzamanlı kitap
+    TOPLU_ARAMA_ESZAMANLI: int = int(os.getenv('TOPLU_ARAMA_ESZAMANLI', 4))
+    # Tek mesaj için toplam arama + zenginleştirme süresi (saniye)
+    MESAJ_ZAMAN_BUTCESI: float = float(os.getenv('MESAJ_ZAMAN_BUTCESI', 45))
+    # İngilizce sorgu Goodreads'te bulunamazsa Kitapyurdu'nda denenecek strateji sayısı
+    EN_KITAPYURDU_STRATEJI: int = int(os.getenv('EN_KITAPYURDU_STRATEJI', 2))
+    # Yerel katalog eşleşmesinin ağa çıkmadan kabul edilmesi için en düşük güven (0-1)
+    KATALOG_GUVEN_ESIGI: float = float(os.getenv('KATALOG_GUVEN_ESIGI', 0.8))
+    # Salt okunur katalog snapshot'ı (mmap) ve yeniden üretim aralığı (saat)
+    SNAPSHOT_DOSYASI: str = os.getenv('SNAPSHOT_DOSYASI', 'katalog.snap')
+    SNAPSHOT_YENILEME_SAAT: float = float(os.getenv('SNAPSHOT_YENILEME_SAAT', 24))
+    # Mesaj hattı: eşzamanlı arama işçisi ve aşama kuyruklarının boyu
+    HAT_ARAMA_ISCI: int = int(os.getenv('HAT_ARAMA_ISCI', 4))
+    HAT_KUYRUK_BOYUTU: int = int(os.getenv('HAT_KUYRUK_BOYUTU', 50))
+    # Mesaj sonuç önbelleği: en fazla kayıt, toplam boyut (MB) ve yeniden
+    # başlatmada korunması için dosya (boş: kalıcı değil)
+    SONUC_ONBELLEK_BOYUTU: int = int(os.getenv('SONUC_ONBELLEK_BOYUTU', 500))
+    SONUC_ONBELLEK_MB: float = float(os.getenv('SONUC_ONBELLEK_MB', 8))
+    SONUC_ONBELLEK_DOSYASI: str = os.getenv('SONUC_ONBELLEK_DOSYASI', '')
+    # Düzenlenen mesaj bu kadar saniye yeniden düzenlenmezse işlenir
+    DUZENLEME_SESSIZLIK: float = float(os.getenv('DUZENLEME_SESSIZLIK', 2.0))
+    # Telegram çağrı hızı tavanı (istek/sn): genel ve kanal başına;
+    # bundan uzun FloodWait beklenmez, çağrı bırakılır (saniye)
+    TG_GENEL_HIZ: float = float(os.getenv('TG_GENEL_HIZ', 3.0))
+    TG_KANAL_HIZI: float = float(os.getenv('TG_KANAL_HIZI', 1.0))
+    TG_MAX_FLOOD_BEKLEME: float = float(os.getenv('TG_MAX_FLOOD_BEKLEME', 600))
+    # Geçmiş taramada kaç mesajda bir kontrol noktası yazılır (yeniden
+    # başlatmada tarama kaldığı yerden sürer)
+    TARAMA_NOKTA_ARALIGI: int = int(os.getenv('TARAMA_NOKTA_ARALIGI', 200))
     
     @classmethod
     def validate(cls) -> bool:
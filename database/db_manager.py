@@ -10,9 +10,11 @@ import os
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 from config.settings import settings
+from database.snapshot import katalog_snapshot
+from utils.similarity import normalize_et
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +84,122 @@ class DatabaseManager:
                 )
             """)
             
+            # 3. Eser (Goodreads work) tablosu - baskılar arası ortak alanlar
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS eserler (
+                    eser_id TEXT PRIMARY KEY,
+                    veri TEXT NOT NULL,
+                    guncelleme_tarihi TEXT NOT NULL
+                )
+            """)
+            
+            # 4. Eser takma adları (ISBN, başlık+yazar, orijinal ad → eser)
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS eser_takma_adlari (
+                    takma_ad TEXT PRIMARY KEY,
+                    eser_id TEXT NOT NULL
+                )
+            """)
+            
+            # 5. Seriler ve ciltleri (kardeş ciltler yerel eşleşsin diye)
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS seriler (
+                    seri_id TEXT PRIMARY KEY,
+                    seri_adi TEXT NOT NULL,
+                    liste_url TEXT,
+                    liste_tarihi TEXT
+                )
+            """)
+            
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS seri_takma_adlari (
+                    takma_ad TEXT PRIMARY KEY,
+                    seri_id TEXT NOT NULL
+                )
+            """)
+            
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS seri_ciltleri (
+                    seri_id TEXT NOT NULL,
+                    cilt_no TEXT NOT NULL,
+                    kaynak TEXT NOT NULL,
+                    baslik TEXT,
+                    link TEXT NOT NULL,
+                    PRIMARY KEY (seri_id, cilt_no, kaynak)
+                )
+            """)
+            
+            # 6. Yazar dil dizini (yerli / çeviri eser sayıları)
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS yazar_dilleri (
+                    yazar TEXT PRIMARY KEY,
+                    yerli INTEGER DEFAULT 0,
+                    yabanci INTEGER DEFAULT 0
+                )
+            """)
+            
+            # 7. Kitapyurdu arama stratejisi istatistikleri (dosya adı deseni başına)
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS strateji_istatistikleri (
+                    desen TEXT NOT NULL,
+                    strateji TEXT NOT NULL,
+                    deneme INTEGER DEFAULT 0,
+                    basari INTEGER DEFAULT 0,
+                    ort_sure REAL DEFAULT 0,
+                    PRIMARY KEY (desen, strateji)
+                )
+            """)
+            
+            # 8. Elle sabitlenen eşleşmeler (dosya parmak izi / ISBN → kaynak linki)
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS manuel_eslesmeler (
+                    anahtar TEXT PRIMARY KEY,
+                    hedef_url TEXT NOT NULL,
+                    ekleyen INTEGER,
+                    tarih TEXT NOT NULL
+                )
+            """)
+            
+            # 9. Çözülmüş kitap kataloğu + FTS5 dizini (Türkçe katlanmış metin)
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS katalog (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    anahtar TEXT UNIQUE NOT NULL,
+                    veri TEXT NOT NULL,
+                    guncelleme_tarihi TEXT NOT NULL
+                )
+            """)
+            await self.conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS katalog_fts USING fts5(
+                    baslik, yazar, orijinal_ad, seri, isbn,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            """)
+            
+            # 10. Mesaja son yazılan altyazının özetleri (boş düzenleme atlama)
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS mesaj_altyazilari (
+                    kanal_id INTEGER NOT NULL,
+                    mesaj_id INTEGER NOT NULL,
+                    yazilan_ozet TEXT NOT NULL,
+                    telegram_ozet TEXT NOT NULL,
+                    tarih TEXT NOT NULL,
+                    PRIMARY KEY (kanal_id, mesaj_id)
+                )
+            """)
+            
+            # 11. Geçmiş tarama kontrol noktaları (kanal başına kaldığı yer)
+            await self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS tarama_noktalari (
+                    kanal_id INTEGER PRIMARY KEY,
+                    en_yuksek INTEGER,
+                    en_dusuk INTEGER,
+                    imlec INTEGER,
+                    tamamlandi INTEGER NOT NULL DEFAULT 0,
+                    tarih TEXT NOT NULL
+                )
+            """)
+            
             # İndeksler
             await self.conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_kitaplar_tarih 
@@ -145,6 +263,7 @@ class DatabaseManager:
                 """, (anahtar, veri_json, tarih_str, tarih_str))
                 
                 await self.conn.commit()
+                katalog_snapshot.gecersiz_kil(anahtar)
                 logger.debug(f"💾 Cache kaydedildi: {anahtar}")
                 return True
                 
@@ -152,10 +271,60 @@ class DatabaseManager:
             logger.error(f"❌ Cache kayıt hatası: {e}", exc_info=True)
             return False
     
+    async def sil(self, anahtar: str) -> bool:
+        """
+        Cache kaydını sil
+        
+        Returns:
+            Kayıt silindiyse True
+        """
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    "DELETE FROM kitaplar WHERE anahtar = ?", (anahtar,)
+                )
+                await self.conn.commit()
+                katalog_snapshot.gecersiz_kil(anahtar)
+                return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"❌ Cache silme hatası: {e}")
+            return False
+    
+    async def isbn_kayitlarini_sil(self, isbn: str) -> int:
+        """
+        Verisindeki ISBN eşleşen cache kayıtlarını sil
+        
+        Args:
+            isbn: Yalnızca rakamlardan oluşan ISBN
+        
+        Returns:
+            Silinen kayıt sayısı
+        """
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    """
+                    DELETE FROM kitaplar
+                    WHERE REPLACE(REPLACE(json_extract(veri, '$.isbn'), '-', ''), ' ', '') = ?
+                    RETURNING anahtar
+                    """,
+                    (isbn,)
+                )
+                silinenler = [row[0] for row in await cursor.fetchall()]
+                await self.conn.commit()
+                katalog_snapshot.gecersiz_kil(*silinenler)
+                return len(silinenler)
+        except Exception as e:
+            logger.error(f"❌ ISBN kayıt silme hatası: {e}")
+            return 0
+    
     async def getir(
         self, 
         anahtar: str, 
-        cache_ttl_hours: int = None
+        cache_ttl_hours: int = None,
+        ttl_yok_say: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
         Cache'den getir
@@ -163,6 +332,8 @@ class DatabaseManager:
         Args:
             anahtar: Benzersiz anahtar
             cache_ttl_hours: Cache geçerlilik süresi (saat)
+            ttl_yok_say: True ise süresi dolmuş kayıt da döner (alan bazlı
+                tazelik kontrolü çağıranda yapılır)
             
         Returns:
             Veri dictionary veya None
@@ -186,7 +357,7 @@ class DatabaseManager:
                     veri_json, guncelleme_str = sonuc
                     
                     # TTL kontrolü
-                    if guncelleme_str:
+                    if guncelleme_str and not ttl_yok_say:
                         try:
                             guncelleme = datetime.strptime(
                                 guncelleme_str, 
@@ -207,6 +378,688 @@ class DatabaseManager:
             logger.error(f"❌ Cache okuma hatası: {e}", exc_info=True)
             return None
     
+    async def getir_swr(
+        self,
+        anahtar: str,
+        cache_ttl_hours: int = None
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Cache'den getir (stale-while-revalidate)
+        
+        Süresi dolmuş kayıt da döner; çağıran kaydı hemen kullanıp
+        arka planda yenileyebilir.
+        
+        Args:
+            anahtar: Benzersiz anahtar
+            cache_ttl_hours: Cache geçerlilik süresi (saat)
+            
+        Returns:
+            (veri veya None, bayat_mi)
+        """
+        if not anahtar:
+            return None, False
+        
+        ttl = cache_ttl_hours or settings.CACHE_TTL
+        
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                
+                cursor = await self.conn.execute(
+                    "SELECT veri, guncelleme_tarihi FROM kitaplar WHERE anahtar = ?",
+                    (anahtar,)
+                )
+                sonuc = await cursor.fetchone()
+                
+                if not sonuc:
+                    return None, False
+                
+                veri_json, guncelleme_str = sonuc
+                bayat = False
+                if guncelleme_str:
+                    try:
+                        guncelleme = datetime.strptime(guncelleme_str, '%Y-%m-%d %H:%M:%S')
+                        bayat = datetime.now() - guncelleme > timedelta(hours=ttl)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Tarih parse hatası: {e}")
+                
+                logger.debug(f"💾 Cache'den yüklendi{' (bayat)' if bayat else ''}: {anahtar}")
+                return json.loads(veri_json), bayat
+                
+        except Exception as e:
+            logger.error(f"❌ Cache okuma hatası: {e}", exc_info=True)
+            return None, False
+    
+    # ==================== ESER (WORK) DEPOSU ====================
+    
+    async def eser_kaydet(
+        self,
+        eser_id: str,
+        alanlar: Dict[str, Any],
+        takma_adlar: List[str]
+    ) -> bool:
+        """
+        Eserin ortak alanlarını ve takma adlarını kaydet
+        
+        Args:
+            eser_id: Goodreads work kimliği
+            alanlar: Baskılar arası ortak alanlar (mevcutla birleştirilir)
+            takma_adlar: Bu esere çözülecek anahtarlar
+            
+        Returns:
+            Başarılı ise True
+        """
+        if not eser_id:
+            return False
+        
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                
+                cursor = await self.conn.execute(
+                    "SELECT veri FROM eserler WHERE eser_id = ?", (eser_id,)
+                )
+                mevcut = await cursor.fetchone()
+                veri = json.loads(mevcut[0]) if mevcut else {}
+                
+                zamanlar = {**veri.get("_alan_zamanlari", {}), **alanlar.get("_alan_zamanlari", {})}
+                veri.update({k: v for k, v in alanlar.items() if v})
+                if zamanlar:
+                    veri["_alan_zamanlari"] = zamanlar
+                
+                tarih_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                await self.conn.execute(
+                    "INSERT OR REPLACE INTO eserler (eser_id, veri, guncelleme_tarihi) VALUES (?, ?, ?)",
+                    (eser_id, json.dumps(veri, ensure_ascii=False), tarih_str)
+                )
+                await self.conn.executemany(
+                    "INSERT OR REPLACE INTO eser_takma_adlari (takma_ad, eser_id) VALUES (?, ?)",
+                    [(takma_ad, eser_id) for takma_ad in takma_adlar]
+                )
+                
+                await self.conn.commit()
+                logger.debug(f"📚 Eser kaydedildi: {eser_id} ({len(takma_adlar)} takma ad)")
+                return True
+                
+        except Exception as e:
+            logger.error(f"❌ Eser kayıt hatası: {e}", exc_info=True)
+            return False
+    
+    async def eser_bul(self, takma_adlar: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Takma adlardan ilk eşleşen eseri getir
+        
+        Args:
+            takma_adlar: Öncelik sırasıyla aranacak anahtarlar
+            
+        Returns:
+            Eser verisi ("eser_id" dahil) veya None
+        """
+        if not takma_adlar:
+            return None
+        
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                
+                for takma_ad in takma_adlar:
+                    cursor = await self.conn.execute(
+                        """
+                        SELECT e.eser_id, e.veri FROM eser_takma_adlari t
+                        JOIN eserler e ON e.eser_id = t.eser_id
+                        WHERE t.takma_ad = ?
+                        """,
+                        (takma_ad,)
+                    )
+                    sonuc = await cursor.fetchone()
+                    if sonuc:
+                        veri = json.loads(sonuc[1])
+                        veri["eser_id"] = sonuc[0]
+                        return veri
+                
+                return None
+                
+        except Exception as e:
+            logger.error(f"❌ Eser okuma hatası: {e}", exc_info=True)
+            return None
+    
+    # ==================== SERİ ÖNBELLEĞİ ====================
+    
+    async def seri_kaydet(
+        self,
+        seri_id: str,
+        seri_adi: str,
+        takma_adlar: List[str],
+        ciltler: List[Dict[str, Any]] = None,
+        liste_url: str = None,
+        liste_cekildi: bool = False
+    ) -> bool:
+        """
+        Seriyi, takma adlarını ve ciltlerini kaydet
+        
+        Args:
+            seri_id: Seri kimliği
+            seri_adi: Görünen seri adı
+            takma_adlar: Normalize edilmiş seri adları
+            ciltler: [{"cilt_no", "kaynak", "baslik", "link"}, ...]
+            liste_url: Seri listesinin adresi (ön getirme için)
+            liste_cekildi: True ise liste çekilme zamanı güncellenir
+            
+        Returns:
+            Başarılı ise True
+        """
+        if not seri_id:
+            return False
+        
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                
+                await self.conn.execute(
+                    """
+                    INSERT INTO seriler (seri_id, seri_adi, liste_url) VALUES (?, ?, ?)
+                    ON CONFLICT(seri_id) DO UPDATE SET
+                        liste_url = COALESCE(excluded.liste_url, liste_url)
+                    """,
+                    (seri_id, seri_adi, liste_url)
+                )
+                if liste_cekildi:
+                    await self.conn.execute(
+                        "UPDATE seriler SET liste_tarihi = ? WHERE seri_id = ?",
+                        (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), seri_id)
+                    )
+                await self.conn.executemany(
+                    "INSERT OR REPLACE INTO seri_takma_adlari (takma_ad, seri_id) VALUES (?, ?)",
+                    [(takma_ad, seri_id) for takma_ad in takma_adlar if takma_ad]
+                )
+                await self.conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO seri_ciltleri (seri_id, cilt_no, kaynak, baslik, link)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (seri_id, str(c["cilt_no"]), c["kaynak"], c.get("baslik"), c["link"])
+                        for c in (ciltler or []) if c.get("link")
+                    ]
+                )
+                
+                await self.conn.commit()
+                return True
+                
+        except Exception as e:
+            logger.error(f"❌ Seri kayıt hatası: {e}", exc_info=True)
+            return False
+    
+    async def seri_takma_adlari(self) -> Dict[str, str]:
+        """Tüm seri takma adları {takma_ad: seri_id}"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute("SELECT takma_ad, seri_id FROM seri_takma_adlari")
+                return {row[0]: row[1] for row in await cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"❌ Seri takma ad okuma hatası: {e}")
+            return {}
+    
+    async def seri_bilgisi(self, seri_id: str) -> Optional[Dict[str, Any]]:
+        """Seri satırı (seri_adi, liste_url, liste_tarihi)"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    "SELECT seri_adi, liste_url, liste_tarihi FROM seriler WHERE seri_id = ?",
+                    (seri_id,)
+                )
+                row = await cursor.fetchone()
+                if not row:
+                    return None
+                return {"seri_adi": row[0], "liste_url": row[1], "liste_tarihi": row[2]}
+        except Exception as e:
+            logger.error(f"❌ Seri okuma hatası: {e}")
+            return None
+    
+    async def seri_cildi(self, seri_id: str, cilt_no: str) -> List[Dict[str, Any]]:
+        """Serinin belirli cildi (kaynak başına bir satır)"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    "SELECT kaynak, baslik, link FROM seri_ciltleri WHERE seri_id = ? AND cilt_no = ?",
+                    (seri_id, str(cilt_no))
+                )
+                return [
+                    {"kaynak": row[0], "baslik": row[1], "link": row[2], "cilt_no": str(cilt_no)}
+                    for row in await cursor.fetchall()
+                ]
+        except Exception as e:
+            logger.error(f"❌ Seri cildi okuma hatası: {e}")
+            return []
+    
+    # ==================== YAZAR DİL DİZİNİ ====================
+    
+    async def yazar_dili_kaydet(self, yazar: str, yabanci: bool) -> bool:
+        """Yazarın yerli/çeviri eser sayacını artır"""
+        if not yazar:
+            return False
+        
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                alan = "yabanci" if yabanci else "yerli"
+                await self.conn.execute(
+                    f"""
+                    INSERT INTO yazar_dilleri (yazar, {alan}) VALUES (?, 1)
+                    ON CONFLICT(yazar) DO UPDATE SET {alan} = {alan} + 1
+                    """,
+                    (yazar,)
+                )
+                await self.conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"❌ Yazar dili kayıt hatası: {e}")
+            return False
+    
+    async def yazar_dilleri(self) -> Dict[str, Tuple[int, int]]:
+        """Tüm yazarlar {yazar: (yerli, yabanci)}"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute("SELECT yazar, yerli, yabanci FROM yazar_dilleri")
+                return {row[0]: (row[1], row[2]) for row in await cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"❌ Yazar dili okuma hatası: {e}")
+            return {}
+    
+    # ==================== STRATEJİ İSTATİSTİKLERİ ====================
+    
+    async def strateji_gozlemi_kaydet(
+        self,
+        desen: str,
+        strateji: str,
+        basarili: bool,
+        sure: float,
+        alfa: float = 0.2
+    ) -> bool:
+        """
+        Strateji denemesini işle (sayaçlar + üstel ortalama süre)
+        
+        Args:
+            desen: Dosya adı deseni
+            strateji: Strateji adı
+            basarili: Deneme kitabı buldu mu
+            sure: Denemenin süresi (saniye)
+            alfa: Ortalama süre için EWMA katsayısı
+        """
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                await self.conn.execute(
+                    """
+                    INSERT INTO strateji_istatistikleri (desen, strateji, deneme, basari, ort_sure)
+                    VALUES (?, ?, 1, ?, ?)
+                    ON CONFLICT(desen, strateji) DO UPDATE SET
+                        deneme = deneme + 1,
+                        basari = basari + excluded.basari,
+                        ort_sure = ort_sure * (1 - ?) + excluded.ort_sure * ?
+                    """,
+                    (desen, strateji, int(basarili), sure, alfa, alfa)
+                )
+                await self.conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"❌ Strateji istatistiği kayıt hatası: {e}")
+            return False
+    
+    async def strateji_istatistikleri(self) -> Dict[Tuple[str, str], Tuple[int, int, float]]:
+        """Tüm istatistikler {(desen, strateji): (deneme, basari, ort_sure)}"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    "SELECT desen, strateji, deneme, basari, ort_sure FROM strateji_istatistikleri"
+                )
+                return {
+                    (row[0], row[1]): (row[2], row[3], row[4])
+                    for row in await cursor.fetchall()
+                }
+        except Exception as e:
+            logger.error(f"❌ Strateji istatistiği okuma hatası: {e}")
+            return {}
+    
+    # ==================== MANUEL EŞLEŞMELER ====================
+    
+    async def manuel_eslesme_kaydet(self, anahtar: str, hedef_url: str, ekleyen: int = None) -> bool:
+        """Anahtarı (dosya:/isbn:) kaynak linkine sabitle"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                await self.conn.execute(
+                    """
+                    INSERT OR REPLACE INTO manuel_eslesmeler (anahtar, hedef_url, ekleyen, tarih)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (anahtar, hedef_url, ekleyen, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                )
+                await self.conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"❌ Manuel eşleşme kayıt hatası: {e}")
+            return False
+    
+    async def manuel_eslesme_sil(self, anahtar: str) -> bool:
+        """Sabitlemeyi kaldır (kayıt yoksa False)"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    "DELETE FROM manuel_eslesmeler WHERE anahtar = ?", (anahtar,)
+                )
+                await self.conn.commit()
+                return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"❌ Manuel eşleşme silme hatası: {e}")
+            return False
+    
+    async def manuel_eslesmeler(self) -> List[Dict[str, Any]]:
+        """Tüm sabitlemeler (en yeni önce)"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    "SELECT anahtar, hedef_url, ekleyen, tarih FROM manuel_eslesmeler "
+                    "ORDER BY tarih DESC"
+                )
+                return [
+                    {"anahtar": row[0], "hedef_url": row[1], "ekleyen": row[2], "tarih": row[3]}
+                    for row in await cursor.fetchall()
+                ]
+        except Exception as e:
+            logger.error(f"❌ Manuel eşleşme okuma hatası: {e}")
+            return []
+    
+    # ==================== KATALOG (FTS5) ====================
+    
+    async def katalog_kaydet(
+        self,
+        anahtar: str,
+        alanlar: Dict[str, str],
+        veri_dict: Dict[str, Any]
+    ) -> bool:
+        """
+        Kitabı kataloğa ekle / güncelle
+        
+        Args:
+            anahtar: Kitabın katalog anahtarı (kaynak linki vb.)
+            alanlar: FTS'e yazılacak katlanmış metinler
+                (baslik, yazar, orijinal_ad, seri, isbn)
+            veri_dict: Kitap kaydının tamamı
+        """
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    """
+                    INSERT INTO katalog (anahtar, veri, guncelleme_tarihi) VALUES (?, ?, ?)
+                    ON CONFLICT(anahtar) DO UPDATE SET
+                        veri = excluded.veri,
+                        guncelleme_tarihi = excluded.guncelleme_tarihi
+                    RETURNING id
+                    """,
+                    (
+                        anahtar,
+                        json.dumps(veri_dict, ensure_ascii=False),
+                        datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    )
+                )
+                katalog_id = (await cursor.fetchone())[0]
+                await self.conn.execute("DELETE FROM katalog_fts WHERE rowid = ?", (katalog_id,))
+                await self.conn.execute(
+                    """
+                    INSERT INTO katalog_fts (rowid, baslik, yazar, orijinal_ad, seri, isbn)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        katalog_id,
+                        alanlar.get("baslik", ""),
+                        alanlar.get("yazar", ""),
+                        alanlar.get("orijinal_ad", ""),
+                        alanlar.get("seri", ""),
+                        alanlar.get("isbn", ""),
+                    )
+                )
+                await self.conn.commit()
+                if alanlar.get("isbn"):
+                    katalog_snapshot.gecersiz_kil(f"isbn:{alanlar['isbn']}")
+                return True
+        except Exception as e:
+            logger.error(f"❌ Katalog kayıt hatası: {e}")
+            return False
+    
+    async def katalog_ara(self, fts_sorgusu: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        FTS5 eşleşmesi (bm25 sırasıyla)
+        
+        Args:
+            fts_sorgusu: FTS5 MATCH ifadesi
+            limit: Maksimum sonuç
+            
+        Returns:
+            Kitap kayıtları (``_katalog_anahtari`` alanıyla)
+        """
+        if not fts_sorgusu:
+            return []
+        
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    """
+                    SELECT k.anahtar, k.veri
+                    FROM katalog_fts
+                    JOIN katalog k ON k.id = katalog_fts.rowid
+                    WHERE katalog_fts MATCH ?
+                    ORDER BY bm25(katalog_fts, 5.0, 3.0, 4.0, 2.0, 10.0)
+                    LIMIT ?
+                    """,
+                    (fts_sorgusu, limit)
+                )
+                sonuclar = []
+                for anahtar, veri_json in await cursor.fetchall():
+                    veri = json.loads(veri_json)
+                    veri["_katalog_anahtari"] = anahtar
+                    sonuclar.append(veri)
+                return sonuclar
+        except Exception as e:
+            logger.error(f"❌ Katalog arama hatası: {e}")
+            return []
+    
+    async def katalog_sayisi(self) -> int:
+        """Katalogdaki kitap sayısı"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute("SELECT COUNT(*) FROM katalog")
+                return (await cursor.fetchone())[0]
+        except Exception as e:
+            logger.error(f"❌ Katalog sayım hatası: {e}")
+            return 0
+    
+    async def kayitli_veriler(self) -> List[Dict[str, Any]]:
+        """Cache tablosundaki tüm kitap kayıtları (katalog ilk doldurması için)"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute("SELECT veri FROM kitaplar")
+                return [json.loads(row[0]) for row in await cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"❌ Kayıt okuma hatası: {e}")
+            return []
+    
+    async def son_yazma_zamani(self) -> float:
+        """
+        Snapshot'a giren tablolara (cache, katalog, sabitlemeler) son yazma zamanı
+        
+        Returns:
+            Unix zamanı (kayıt yoksa 0)
+        """
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    """
+                    SELECT MAX(t) FROM (
+                        SELECT MAX(guncelleme_tarihi) AS t FROM kitaplar
+                        UNION ALL SELECT MAX(guncelleme_tarihi) FROM katalog
+                        UNION ALL SELECT MAX(tarih) FROM manuel_eslesmeler
+                    )
+                    """
+                )
+                son = (await cursor.fetchone())[0]
+                if not son:
+                    return 0.0
+                return datetime.strptime(son, '%Y-%m-%d %H:%M:%S').timestamp()
+        except Exception as e:
+            logger.error(f"❌ Son yazma zamanı okunamadı: {e}")
+            return 0.0
+    
+    async def snapshot_kayitlari(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Snapshot için (anahtar, kayıt) çiftleri
+        
+        Cache kayıtları kendi anahtarlarıyla (dosya:/link:), ISBN'i olan
+        katalog kayıtları ayrıca ``isbn:<rakamlar>`` anahtarıyla döner.
+        """
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute("SELECT anahtar, veri FROM kitaplar")
+                kayitlar = [(row[0], json.loads(row[1])) for row in await cursor.fetchall()]
+                
+                cursor = await self.conn.execute(
+                    """
+                    SELECT f.isbn, k.veri FROM katalog_fts f
+                    JOIN katalog k ON k.id = f.rowid
+                    WHERE f.isbn != ''
+                    """
+                )
+                kayitlar += [
+                    (f"isbn:{row[0]}", json.loads(row[1])) for row in await cursor.fetchall()
+                ]
+                return kayitlar
+        except Exception as e:
+            logger.error(f"❌ Snapshot kayıt okuma hatası: {e}")
+            return []
+    
+    # ==================== MESAJ ALTYAZI ÖZETLERİ ====================
+    
+    async def altyazi_ozeti_kaydet(
+        self,
+        kanal_id: int,
+        mesaj_id: int,
+        yazilan_ozet: str,
+        telegram_ozet: str
+    ) -> bool:
+        """
+        Mesaja yazılan altyazının özetini sakla
+        
+        Args:
+            yazilan_ozet: Bot'un ürettiği HTML'in özeti
+            telegram_ozet: Düzenleme sonrası Telegram'ın döndürdüğü metnin özeti
+        """
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                await self.conn.execute(
+                    """
+                    INSERT OR REPLACE INTO mesaj_altyazilari
+                        (kanal_id, mesaj_id, yazilan_ozet, telegram_ozet, tarih)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (kanal_id, mesaj_id, yazilan_ozet, telegram_ozet,
+                     datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                )
+                await self.conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"❌ Altyazı özeti kayıt hatası: {e}")
+            return False
+    
+    async def altyazi_ozeti(self, kanal_id: int, mesaj_id: int) -> Optional[Tuple[str, str]]:
+        """(yazilan_ozet, telegram_ozet) veya None"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    "SELECT yazilan_ozet, telegram_ozet FROM mesaj_altyazilari "
+                    "WHERE kanal_id = ? AND mesaj_id = ?",
+                    (kanal_id, mesaj_id)
+                )
+                row = await cursor.fetchone()
+                return (row[0], row[1]) if row else None
+        except Exception as e:
+            logger.error(f"❌ Altyazı özeti okuma hatası: {e}")
+            return None
+    
+    # ==================== TARAMA KONTROL NOKTALARI ====================
+    
+    async def tarama_noktasi_kaydet(
+        self,
+        kanal_id: int,
+        en_yuksek: Optional[int],
+        en_dusuk: Optional[int],
+        imlec: Optional[int],
+        tamamlandi: bool
+    ) -> bool:
+        """
+        Kanalın geçmiş tarama kontrol noktasını yaz
+        
+        Args:
+            en_yuksek: İşlenen en yeni mesaj id'si (canlı yetişme bundan sonrasını çeker)
+            en_dusuk: Geriye taramada işlenen en eski mesaj id'si
+            imlec: Geriye taramanın devam edeceği offset_id (tamamlandıysa None)
+            tamamlandi: Geriye tarama kanalın başına ulaştı mı
+        """
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                await self.conn.execute(
+                    """
+                    INSERT OR REPLACE INTO tarama_noktalari
+                        (kanal_id, en_yuksek, en_dusuk, imlec, tamamlandi, tarih)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (kanal_id, en_yuksek, en_dusuk, imlec, int(tamamlandi),
+                     datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                )
+                await self.conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"❌ Tarama noktası kayıt hatası: {e}")
+            return False
+    
+    async def tarama_noktasi(self, kanal_id: int) -> Optional[Dict[str, Any]]:
+        """Kanalın kontrol noktası (en_yuksek, en_dusuk, imlec, tamamlandi) veya None"""
+        try:
+            async with self.lock:
+                await self._ensure_connected()
+                cursor = await self.conn.execute(
+                    "SELECT en_yuksek, en_dusuk, imlec, tamamlandi FROM tarama_noktalari "
+                    "WHERE kanal_id = ?",
+                    (kanal_id,)
+                )
+                row = await cursor.fetchone()
+                if not row:
+                    return None
+                return {
+                    "en_yuksek": row[0],
+                    "en_dusuk": row[1],
+                    "imlec": row[2],
+                    "tamamlandi": bool(row[3]),
+                }
+        except Exception as e:
+            logger.error(f"❌ Tarama noktası okuma hatası: {e}")
+            return None
+    
     # ==================== YENİ KİTAP KAYIT SİSTEMİ ====================
     
     async def kitap_ekle(
@@ -370,47 +1223,32 @@ class DatabaseManager:
     
     async def kitap_ara(self, arama: str, limit: int = 20) -> List[Dict[str, Any]]:
         """
-        Kitap ara
+        Katalogda kitap ara (FTS5, Türkçe katlanmış, kelime önekiyle)
         
         Args:
-            arama: Arama terimi
+            arama: Arama terimi (başlık, yazar, orijinal ad, seri veya ISBN)
             limit: Maksimum sonuç sayısı
             
         Returns:
-            Sonuç listesi
+            Sonuç listesi (en alakalı önce)
         """
-        try:
-            async with self.lock:
-                await self._ensure_connected()
-                
-                cursor = await self.conn.execute(
-                    """
-                    SELECT dosya_adi, baslik, yazar, kaynak, link, created_at
-                    FROM kitap_kayitlari
-                    WHERE baslik LIKE ? OR yazar LIKE ? OR dosya_adi LIKE ?
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                    """,
-                    (f'%{arama}%', f'%{arama}%', f'%{arama}%', limit)
-                )
-                
-                rows = await cursor.fetchall()
-                
-                return [
-                    {
-                        'dosya_adi': row[0],
-                        'baslik': row[1],
-                        'yazar': row[2],
-                        'kaynak': row[3],
-                        'link': row[4],
-                        'created_at': row[5]
-                    }
-                    for row in rows
-                ]
-                
-        except Exception as e:
-            logger.error(f"❌ Kitap arama hatası: {e}", exc_info=True)
+        tokenler = normalize_et(arama).split()
+        if not tokenler:
             return []
+        
+        fts_sorgusu = " ".join(f'"{token}"*' for token in tokenler)
+        return [
+            {
+                'baslik': kayit.get('baslik'),
+                'yazar': kayit.get('yazar'),
+                'orijinal_ad': kayit.get('orijinal_ad'),
+                'seri': kayit.get('seri'),
+                'isbn': kayit.get('isbn'),
+                'kaynak': kayit.get('kaynak'),
+                'link': kayit.get('link'),
+            }
+            for kayit in await self.katalog_ara(fts_sorgusu, limit)
+        ]
     
     # ==================== İSTATİSTİKLER ====================
     
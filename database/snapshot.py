@@ -0,0 +1,278 @@
+"""
+Salt okunur katalog anlık görüntüsü (snapshot)
+Kayıt anahtarı → kitap kaydı; mmap ile açılır, açılışta Python nesnesine yüklenmez
+
+Kapsam: BookService.search_book / search_many'nin ağa çıkmadan önceki
+dosya: / isbn: araması (toplu arama, /ara, manuel mod). Canlı mesajlar kaydı
+zaten veritabanından (getir_swr) okur; snapshot orada kullanılmaz.
+Snapshot üretildikten sonra yazılan / silinen anahtarlar geçersiz sayılır
+ve bir sonraki üretime kadar veritabanına bırakılır.
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from config.settings import settings
+from utils.async_utils import run_sync
+
+logger = logging.getLogger(__name__)
+
+
+# Dosya biçimi (little-endian):
+#   başlık   : SIHIR, sürüm, oluşturma zamanı, sayılar ve bölüm ofsetleri
+#   dizgiler : [ofset u32, uzunluk u32] * n_dizgi  +  UTF-8 dizgi verisi
+#                (alan adları ve JSON kodlu alan değerleri bir kez yazılır)
+#   anahtarlar: [özet u64, anahtar dizgi no u32, kayıt ofseti u32] * n_anahtar
+#                (özete göre sıralı, ikili arama ile bulunur)
+#   kayıtlar : alan sayısı u16 + [alan adı no u32, değer no u32] * alan sayısı
+SIHIR = b"SEKS"
+SURUM = 1
+
+_BASLIK = struct.Struct("<4sHxxdIIIQQQQ")
+_DIZGI = struct.Struct("<II")
+_ANAHTAR = struct.Struct("<QII")
+_ALAN_SAYISI = struct.Struct("<H")
+_ALAN = struct.Struct("<II")
+
+
+def _ozet(anahtar: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(anahtar.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+def snapshot_yaz(kayitlar: Iterable[Tuple[str, Dict[str, Any]]], dosya: str) -> int:
+    """
+    Kayıtlardan snapshot dosyası üret (geçici dosyaya yazıp atomik olarak değiştirir)
+
+    Args:
+        kayitlar: (kayıt anahtarı, kitap kaydı) çiftleri
+        dosya: Hedef dosya yolu
+
+    Returns:
+        Yazılan anahtar sayısı
+    """
+    dizgi_nolari: Dict[str, int] = {}
+    dizgiler = []
+
+    def intern(metin: str) -> int:
+        no = dizgi_nolari.get(metin)
+        if no is None:
+            no = len(dizgiler)
+            dizgi_nolari[metin] = no
+            dizgiler.append(metin.encode("utf-8"))
+        return no
+
+    kayit_ofsetleri: Dict[Tuple[Tuple[int, int], ...], int] = {}
+    kayit_verisi = bytearray()
+    anahtarlar = []
+
+    for anahtar, veri in kayitlar:
+        if not anahtar or not veri:
+            continue
+        alanlar = tuple(
+            (intern(alan), intern(json.dumps(deger, ensure_ascii=False)))
+            for alan, deger in veri.items()
+            if deger is not None
+        )
+        # Aynı kaydı gösteren anahtarlar (dosya: / link: / isbn:) kaydı paylaşır
+        ofset = kayit_ofsetleri.get(alanlar)
+        if ofset is None:
+            ofset = len(kayit_verisi)
+            kayit_ofsetleri[alanlar] = ofset
+            kayit_verisi += _ALAN_SAYISI.pack(len(alanlar))
+            for alan in alanlar:
+                kayit_verisi += _ALAN.pack(*alan)
+        anahtarlar.append((_ozet(anahtar), intern(anahtar), ofset))
+
+    anahtarlar.sort()
+
+    dizgi_tablosu = bytearray()
+    dizgi_verisi = bytearray()
+    for ham in dizgiler:
+        dizgi_tablosu += _DIZGI.pack(len(dizgi_verisi), len(ham))
+        dizgi_verisi += ham
+
+    ofs_tablo = _BASLIK.size
+    ofs_veri = ofs_tablo + len(dizgi_tablosu)
+    ofs_anahtar = ofs_veri + len(dizgi_verisi)
+    ofs_kayit = ofs_anahtar + len(anahtarlar) * _ANAHTAR.size
+
+    hedef = Path(dosya)
+    hedef.parent.mkdir(parents=True, exist_ok=True)
+    gecici = hedef.with_suffix(hedef.suffix + ".tmp")
+    with open(gecici, "wb") as f:
+        f.write(_BASLIK.pack(
+            SIHIR, SURUM, time.time(),
+            len(dizgiler), len(anahtarlar), len(kayit_ofsetleri),
+            ofs_tablo, ofs_veri, ofs_anahtar, ofs_kayit,
+        ))
+        f.write(dizgi_tablosu)
+        f.write(dizgi_verisi)
+        for satir in anahtarlar:
+            f.write(_ANAHTAR.pack(*satir))
+        f.write(kayit_verisi)
+    os.replace(gecici, hedef)
+    return len(anahtarlar)
+
+
+class KatalogSnapshot:
+    """
+    mmap'lenmiş salt okunur snapshot
+
+    Açılışta yalnızca başlık okunur; arama anahtar bölümünde ikili arama
+    yapar ve sadece bulunan kaydın alanlarını çözer. Sayfalar işletim
+    sisteminin sayfa önbelleğinden gelir, bellek arşiv büyüdükçe artmaz.
+
+    Examples:
+        >>> katalog_snapshot.ac()
+        >>> katalog_snapshot.getir("dosya:dostoyevski suç ve ceza")
+    """
+
+    def __init__(self, dosya: str):
+        self.dosya = Path(dosya)
+        self._dosya_nesnesi = None
+        self._mm: Optional[mmap.mmap] = None
+        self._ozetler = None
+        # Snapshot'tan sonra yazılan / silinen anahtarlar → geçersiz kılınma zamanı
+        self._gecersiz: Dict[str, float] = {}
+        self.olusturma = 0.0
+        self.n_dizgi = self.n_anahtar = self.n_kayit = 0
+        self._ofs_tablo = self._ofs_veri = self._ofs_anahtar = self._ofs_kayit = 0
+
+    @property
+    def acik(self) -> bool:
+        return self._mm is not None
+
+    def __len__(self) -> int:
+        return self.n_anahtar if self.acik else 0
+
+    def ac(self) -> bool:
+        """
+        Snapshot dosyasını aç (yoksa / sürümü farklıysa False)
+
+        Açık bir snapshot varsa yenisiyle değiştirilir.
+        """
+        if not self.dosya.exists() or self.dosya.stat().st_size < _BASLIK.size:
+            return False
+
+        try:
+            dosya_nesnesi = open(self.dosya, "rb")
+            mm = mmap.mmap(dosya_nesnesi.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Snapshot açılamadı: {e}")
+            return False
+
+        (sihir, surum, olusturma, n_dizgi, n_anahtar, n_kayit,
+         ofs_tablo, ofs_veri, ofs_anahtar, ofs_kayit) = _BASLIK.unpack_from(mm, 0)
+        if sihir != SIHIR or surum != SURUM:
+            logger.warning(f"⚠️ Snapshot sürümü uyumsuz ({sihir!r} v{surum}), yok sayılıyor")
+            mm.close()
+            dosya_nesnesi.close()
+            return False
+
+        self.kapat()
+        self._dosya_nesnesi, self._mm = dosya_nesnesi, mm
+        self.olusturma = olusturma
+        self.n_dizgi, self.n_anahtar, self.n_kayit = n_dizgi, n_anahtar, n_kayit
+        self._ofs_tablo, self._ofs_veri = ofs_tablo, ofs_veri
+        self._ofs_anahtar, self._ofs_kayit = ofs_anahtar, ofs_kayit
+        # Özet sütunu mmap üzerinde görünüm; liste olarak kopyalanmaz
+        self._ozetler = _OzetSutunu(mm, ofs_anahtar, n_anahtar)
+        logger.info(f"🗂️ Snapshot açıldı: {n_anahtar} anahtar, {n_kayit} kayıt ({self.dosya})")
+        return True
+
+    def kapat(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._dosya_nesnesi.close()
+        self._mm = self._dosya_nesnesi = self._ozetler = None
+
+    def gecersiz_kil(self, *anahtarlar: str):
+        """Anahtarların snapshot'taki kaydı artık geçersiz (veritabanında değişti)"""
+        simdi = time.time()
+        for anahtar in anahtarlar:
+            if anahtar:
+                self._gecersiz[anahtar] = simdi
+
+    def gecersizleri_temizle(self, once: float):
+        """Yeni snapshot'a girmiş (``once`` zamanından önceki) geçersizlikleri unut"""
+        self._gecersiz = {a: t for a, t in self._gecersiz.items() if t >= once}
+
+    def _dizgi(self, no: int) -> str:
+        ofset, uzunluk = _DIZGI.unpack_from(self._mm, self._ofs_tablo + no * _DIZGI.size)
+        bas = self._ofs_veri + ofset
+        return self._mm[bas:bas + uzunluk].decode("utf-8")
+
+    def _kayit(self, ofset: int) -> Dict[str, Any]:
+        konum = self._ofs_kayit + ofset
+        (alan_sayisi,) = _ALAN_SAYISI.unpack_from(self._mm, konum)
+        konum += _ALAN_SAYISI.size
+        kayit = {}
+        for _ in range(alan_sayisi):
+            alan_no, deger_no = _ALAN.unpack_from(self._mm, konum)
+            konum += _ALAN.size
+            kayit[self._dizgi(alan_no)] = json.loads(self._dizgi(deger_no))
+        return kayit
+
+    def getir(self, anahtar: str) -> Optional[Dict[str, Any]]:
+        """Anahtarın kaydı (yoksa / geçersizse / snapshot kapalıysa None)"""
+        if self._mm is None or not anahtar or anahtar in self._gecersiz:
+            return None
+
+        ozet = _ozet(anahtar)
+        i = bisect_left(self._ozetler, ozet)
+        while i < self.n_anahtar:
+            satir_ozeti, anahtar_no, ofset = _ANAHTAR.unpack_from(
+                self._mm, self._ofs_anahtar + i * _ANAHTAR.size
+            )
+            if satir_ozeti != ozet:
+                break
+            if self._dizgi(anahtar_no) == anahtar:
+                return self._kayit(ofset)
+            i += 1
+        return None
+
+
+class _OzetSutunu:
+    """Anahtar bölümündeki özetlere bisect için dizi arayüzü"""
+
+    def __init__(self, mm: mmap.mmap, ofset: int, uzunluk: int):
+        self._mm = mm
+        self._ofset = ofset
+        self._uzunluk = uzunluk
+
+    def __len__(self) -> int:
+        return self._uzunluk
+
+    def __getitem__(self, i: int) -> int:
+        return struct.unpack_from("<Q", self._mm, self._ofset + i * _ANAHTAR.size)[0]
+
+
+# Global instance
+katalog_snapshot = KatalogSnapshot(settings.SNAPSHOT_DOSYASI)
+
+
+async def snapshot_yenile() -> int:
+    """
+    Veritabanındaki kayıtlardan snapshot'ı yeniden üret ve aç
+
+    Returns:
+        Yazılan anahtar sayısı
+    """
+    from database.db_manager import db
+
+    # Okumadan sonra yazılan anahtarlar yeni snapshot'ta da geçersiz kalır
+    baslangic = time.time()
+    kayitlar = await db.snapshot_kayitlari()
+    sayi = await run_sync(snapshot_yaz, kayitlar, str(katalog_snapshot.dosya))
+    if katalog_snapshot.ac():
+        katalog_snapshot.gecersizleri_temizle(baslangic)
+    return sayi
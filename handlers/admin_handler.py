@@ -9,6 +9,7 @@ from utils.decorators import log_handler
 from utils.statistics import bot_stats
 from config.settings import settings
 from database.db_manager import db
+from utils.telegram_scheduler import tg_zamanlayici
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,11 @@ logger = logging.getLogger(__name__)
 class AdminHandler:
     """Admin komut işleyici"""
     
+    @staticmethod
+    async def _yanitla(event, *args, **kwargs):
+        """Komuta hız sınırı altında yanıt ver (FloodWait zamanlayıcıda)"""
+        return await tg_zamanlayici.cagir(event.chat_id, event.reply, *args, **kwargs)
+    
     @staticmethod
     async def admin_help(event, client):
         """Admin yardım menüsü"""
@@ -29,12 +35,18 @@ class AdminHandler:
         msg += "• `/ping` - Bağlantı testi ve gecikme ölçümü\n\n"
         msg += "**Veritabanı:**\n"
         msg += "• `/dbbilgi` - Veritabanı istatistikleri\n"
-        msg += "• `/sonkayitlar` - Son eklenen 5 kitap\n\n"
+        msg += "• `/sonkayitlar` - Son eklenen 5 kitap\n"
+        msg += "• `/ara <terim>` - Çözülmüş kitap kataloğunda ara\n\n"
+        msg += "**Eşleşme Düzeltme:**\n"
+        msg += "• `/sabitle <dosya adı veya ISBN> | <link>` - Dosyayı kaynağa sabitle\n"
+        msg += "  (dosya mesajına yanıt olarak: `/sabitle <link>`)\n"
+        msg += "• `/sabitkaldir <dosya adı veya ISBN>` - Sabitlemeyi kaldır\n"
+        msg += "• `/sabitler` - Sabitlenmiş eşleşmeler\n\n"
         msg += "**Bakım:**\n"
         msg += "• `/logtemizle` - Log dosyasını temizle\n\n"
         msg += f"📌 **Versiyon:** {settings.SURUM}"
         
-        await event.reply(msg)
+        await AdminHandler._yanitla(event, msg)
     
     @staticmethod
     async def durum(event, client):
@@ -43,7 +55,11 @@ class AdminHandler:
             return
         
         from handlers.message_handler import MessageHandler
+        from handlers.pipeline import mesaj_hatti
+        from utils.expiry import sureli_durumlari
         stats = MessageHandler.stats
+        hat = mesaj_hatti.durum()
+        tg = tg_zamanlayici.durum()
         
         # Süre hesaplama
         uptime = datetime.now() - stats["son_islem_zamani"]
@@ -60,28 +76,44 @@ class AdminHandler:
         msg += f"• Toplam Taranan: {stats['toplam_taranan']}\n"
         msg += f"• Bulunan: {stats['bulunan']} ✅\n"
         msg += f"• Bulunamayan: {stats['bulunamayan']} ❌\n"
-        msg += f"• Başarı Oranı: {basari_orani:.1f}%\n\n"
+        msg += f"• Başarı Oranı: {basari_orani:.1f}%\n"
+        msg += f"• Zaman Bütçesi Aşımı: {bot_stats.get('zaman_butcesi_asimi', 0)} ⏱️\n\n"
         msg += f"🔄 **Durum:**\n"
         msg += f"• Mod: {stats['islem_tipi']}\n"
         msg += f"• Son İşlem: {sure_str}\n"
         msg += f"• Şu An: {stats['su_an_islenen'][:50]}...\n\n"
+        msg += f"🏭 **Mesaj Hattı:**\n"
+        msg += f"• Giriş Kuyruğu: {hat['giris']}/{mesaj_hatti.kuyruk_boyutu}\n"
+        msg += f"• Aramada: {hat['aramada']}/{mesaj_hatti.arama_isci}\n"
+        msg += f"• Sıra Bekleyen: {hat['sirada']}\n"
+        msg += f"• Düzenleme Kuyruğu: {hat['duzenleme']}\n"
+        msg += f"• Kayıt Kuyruğu: {hat['kayit']}\n"
+        msg += f"• Telegram Hızı: {tg['genel_hiz']:.2f}/{tg['genel_tavan']:.2f} istek/sn "
+        msg += f"(en yavaş kanal {tg['en_yavas_kanal']:.2f})\n"
+        msg += f"• Jeton Bekleyen: {tg['bekleyen']} | FloodWait: {bot_stats.get('rate_limit_sayisi', 0)}\n"
+        onbellek = MessageHandler._cache.durum()
+        msg += f"• Mesaj Önbelleği: {onbellek['oge']} kayıt, {onbellek['bayt'] / 1024:.0f} KB, "
+        msg += f"isabet {onbellek['isabet_orani']:.0%} (çıkarılan {onbellek['cikarilan']})\n"
+        kisa_omurlu = [f"{d['ad']} {d['canli']}" for d in sureli_durumlari()]
+        kisa_omurlu += [f"Sessizlikte {hat['sessizlikte']}", f"Süren Arama {hat['ucusta']}"]
+        msg += f"• Kısa Ömürlü Kayıtlar: {' · '.join(kisa_omurlu)}\n\n"
         msg += f"⚙️ **Konfigürasyon:**\n"
         msg += f"• Kanal Sayısı: {len(settings.HEDEF_KANALLAR)}\n"
         msg += f"• Cache TTL: {settings.CACHE_TTL} saat\n"
         msg += f"• Versiyon: {settings.SURUM}"
         
-        await event.reply(msg)
+        await AdminHandler._yanitla(event, msg)
     
     @staticmethod
     async def ping(event, client):
         """Ping testi"""
         start = datetime.now()
-        msg = await event.reply("🏓 Pong!")
+        msg = await AdminHandler._yanitla(event, "🏓 Pong!")
         
         # Gecikmeyi hesapla
         delta = (datetime.now() - start).total_seconds() * 1000
         
-        await msg.edit(f"🏓 Pong!\n⏱ Gecikme: {delta:.1f}ms")
+        await tg_zamanlayici.cagir(event.chat_id, msg.edit, f"🏓 Pong!\n⏱ Gecikme: {delta:.1f}ms")
     
     @staticmethod
     async def dbbilgi(event, client):
@@ -90,7 +122,7 @@ class AdminHandler:
             return
         
         bilgi = db.istatistikler()
-        await event.reply(bilgi)
+        await AdminHandler._yanitla(event, bilgi)
     
     @staticmethod
     async def sonkayitlar(event, client):
@@ -99,7 +131,135 @@ class AdminHandler:
             return
         
         kayitlar = db.son_kayitlar(limit=5)
-        await event.reply(kayitlar)
+        await AdminHandler._yanitla(event, kayitlar)
+    
+    @staticmethod
+    async def ara(event, client):
+        """Yerel katalogda tam metin arama"""
+        if settings.ADMIN_ID and event.sender_id != settings.ADMIN_ID:
+            return
+        
+        terim = event.raw_text.partition(' ')[2].strip()
+        if not terim:
+            await AdminHandler._yanitla(event, "ℹ️ Kullanım: `/ara <başlık, yazar, seri veya ISBN>`")
+            return
+        
+        start = datetime.now()
+        sonuclar = await db.kitap_ara(terim, limit=10)
+        sure_ms = (datetime.now() - start).total_seconds() * 1000
+        
+        if not sonuclar:
+            await AdminHandler._yanitla(event, f"🔍 Katalogda bulunamadı: `{terim}` ({sure_ms:.1f}ms)")
+            return
+        
+        msg = f"🔍 **Katalog:** `{terim}` — {len(sonuclar)} sonuç ({sure_ms:.1f}ms)\n\n"
+        for kitap in sonuclar:
+            msg += f"• **{kitap['baslik']}**"
+            if kitap.get('yazar'):
+                msg += f" — {kitap['yazar']}"
+            if kitap.get('link'):
+                msg += f"\n  {kitap.get('kaynak') or 'Link'}: {kitap['link']}"
+            msg += "\n"
+        await AdminHandler._yanitla(event, msg, link_preview=False)
+    
+    @staticmethod
+    async def _yanitlanan_dosya(event):
+        """Komutun yanıtladığı dosya mesajı (yanıt değilse / dosya yoksa None)"""
+        if not event.is_reply:
+            return None
+        yanitlanan = await tg_zamanlayici.cagir(event.chat_id, event.get_reply_message)
+        if yanitlanan and yanitlanan.file and yanitlanan.file.name:
+            return yanitlanan
+        return None
+    
+    @staticmethod
+    async def _hedef_girdisi(event, arguman: str) -> str:
+        """Komut argümanı yoksa yanıtlanan mesajın dosya adı"""
+        if arguman:
+            return arguman
+        yanitlanan = await AdminHandler._yanitlanan_dosya(event)
+        return yanitlanan.file.name if yanitlanan else ""
+    
+    @staticmethod
+    async def sabitle(event, client):
+        """Dosya adı / ISBN → kaynak linki sabitle"""
+        if settings.ADMIN_ID and event.sender_id != settings.ADMIN_ID:
+            return
+        
+        from services.book_service import book_service
+        from services.manual_overrides import manuel_eslesmeler
+        
+        arguman = event.raw_text.partition(' ')[2].strip()
+        if '|' in arguman:
+            girdi, _, link = (p.strip() for p in arguman.rpartition('|'))
+        else:
+            girdi, link = "", arguman
+        # Yanıtlanan mesaj bir kez alınır: girdi ve kayıt silme ikisi de kullanır
+        yanitlanan = await AdminHandler._yanitlanan_dosya(event)
+        if not girdi and yanitlanan:
+            girdi = yanitlanan.file.name
+        
+        if not girdi or not book_service._link_kaynagi(link):
+            await AdminHandler._yanitla(
+                event,
+                "ℹ️ Kullanım: `/sabitle <dosya adı veya ISBN> | <link>`\n"
+                "veya dosya mesajına yanıt olarak `/sabitle <link>`\n"
+                "Link Kitapyurdu, Goodreads veya 1000Kitap olmalı."
+            )
+            return
+        
+        # Yanıtlanan dosyanın kaydı ve sonuç önbelleği de sabitlemeye bırakılır
+        dosya_adi = None
+        if yanitlanan:
+            from handlers.message_handler import MessageHandler
+            dosya_adi = yanitlanan.file.name
+            MessageHandler._clear_cache_for_message(yanitlanan)
+        
+        anahtar = await manuel_eslesmeler.sabitle(girdi, link, event.sender_id, dosya_adi)
+        if anahtar:
+            logger.info(f"📌 Sabitlendi: {anahtar} → {link}")
+            await AdminHandler._yanitla(event, f"📌 Sabitlendi:\n`{anahtar}`\n→ {link}")
+        else:
+            await AdminHandler._yanitla(event, "❌ Sabitleme kaydedilemedi")
+    
+    @staticmethod
+    async def sabitkaldir(event, client):
+        """Sabitlemeyi kaldır"""
+        if settings.ADMIN_ID and event.sender_id != settings.ADMIN_ID:
+            return
+        
+        from services.manual_overrides import manuel_eslesmeler
+        
+        girdi = await AdminHandler._hedef_girdisi(event, event.raw_text.partition(' ')[2].strip())
+        if not girdi:
+            await AdminHandler._yanitla(event, "ℹ️ Kullanım: `/sabitkaldir <dosya adı veya ISBN>`")
+            return
+        
+        anahtar = await manuel_eslesmeler.kaldir(girdi)
+        if anahtar:
+            await AdminHandler._yanitla(event, f"🗑 Sabitleme kaldırıldı: `{anahtar}`")
+        else:
+            await AdminHandler._yanitla(event, "ℹ️ Bu dosya / ISBN için sabitleme yok")
+    
+    @staticmethod
+    async def sabitler(event, client):
+        """Sabitlenmiş eşleşmeleri listele"""
+        if settings.ADMIN_ID and event.sender_id != settings.ADMIN_ID:
+            return
+        
+        from services.manual_overrides import manuel_eslesmeler
+        
+        kayitlar = await manuel_eslesmeler.liste()
+        if not kayitlar:
+            await AdminHandler._yanitla(event, "ℹ️ Sabitlenmiş eşleşme yok")
+            return
+        
+        msg = f"📌 **Sabitlenmiş Eşleşmeler** ({len(kayitlar)})\n\n"
+        for kayit in kayitlar[:30]:
+            msg += f"• `{kayit['anahtar']}`\n  → {kayit['hedef_url']}\n"
+        if len(kayitlar) > 30:
+            msg += f"\n… ve {len(kayitlar) - 30} tane daha"
+        await AdminHandler._yanitla(event, msg, link_preview=False)
     
     @staticmethod
     async def logtemizle(event, client):
@@ -117,12 +277,12 @@ class AdminHandler:
                     temizlenen.append(log_file)
             
             if temizlenen:
-                await event.reply(f"✅ Log dosyaları temizlendi:\n• " + "\n• ".join(temizlenen))
+                await AdminHandler._yanitla(event, f"✅ Log dosyaları temizlendi:\n• " + "\n• ".join(temizlenen))
             else:
-                await event.reply("ℹ️ Temizlenecek log dosyası bulunamadı")
+                await AdminHandler._yanitla(event, "ℹ️ Temizlenecek log dosyası bulunamadı")
         
         except Exception as e:
-            await event.reply(f"❌ Hata: {e}")
+            await AdminHandler._yanitla(event, f"❌ Hata: {e}")
             
     @log_handler
     async def stats_command(update, context):
@@ -4,12 +4,16 @@ Kitap bilgilerini çeker ve mesajları günceller
 """
 
 import asyncio
+import copy
+import hashlib
 import html
+import json
 import logging
 import re
 import time
 from datetime import datetime
 from typing import Optional, Tuple, Dict, Any
+from telethon.extensions import html as tl_html
 from telethon.errors import (
     MessageNotModifiedError, 
     FloodWaitError,
@@ -20,8 +24,14 @@ from telethon.errors import (
 
 from services.book_service import book_service
 from database.db_manager import db
-from utils.text_utils import durum_belirle, temizle_dosya_adi
+from utils.text_utils import durum_belirle, temizle_dosya_adi, metni_temizle
 from utils.statistics import bot_stats
+from utils.cache import LRUOnbellek
+from utils.deadline import zaman_butcesi
+from utils.expiry import SureliSozluk
+from utils.message_verifier import mesaj_dogrulayici
+from utils.telegram_scheduler import tg_zamanlayici
+from services.freshness import bayat_alanlar
 from config.settings import settings, ACIKLAMA_MAX_LENGTH, ACIKLAMA_KISALTMA_LENGTH
 
 logger = logging.getLogger(__name__)
@@ -41,13 +51,29 @@ class MessageHandler:
         "son_islem_zamani": datetime.now()
     }
     
-    # Cache (son işlenen mesajlar)
-    _cache = {}
-    _cache_max_size = 100
+    # Cache (son işlenen mesajlar): (kanal_id, mesaj_id) → kitap bilgisi
+    _cache = LRUOnbellek(
+        max_oge=settings.SONUC_ONBELLEK_BOYUTU,
+        max_bayt=int(settings.SONUC_ONBELLEK_MB * 1024 * 1024),
+        ttl=3600,  # 1 saat
+        ad="Mesaj önbelleği"
+    )
+    
+    # Arka planda yenilenen kayıtlar (aynı kayıt için tek yenileme)
+    _yenilemeler: Dict[str, asyncio.Task] = {}
+    
+    # Başarısız yenilemelerin geri çekilmesi: {kayit_anahtari: (hata_sayisi, sonraki_deneme)}
+    _yenileme_taban = 60  # saniye, her hatada ikiye katlanır
+    _yenileme_tavan = 3600  # saniye
+    _yenileme_hatalari = SureliSozluk(ttl=2 * _yenileme_tavan, ad="Yenileme geri çekilme")
     
     # Elle düzenlenen mesajlar (bot tarafından yeniden yazılmayacak)
-    _manual_edits = {}  # {message_id: last_edit_time}
     _manual_edit_cooldown = 300  # 5 dakika
+    _manual_edits = SureliSozluk(ttl=_manual_edit_cooldown, ad="Elle düzenleme")  # {message_id: last_edit_time}
+    
+    # Bot'un kendi yazdığı altyazılar (MessageEdited yankısını tanımak için)
+    _yanki_suresi = 120  # saniye
+    _kendi_duzenlemeler = SureliSozluk(ttl=_yanki_suresi, ad="Düzenleme yankısı")  # {(kanal_id, mesaj_id): {altyazı özetleri}}
     
     @staticmethod
     def _extract_url(text: str) -> Optional[str]:
@@ -101,18 +127,8 @@ class MessageHandler:
         Returns:
             True eğer yakın zamanda elle düzenlenmişse
         """
-        if message_id not in cls._manual_edits:
-            return False
-        
-        last_edit = cls._manual_edits[message_id]
-        elapsed = time.time() - last_edit
-        
-        # Cooldown süresi geçmişse forget et
-        if elapsed > cls._manual_edit_cooldown:
-            del cls._manual_edits[message_id]
-            return False
-        
-        return True
+        # Cooldown süresi geçen kayıt SureliSozluk'ten kendiliğinden düşer
+        return message_id in cls._manual_edits
     
     @classmethod
     def _mark_manual_edit(cls, message_id: int):
@@ -122,9 +138,31 @@ class MessageHandler:
         Args:
             message_id: Mesaj ID'si
         """
-        cls._manual_edits[message_id] = time.time()
+        cls._manual_edits.koy(message_id, time.time())
         logger.info(f"📝 Mesaj elle düzenlendi olarak işaretlendi: {message_id}")
     
+    @classmethod
+    def _kendi_duzenlemesi_kaydet(cls, message, *ozetler: str):
+        """Mesaja yazdığımız altyazının özet(ler)ini yankı süresince hatırla"""
+        anahtar = (message.chat_id, message.id)
+        kume = set(cls._kendi_duzenlemeler.al(anahtar, ()))
+        kume.update(ozetler)
+        cls._kendi_duzenlemeler.koy(anahtar, kume)
+    
+    @classmethod
+    def kendi_duzenlemesi_mi(cls, message) -> bool:
+        """
+        MessageEdited olayı bot'un kendi düzenlemesinin yankısı mı
+        
+        Önce (kanal, mesaj) anahtarına bakılır; kayıt yoksa metin hiç
+        işlenmez. Metin bizim yazdığımızdan farklıysa (kullanıcı sonradan
+        düzenlediyse) yankı sayılmaz.
+        """
+        ozetler = cls._kendi_duzenlemeler.al((message.chat_id, message.id))
+        if ozetler is None:
+            return False
+        return cls._altyazi_ozeti(message.message, message.entities) in ozetler
+    
     @classmethod
     def _should_skip_message(
         cls, 
@@ -174,67 +212,61 @@ class MessageHandler:
         bot_stats.increment("toplam_mesaj_islendi")
     
     @classmethod
-    def _update_cache(cls, message_id: int, data: dict):
+    def _update_cache(cls, message, data: dict):
         """Cache'i güncelle"""
-        # Cache boyutu kontrolü
-        if len(cls._cache) >= cls._cache_max_size:
-            # En eski 10 kaydı sil
-            oldest_keys = list(cls._cache.keys())[:10]
-            for key in oldest_keys:
-                del cls._cache[key]
-        
-        cls._cache[message_id] = {
-            'data': data,
-            'timestamp': datetime.now()
-        }
+        cls._cache.koy((message.chat_id, message.id), data)
     
     @classmethod
-    def _get_from_cache(cls, message_id: int) -> Optional[dict]:
+    def _get_from_cache(cls, message) -> Optional[dict]:
         """Cache'den veri al"""
-        cached = cls._cache.get(message_id)
-        if cached:
-            # 1 saatten eski cache'i sil
-            age = (datetime.now() - cached['timestamp']).total_seconds()
-            if age < 3600:  # 1 saat
-                return cached['data']
-            else:
-                del cls._cache[message_id]
-        return None
+        return cls._cache.al((message.chat_id, message.id))
     
     @classmethod
-    def _clear_cache_for_message(cls, message_id: int):
+    def _clear_cache_for_message(cls, message):
         """Belirli bir mesajın cache'ini temizle"""
-        if message_id in cls._cache:
-            del cls._cache[message_id]
-            logger.info(f"🗑️ Cache temizlendi: {message_id}")
+        if cls._cache.sil((message.chat_id, message.id)):
+            logger.info(f"🗑️ Cache temizlendi: {message.id}")
+    
+    @classmethod
+    def onbellegi_yukle(cls):
+        """Önceki çalışmadan kalan mesaj önbelleğini yükle (ayar boşsa kalıcı değil)"""
+        if settings.SONUC_ONBELLEK_DOSYASI:
+            sayi = cls._cache.diskten_yukle(settings.SONUC_ONBELLEK_DOSYASI)
+            if sayi:
+                logger.info(f"💾 Mesaj önbelleği yüklendi: {sayi} kayıt")
     
     @classmethod
-    async def _verify_message_exists(cls, message) -> bool:
+    def onbellegi_kaydet(cls):
+        """Mesaj önbelleğini diske yaz (ayar boşsa bir şey yapmaz)"""
+        if settings.SONUC_ONBELLEK_DOSYASI:
+            try:
+                sayi = cls._cache.diske_yaz(settings.SONUC_ONBELLEK_DOSYASI)
+                logger.info(f"💾 Mesaj önbelleği kaydedildi: {sayi} kayıt")
+            except OSError as e:
+                logger.error(f"❌ Mesaj önbelleği kaydedilemedi: {e}")
+    
+    @classmethod
+    async def _verify_message_exists(cls, message, taze: bool = False) -> bool:
         """
         Mesajın hala var olup olmadığını kontrol et
         
+        Aynı kanaldaki eşzamanlı doğrulamalar tek get_messages isteğinde
+        birleştirilir, sonuç kısa süre önbellekte tutulur.
+        
         Args:
             message: Telethon mesaj objesi
+            taze: Önbelleği atlayıp Telegram'a sor
             
         Returns:
             True eğer mesaj varsa, False yoksa
         """
-        try:
-            fresh_message = await message.client.get_messages(
-                message.peer_id,
-                ids=message.id
-            )
-            if fresh_message:
-                logger.debug(f"✅ Mesaj doğrulandı: {message.id}")
-                return True
-            else:
-                logger.warning(f"⚠️ Mesaj bulunamadı (ID: {message.id})")
-                bot_stats.increment("mesaj_silinmis")
-                return False
-                
-        except Exception as e:
-            logger.error(f"❌ Mesaj doğrulama hatası: {e}")
+        if await mesaj_dogrulayici.dogrula(message, taze=taze):
+            logger.debug(f"✅ Mesaj doğrulandı: {message.id}")
             return True
+        
+        logger.warning(f"⚠️ Mesaj bulunamadı (ID: {message.id})")
+        bot_stats.increment("mesaj_silinmis")
+        return False
     
     @classmethod
     async def process_message(
@@ -246,83 +278,249 @@ class MessageHandler:
         """
         Mesajı işle ve kitap bilgilerini ekle
         
+        Aşamaları (arama → düzenleme → kayıt) sırayla çalıştırır; canlı mod
+        ve geçmiş tarama aynı aşamaları handlers.pipeline üzerinden eşzamanlı
+        çalıştırır.
+        
         Args:
             message: Telethon mesaj objesi
             zorla_guncelle: Zaten işlenmiş mesajları da güncelle
             sadece_dosya_adi: Sadece dosya adından ara (link'i ignore et)
         """
-        start_time = time.time()
-        
         try:
-            # Mesaj metnini al
-            text = message.raw_text or ""
-            
-            # Atlanacak mı kontrol et
-            should_skip, skip_reason = cls._should_skip_message(
-                message, text, zorla_guncelle
-            )
-            if should_skip:
-                logger.debug(f"⏩ Atlandı: {skip_reason}")
+            is_ = await cls.bilgi_hazirla(message, zorla_guncelle, sadece_dosya_adi)
+            if is_ is None:
                 return
             
-            # İstatistikleri güncelle
-            cls._update_stats(message.file.name, message.chat_id)
+            await cls.mesaji_duzenle(is_)
+            await cls.kaydi_yaz(is_)
             
-            logger.info(f"📄 İşleniyor: {message.file.name}")
+        except FloodWaitError as e:
+            # Zamanlayıcı beklemeyi / yeniden denemeyi zaten yaptı
+            logger.error(f"❌ Rate limit ({e.seconds}s), mesaj bırakıldı: {message.id}")
+            bot_stats.increment("islem_hatalari")
             
-            # Cache kontrolü (zorla güncelleme değilse)
-            cached_data = cls._get_from_cache(message.id) if not zorla_guncelle else None
-            if cached_data:
-                logger.info("💾 Cache'den yüklendi")
-                bilgi = cached_data
+        except Exception as e:
+            logger.error(f"❌ İşleme hatası: {e}", exc_info=True)
+            bot_stats.increment("islem_hatalari")
+            cls.stats["su_an_islenen"] = "Hata!"
+    
+    @classmethod
+    async def bilgi_hazirla(
+        cls,
+        message,
+        zorla_guncelle: bool = False,
+        sadece_dosya_adi: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Arama aşaması: atlama kontrolü, önbellek / kayıt, gerekirse kaynak araması
+        
+        Telegram'a çağrı yapmaz; eşzamanlı çalıştırılabilir.
+        
+        Returns:
+            Düzenleme ve kayıt aşamalarının kullandığı iş sözlüğü
+            (mesaj atlanırsa None)
+        """
+        baslangic = time.time()
+        
+        # Mesaj metnini al
+        text = message.raw_text or ""
+        
+        # Atlanacak mı kontrol et
+        should_skip, skip_reason = cls._should_skip_message(
+            message, text, zorla_guncelle
+        )
+        if should_skip:
+            logger.debug(f"⏩ Atlandı: {skip_reason}")
+            return None
+        
+        # İstatistikleri güncelle
+        cls._update_stats(message.file.name, message.chat_id)
+        
+        logger.info(f"📄 İşleniyor: {message.file.name}")
+        
+        # Cache kontrolü (zorla güncelleme değilse)
+        arka_plan_yenile = False
+        kayit_anahtari = cls._kayit_anahtari(message, text, sadece_dosya_adi)
+        cached_data = cls._get_from_cache(message) if not zorla_guncelle else None
+        if cached_data:
+            logger.info("💾 Cache'den yüklendi")
+            bilgi = cached_data
+            kaynak = bilgi.get("kaynak", "Cache")
+            basarili = True
+        else:
+            kayitli, kayit_bayat = await db.getir_swr(kayit_anahtari)
+            
+            if kayitli:
+                # Kayıtlı kitap hemen kullanılır (stale-while-revalidate);
+                # bayat alan varsa düzenlemeden sonra arka planda yenilenir
+                bilgi = kayitli
                 kaynak = bilgi.get("kaynak", "Cache")
                 basarili = True
-            else:
-                # Kitap bilgilerini ara
-                bilgi, kaynak, basarili = await cls._search_book_info(
-                    message, text, sadece_dosya_adi
+                arka_plan_yenile = kayit_bayat or bool(bayat_alanlar(bilgi, sadece_damgali=True))
+                logger.info(
+                    f"🗄️ Kayıttan yüklendi ({kayit_anahtari})"
+                    + (", arka planda yenilenecek" if arka_plan_yenile else "")
                 )
-                
-                # Cache'e ekle
-                if basarili and bilgi:
-                    bilgi["kaynak"] = kaynak
-                    cls._update_cache(message.id, bilgi)
-            
-            # İstatistikleri güncelle
-            if basarili:
-                cls.stats["bulunan"] += 1
-                bot_stats.increment("basarili_kitap_bulma")
             else:
-                cls.stats["bulunamayan"] += 1
-                bot_stats.increment("basarisiz_kitap_bulma")
+                # Kitap bilgilerini ara (mesaj başına zaman bütçesi altında;
+                # bütçe dolunca kalan adımlar atlanır, eldeki veriyle düzenlenir)
+                with zaman_butcesi(settings.MESAJ_ZAMAN_BUTCESI, message.file.name) as butce:
+                    bilgi, kaynak, basarili = await cls._search_book_info(
+                        message, text, sadece_dosya_adi
+                    )
+                if butce.asildi:
+                    logger.info(f"⏱️ Bütçe aşıldı, atlanan: {', '.join(butce.atlanan_asamalar[:3])}")
+                if basarili and bilgi:
+                    await db.kaydet(kayit_anahtari, bilgi)
             
+            # Cache'e ekle
+            if basarili and bilgi:
+                bilgi["kaynak"] = kaynak
+                cls._update_cache(message, bilgi)
+        
+        # İstatistikleri güncelle
+        if basarili:
+            cls.stats["bulunan"] += 1
+            bot_stats.increment("basarili_kitap_bulma")
+        else:
+            cls.stats["bulunamayan"] += 1
+            bot_stats.increment("basarisiz_kitap_bulma")
+        
+        # Altyazı burada karşılaştırılır: aynıysa hat ne varlık doğrulaması
+        # ne düzenleme için Telegram'a gider
+        dosya_turu = "PDF" if message.file.name.lower().endswith('.pdf') else "EPUB"
+        durum = durum_belirle(message.file.name)
+        altyazi_ozeti = cls._altyazi_ozeti(
+            *tl_html.parse(cls._build_message_text(bilgi, kaynak, dosya_turu, durum))
+        )
+        
+        return {
+            "message": message,
+            "bilgi": bilgi,
+            "kaynak": kaynak,
+            "basarili": basarili,
             # Dosya bilgileri
-            dosya_turu = "PDF" if message.file.name.lower().endswith('.pdf') else "EPUB"
-            durum = durum_belirle(message.file.name)
-            
-            # Mesajı düzenle
-            await cls._edit_message_with_retry(
-                message, bilgi, kaynak, dosya_turu, durum
+            "dosya_turu": dosya_turu,
+            "durum": durum,
+            # Yeni altyazının özeti ve mesajdakiyle aynı olup olmadığı
+            "altyazi_ozeti": altyazi_ozeti,
+            "altyazi_ayni": await cls._altyazi_degismedi(message, altyazi_ozeti),
+            "kayit_anahtari": kayit_anahtari,
+            "arka_plan_yenile": arka_plan_yenile,
+            "baslangic": baslangic,
+        }
+    
+    @classmethod
+    async def mesaji_duzenle(cls, is_: Dict[str, Any]):
+        """Düzenleme aşaması: mesajı güncelle, bayat kaydı arka planda yenile"""
+        message = is_["message"]
+        
+        await cls._edit_message_with_retry(
+            message, is_["bilgi"], is_["kaynak"], is_["dosya_turu"], is_["durum"],
+            yeni_ozet=is_["altyazi_ozeti"], altyazi_ayni=is_["altyazi_ayni"]
+        )
+        
+        if is_["arka_plan_yenile"]:
+            cls._arka_planda_yenile(
+                message, is_["kayit_anahtari"], is_["bilgi"],
+                is_["kaynak"], is_["dosya_turu"], is_["durum"]
             )
-            
-            # Performans metrikleri
-            elapsed = time.time() - start_time
-            logger.info(f"⏱️  İşlem süresi: {elapsed:.2f}s")
-            bot_stats.set("ortalama_islem_suresi", elapsed)
-            
-            # Veritabanına kaydet
-            await cls._save_to_database(message, bilgi, kaynak, basarili)
-            
-        except FloodWaitError as e:
-            logger.warning(f"⏳ Rate limit: {e.seconds}s bekleniyor...")
-            bot_stats.increment("rate_limit_sayisi")
-            await asyncio.sleep(e.seconds)
-            await cls.process_message(message, zorla_guncelle, sadece_dosya_adi)
-            
-        except Exception as e:
-            logger.error(f"❌ İşleme hatası: {e}", exc_info=True)
-            bot_stats.increment("islem_hatalari")
-            cls.stats["su_an_islenen"] = "Hata!"
+        
+        # Performans metrikleri
+        elapsed = time.time() - is_["baslangic"]
+        logger.info(f"⏱️  İşlem süresi: {elapsed:.2f}s")
+        bot_stats.set("ortalama_islem_suresi", elapsed)
+    
+    @classmethod
+    async def kaydi_yaz(cls, is_: Dict[str, Any]):
+        """Kayıt aşaması: işlenen mesajı veritabanına yaz"""
+        await cls._save_to_database(
+            is_["message"], is_["bilgi"], is_["kaynak"], is_["basarili"]
+        )
+    
+    @classmethod
+    def _arka_planda_yenile(
+        cls,
+        message,
+        kayit_anahtari: str,
+        bilgi: dict,
+        kaynak: str,
+        dosya_turu: str,
+        durum: str
+    ):
+        """
+        Bayat kaydı arka planda yenile (aynı anahtar için tek görev)
+        
+        Yenileme bitince kayıt güncellenir; mesaj yalnızca görünen metin
+        değiştiyse yeniden düzenlenir. Hata veren ya da bayat alanı
+        damgalayamayan (bütçe dolan) yenilemeden sonra aynı anahtar üstel
+        artan süre boyunca yeniden denenmez.
+        """
+        if kayit_anahtari in cls._yenilemeler:
+            logger.debug(f"♻️ Yenileme zaten sürüyor: {kayit_anahtari}")
+            return
+        
+        hata = cls._yenileme_hatalari.al(kayit_anahtari)
+        if hata and time.monotonic() < hata[1]:
+            logger.debug(f"♻️ Yenileme geri çekilmede ({hata[0]} hata): {kayit_anahtari}")
+            return
+        
+        async def _yenile():
+            try:
+                eski_metin = cls._build_message_text(bilgi, kaynak, dosya_turu, durum)
+                
+                with zaman_butcesi(settings.MESAJ_ZAMAN_BUTCESI, message.file.name):
+                    yeni_bilgi, yenilenenler = await book_service.yeniden_zenginlestir(
+                        copy.deepcopy(bilgi)
+                    )
+                
+                # Değişiklik olmasa da kaydın güncelleme zamanı yenilenir
+                await db.kaydet(kayit_anahtari, yeni_bilgi)
+                cls._update_cache(message, yeni_bilgi)
+                bot_stats.increment("arka_plan_yenileme")
+                
+                if bayat_alanlar(yeni_bilgi, sadece_damgali=True):
+                    cls._yenileme_basarisiz(kayit_anahtari)
+                else:
+                    cls._yenileme_hatalari.sil(kayit_anahtari)
+                
+                yeni_metin = cls._build_message_text(yeni_bilgi, kaynak, dosya_turu, durum)
+                if yeni_metin != eski_metin:
+                    logger.info(f"♻️ Yenilenen alanlar mesaja yansıtılıyor: {', '.join(yenilenenler)}")
+                    await cls._edit_message_with_retry(
+                        message, yeni_bilgi, kaynak, dosya_turu, durum
+                    )
+            except Exception as e:
+                logger.error(f"❌ Arka plan yenileme hatası ({kayit_anahtari}): {e}")
+                cls._yenileme_basarisiz(kayit_anahtari)
+            finally:
+                cls._yenilemeler.pop(kayit_anahtari, None)
+        
+        cls._yenilemeler[kayit_anahtari] = asyncio.create_task(_yenile())
+    
+    @classmethod
+    def _yenileme_basarisiz(cls, kayit_anahtari: str):
+        """Anahtarın sonraki yenilemesini üstel geri çekilmeyle ertele"""
+        onceki = cls._yenileme_hatalari.al(kayit_anahtari)
+        hata_sayisi = (onceki[0] if onceki else 0) + 1
+        bekleme = min(cls._yenileme_tavan, cls._yenileme_taban * 2 ** (hata_sayisi - 1))
+        cls._yenileme_hatalari.koy(kayit_anahtari, (hata_sayisi, time.monotonic() + bekleme))
+        logger.info(f"♻️ Yenileme başarısız ({hata_sayisi}), {bekleme:.0f}s ertelendi: {kayit_anahtari}")
+    
+    @classmethod
+    def _kayit_anahtari(cls, message, text: str, sadece_dosya_adi: bool) -> str:
+        """
+        Kitap kaydının veritabanı anahtarı
+        
+        Mesajda link varsa link, yoksa temizlenmiş dosya adı kullanılır; aynı
+        kitabın PDF/EPUB kopyaları aynı kaydı paylaşır.
+        """
+        if not sadece_dosya_adi and "http" in text:
+            url = cls._extract_url(text)
+            if url:
+                return f"link:{url}"
+        return f"dosya:{metni_temizle(message.file.name)}"
     
     @classmethod
     async def _search_book_info(
@@ -430,7 +628,9 @@ class MessageHandler:
         kaynak: str,
         dosya_turu: str,
         durum: str,
-        max_retries: int = 3
+        max_retries: int = 3,
+        yeni_ozet: str = None,
+        altyazi_ayni: bool = None
     ):
         """
         Mesajı düzenle (retry logic ile)
@@ -442,7 +642,23 @@ class MessageHandler:
             dosya_turu: PDF veya EPUB
             durum: Kitap durumu
             max_retries: Maksimum deneme sayısı
+            yeni_ozet, altyazi_ayni: Arama aşamasında hesaplandıysa altyazı
+                özeti ve karşılaştırma sonucu (yoksa burada hesaplanır)
         """
+        # Yeni altyazı mevcut metinle aynıysa Telegram'a hiç gidilmez
+        if yeni_ozet is None:
+            metin = cls._build_message_text(bilgi, kaynak, dosya_turu, durum)
+            yeni_ozet = cls._altyazi_ozeti(*tl_html.parse(metin))
+        if altyazi_ayni is None:
+            altyazi_ayni = await cls._altyazi_degismedi(message, yeni_ozet)
+        if altyazi_ayni:
+            logger.debug(f"⏭️ Altyazı aynı, düzenleme atlandı: {message.id}")
+            bot_stats.increment("bos_duzenleme_atlandi")
+            return
+        
+        # Yankı olayı düzenleme yanıtından önce gelebilir; beklenen özet önceden yazılır
+        cls._kendi_duzenlemesi_kaydet(message, yeni_ozet)
+        
         if not await cls._verify_message_exists(message):
             logger.warning(f"⚠️ Mesaj düzenleme iptal edildi (mesaj yok): {message.id}")
             bot_stats.increment("mesaj_duzenlenemedi")
@@ -450,8 +666,16 @@ class MessageHandler:
         
         for attempt in range(max_retries):
             try:
-                await cls._edit_message(message, bilgi, kaynak, dosya_turu, durum)
+                duzenlenen = await cls._edit_message(message, bilgi, kaynak, dosya_turu, durum)
                 bot_stats.increment("basarili_mesaj_duzenleme")
+                telegram_ozet = (
+                    cls._altyazi_ozeti(duzenlenen.message, duzenlenen.entities)
+                    if duzenlenen is not None else yeni_ozet
+                )
+                cls._kendi_duzenlemesi_kaydet(message, telegram_ozet)
+                await db.altyazi_ozeti_kaydet(
+                    message.chat_id, message.id, yeni_ozet, telegram_ozet
+                )
                 return
                 
             except MessageNotModifiedError:
@@ -465,7 +689,7 @@ class MessageHandler:
                 
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2)
-                    if not await cls._verify_message_exists(message):
+                    if not await cls._verify_message_exists(message, taze=True):
                         logger.warning("⚠️ Mesaj silinmiş, düzenleme sonlandırılıyor")
                         bot_stats.increment("mesaj_silinmis")
                         return
@@ -483,15 +707,11 @@ class MessageHandler:
                 bot_stats.increment("sahip_degil")
                 return
                 
-            except FloodWaitError as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"⏳ Rate limit (deneme {attempt+1}/{max_retries}): {e.seconds}s")
-                    await asyncio.sleep(min(e.seconds, 60))
-                    continue
-                else:
-                    logger.error(f"❌ Rate limit aşıldı")
-                    bot_stats.increment("basarisiz_mesaj_duzenleme")
-                    raise
+            except FloodWaitError:
+                # Zamanlayıcı bekleyip yeniden denedi; buraya gelen bırakılmıştır
+                logger.error(f"❌ Rate limit aşıldı")
+                bot_stats.increment("basarisiz_mesaj_duzenleme")
+                raise
                     
             except Exception as e:
                 if attempt < max_retries - 1:
@@ -514,32 +734,81 @@ class MessageHandler:
     ):
         """
         Mesajı formatla ve düzenle
+        
+        Returns:
+            Telegram'ın döndürdüğü düzenlenmiş mesaj
         """
         try:
             baslik = html.escape(bilgi.get("baslik") or "Bilinmiyor")
-            yazar = html.escape(bilgi.get("yazar") or "Bilinmiyor")
-            
-            aciklama_raw = bilgi.get("aciklama") or "Açıklama bulunamadı."
-            if len(aciklama_raw) > ACIKLAMA_MAX_LENGTH:
-                aciklama_raw = aciklama_raw[:ACIKLAMA_KISALTMA_LENGTH] + "..."
-            ozet = html.escape(aciklama_raw)
+            metin = cls._build_message_text(bilgi, kaynak, dosya_turu, durum)
             
-            metin = cls._format_message_text(
-                bilgi, baslik, yazar, ozet, dosya_turu, durum, kaynak
-            )
-            
-            await message.edit(
+            duzenlenen = await tg_zamanlayici.cagir(
+                message.chat_id,
+                message.edit,
                 text=metin, 
                 parse_mode='html', 
                 link_preview=False
             )
             
             logger.info(f"✅ Güncellendi: {baslik} ({kaynak})")
+            return duzenlenen
             
         except ValueError as e:
             logger.error(f"❌ Format hatası: {e}")
             raise
     
+    @staticmethod
+    def _altyazi_ozeti(metin: str, entities) -> str:
+        """
+        Düz metin + biçim varlıklarının özeti
+        
+        Üretilen HTML (tl_html.parse ile) ve Telegram'daki mesaj aynı biçimde
+        özetlenir; sıra ve gereksiz alanlar karşılaştırmayı bozmaz.
+        """
+        varliklar = sorted(
+            (type(e).__name__, e.offset, e.length, getattr(e, "url", None) or "")
+            for e in (entities or [])
+        )
+        ham = json.dumps([(metin or "").strip(), varliklar], ensure_ascii=False)
+        return hashlib.sha1(ham.encode("utf-8")).hexdigest()
+    
+    @classmethod
+    async def _altyazi_degismedi(cls, message, yeni_ozet: str) -> bool:
+        """
+        Yeni altyazı mesajdakiyle aynı mı
+        
+        Önce mesajın elimizdeki metniyle karşılaştırılır. Telegram metni
+        kendi biçimine çevirdiğinde (varlık sınırları vb.) doğrudan eşleşmez;
+        o durumda son yazdığımız altyazının kaydına bakılır: mesaj o zamandan
+        beri değişmediyse ve aynı altyazıyı yazacaksak düzenleme gereksizdir.
+        """
+        mevcut_ozet = cls._altyazi_ozeti(message.message, message.entities)
+        if mevcut_ozet == yeni_ozet:
+            return True
+        kayit = await db.altyazi_ozeti(message.chat_id, message.id)
+        return kayit == (yeni_ozet, mevcut_ozet)
+    
+    @classmethod
+    def _build_message_text(
+        cls,
+        bilgi: dict,
+        kaynak: str,
+        dosya_turu: str,
+        durum: str
+    ) -> str:
+        """Kitap bilgisinden mesajın son HTML metnini üret"""
+        baslik = html.escape(bilgi.get("baslik") or "Bilinmiyor")
+        yazar = html.escape(bilgi.get("yazar") or "Bilinmiyor")
+        
+        aciklama_raw = bilgi.get("aciklama") or "Açıklama bulunamadı."
+        if len(aciklama_raw) > ACIKLAMA_MAX_LENGTH:
+            aciklama_raw = aciklama_raw[:ACIKLAMA_KISALTMA_LENGTH] + "..."
+        ozet = html.escape(aciklama_raw)
+        
+        return cls._format_message_text(
+            bilgi, baslik, yazar, ozet, dosya_turu, durum, kaynak
+        )
+    
     @classmethod
     def _format_message_text(
         cls,
@@ -0,0 +1,368 @@
+"""
+Aşamalı mesaj işleme hattı
+Giriş kuyruğu → N arama işçisi → düzenleme zamanlayıcı → veritabanı yazıcı
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config.settings import settings
+from handlers.message_handler import MessageHandler
+from utils.deadline import iptal_edilebilir
+from utils.message_verifier import mesaj_dogrulayici
+from utils.statistics import bot_stats
+
+logger = logging.getLogger(__name__)
+
+
+class MesajHatti:
+    """
+    Mesaj işleme hattı
+
+    Aramalar eşzamanlı yürür; sonuçlar kanal başına sıra numarasıyla
+    yeniden sıralanıp tek düzenleme işçisine verilir, böylece bir kanaldaki
+    düzenlemeler mesajların geliş sırasını korur. Kuyruklar sınırlıdır:
+    dolduğunda ekle() bekler (geri basınç).
+
+    Aynı mesaj için yeni bir iş gelirse eskisi geçersiz olur: sessizlik
+    süresi bekleyen iş iptal edilir, süren arama kesilir, kuyruktaki iş
+    sırası geldiğinde atlanır. Böylece art arda yapılan düzenlemelerden
+    yalnızca sonuncusu işlenir. Silinen mesajın işleri de aynı yolla bırakılır.
+
+    Kanal başına işi bitmemiş mesajlar tutulur (bitmemis()); bir iş
+    kaydedildiğinde, atlandığında veya bırakıldığında bitis_bildirimi
+    çağrılır. Tarama kontrol noktası hattı boşaltmadan bunlarla ilerler.
+
+    Examples:
+        >>> await mesaj_hatti.ekle(event.message)
+        >>> await mesaj_hatti.ekle(event.message, zorla_guncelle=True, sessizlik=2.0)
+        >>> mesaj_hatti.silindi(event.chat_id, event.deleted_ids)
+        >>> await mesaj_hatti.bosalt()   # geçmiş tarama sonunda
+        >>> await mesaj_hatti.kapat()    # bot dururken
+    """
+
+    def __init__(
+        self,
+        arama_isci: int,
+        kuyruk_boyutu: int
+    ):
+        self.arama_isci = max(1, arama_isci)
+        self.kuyruk_boyutu = max(1, kuyruk_boyutu)
+
+        self._giris: Optional[asyncio.Queue] = None
+        self._duzenleme: Optional[asyncio.Queue] = None
+        self._kayit: Optional[asyncio.Queue] = None
+        self._iscilar: List[asyncio.Task] = []
+
+        # Kanal başına sıra: verilen son numara, düzenlemeye sıradaki numara,
+        # sırası gelmemiş sonuçlar (yığın) ve sırayla iletim kilidi. Numara iş
+        # giriş kuyruğundan çıkarken verilir: kuyruk FIFO olduğundan geliş
+        # sırasıdır ve iptal edilen put() numara harcayıp kanalı tıkamaz
+        self._sayaclar: Dict[int, itertools.count] = {}
+        self._beklenen: Dict[int, int] = {}
+        self._bekleyen: Dict[int, List[Tuple[int, int, Optional[Dict[str, Any]]]]] = {}
+        self._kilitler: Dict[int, asyncio.Lock] = {}
+        self._esitlik = itertools.count()
+
+        # (kanal, mesaj) başına: güncel iş nesli, sessizlik zamanlayıcısı, süren arama
+        self._nesiller: Dict[Tuple[int, int], int] = {}
+        self._zamanlayicilar: Dict[Tuple[int, int], asyncio.Task] = {}
+        self._ucusta: Dict[Tuple[int, int], Tuple[asyncio.Task, threading.Event]] = {}
+
+        # Kanal başına işi bitmemiş mesaj id'leri (aynı mesajın birden çok işi olabilir)
+        self._bitmemis: Dict[int, Counter] = {}
+        # İş bitince (kaydedildi / atlandı / bırakıldı) çağrılır: (kanal_id, mesaj_id)
+        self.bitis_bildirimi: Optional[Callable[[int, int], Awaitable[None]]] = None
+
+        self._aramada = 0
+
+    def _baslat(self):
+        if self._iscilar:
+            return
+        self._giris = asyncio.Queue(maxsize=self.kuyruk_boyutu)
+        self._duzenleme = asyncio.Queue(maxsize=self.kuyruk_boyutu)
+        self._kayit = asyncio.Queue(maxsize=self.kuyruk_boyutu)
+        self._iscilar = [
+            asyncio.create_task(self._arama_iscisi(i))
+            for i in range(self.arama_isci)
+        ]
+        self._iscilar.append(asyncio.create_task(self._duzenleme_iscisi()))
+        self._iscilar.append(asyncio.create_task(self._kayit_iscisi()))
+        logger.info(f"🏭 Mesaj hattı başlatıldı ({self.arama_isci} arama işçisi)")
+
+    async def ekle(
+        self,
+        message,
+        zorla_guncelle: bool = False,
+        sadece_dosya_adi: bool = False,
+        sessizlik: float = 0.0
+    ):
+        """
+        Mesajı hatta ekle (giriş kuyruğu doluysa yer açılana kadar bekler)
+
+        Args:
+            sessizlik: > 0 ise mesaj bu kadar saniye yeni iş gelmezse hatta girer
+        """
+        self._baslat()
+        anahtar = (message.chat_id, message.id)
+        nesil = self._yeni_nesil(anahtar)
+        self._bitmemis.setdefault(message.chat_id, Counter())[message.id] += 1
+
+        if sessizlik > 0:
+            zamanlayici = asyncio.create_task(
+                self._sessizlikten_sonra(sessizlik, message, nesil, zorla_guncelle, sadece_dosya_adi)
+            )
+            # Başlamadan iptal edilen görevde de iş bırakılmış sayılır
+            zamanlayici.add_done_callback(
+                lambda gorev: self._bitmemis_azalt(*anahtar) if gorev.cancelled() else None
+            )
+            self._zamanlayicilar[anahtar] = zamanlayici
+            return
+        try:
+            await self._kuyruga_al(message, nesil, zorla_guncelle, sadece_dosya_adi)
+        except asyncio.CancelledError:
+            self._bitmemis_azalt(*anahtar)
+            raise
+
+    async def _sessizlikten_sonra(self, sessizlik: float, message, nesil: int, zorla: bool, sadece: bool):
+        await asyncio.sleep(sessizlik)
+        self._zamanlayicilar.pop((message.chat_id, message.id), None)
+        await self._kuyruga_al(message, nesil, zorla, sadece)
+
+    async def _kuyruga_al(self, message, nesil: int, zorla: bool, sadece: bool):
+        await self._giris.put((message.chat_id, nesil, message, zorla, sadece))
+
+    def _sira_al(self, kanal_id: int) -> int:
+        sayac = self._sayaclar.setdefault(kanal_id, itertools.count())
+        self._beklenen.setdefault(kanal_id, 0)
+        return next(sayac)
+
+    def _bitmemis_azalt(self, kanal_id: int, mesaj_id: int):
+        sayac = self._bitmemis.get(kanal_id)
+        if sayac is None:
+            return
+        sayac[mesaj_id] -= 1
+        if sayac[mesaj_id] <= 0:
+            del sayac[mesaj_id]
+
+    async def _is_bitti(self, kanal_id: int, mesaj_id: int):
+        """İşi bitmemişlerden düş ve bildir (bildirim hatası hattı durdurmaz)"""
+        self._bitmemis_azalt(kanal_id, mesaj_id)
+        if self.bitis_bildirimi is None:
+            return
+        try:
+            await self.bitis_bildirimi(kanal_id, mesaj_id)
+        except Exception as e:
+            logger.error(f"❌ İş bitiş bildirimi hatası: {e}", exc_info=True)
+
+    def bitmemis(self, kanal_id: int) -> List[int]:
+        """Kanalda hatta girmiş ama işi bitmemiş mesaj id'leri"""
+        return list(self._bitmemis.get(kanal_id, ()))
+
+    def _durdur(self, anahtar: Tuple[int, int], sayac: str):
+        """Mesajın sessizlik bekleyen ve süren işini iptal et"""
+        zamanlayici = self._zamanlayicilar.pop(anahtar, None)
+        if zamanlayici is not None and not zamanlayici.done():
+            zamanlayici.cancel()
+            self._iptal_sayildi(anahtar, "sessizlik bekleyen", sayac)
+        ucusta = self._ucusta.get(anahtar)
+        if ucusta is not None and not ucusta[0].done():
+            gorev, isaret = ucusta
+            # İşaret thread'deki scraper'ı, cancel() asyncio zincirini durdurur
+            isaret.set()
+            gorev.cancel()
+            self._iptal_sayildi(anahtar, "süren arama", sayac)
+
+    def _yeni_nesil(self, anahtar: Tuple[int, int]) -> int:
+        """Mesajın önceki işlerini geçersiz kıl, yeni işin neslini döndür"""
+        self._durdur(anahtar, "duzenleme_iptal")
+        nesil = self._nesiller.get(anahtar, 0) + 1
+        self._nesiller[anahtar] = nesil
+        return nesil
+
+    def silindi(self, kanal_id: Optional[int], mesaj_idler) -> int:
+        """
+        Silinen mesajların bütün işlerini bırak
+
+        Args:
+            kanal_id: Sohbet (Telegram kanal dışı silmelerde bildirmez: None)
+            mesaj_idler: Silinen mesaj id'leri
+
+        Returns:
+            Hatta işi olan silinmiş mesaj sayısı
+        """
+        idler = set(mesaj_idler)
+        anahtarlar = [
+            a for a in self._nesiller
+            if a[1] in idler and (kanal_id is None or a[0] == kanal_id)
+        ]
+        for anahtar in anahtarlar:
+            self._durdur(anahtar, "silinen_mesaj_iptal")
+            # Nesil kaydı kalmayan iş kuyrukta / düzenleme öncesinde atlanır
+            del self._nesiller[anahtar]
+        return len(anahtarlar)
+
+    def _guncel_mi(self, anahtar: Tuple[int, int], nesil: int) -> bool:
+        return self._nesiller.get(anahtar) == nesil
+
+    def _bitir(self, anahtar: Tuple[int, int], nesil: int):
+        """Mesajın son işi bittiyse nesil kaydını bırak"""
+        if self._guncel_mi(anahtar, nesil):
+            del self._nesiller[anahtar]
+
+    def _bayat_is_sayildi(self, anahtar: Tuple[int, int], asama: str):
+        """Geçersiz işin atlanması: nesil kaydı yoksa mesaj silinmiştir"""
+        sayac = "duzenleme_iptal" if anahtar in self._nesiller else "silinen_mesaj_iptal"
+        self._iptal_sayildi(anahtar, asama, sayac)
+
+    @staticmethod
+    def _iptal_sayildi(anahtar: Tuple[int, int], asama: str, sayac: str):
+        neden = "mesaj silindi" if sayac == "silinen_mesaj_iptal" else "yerine yenisi geldi"
+        logger.info(f"✂️ İş iptal ({neden}, {asama}): {anahtar[1]}")
+        bot_stats.increment(sayac)
+
+    async def bosalt(self):
+        """Hatta girmiş bütün mesajlar düzenlenip kaydedilene kadar bekle"""
+        if not self._iscilar:
+            return
+        await self._giris.join()
+        await self._duzenleme.join()
+        await self._kayit.join()
+
+    async def kapat(self):
+        """İşçileri, sessizlik bekleyen ve süren işleri durdur"""
+        ucusta = list(self._ucusta.values())
+        for zamanlayici in self._zamanlayicilar.values():
+            zamanlayici.cancel()
+        self._zamanlayicilar.clear()
+        # İşçinin iptali süren aramasına da geçer; işaret sonra verilir,
+        # yoksa işçi iptali aramanın iptali sanıp çalışmaya devam ederdi
+        for isci in self._iscilar:
+            isci.cancel()
+        await asyncio.gather(*self._iscilar, return_exceptions=True)
+        for _, isaret in ucusta:
+            isaret.set()
+        self._iscilar = []
+
+    def durum(self) -> Dict[str, int]:
+        """Aşama başına bekleyen iş, sessizlik bekleyen ve süren arama sayıları"""
+        if not self._iscilar:
+            return {"giris": 0, "aramada": 0, "sirada": 0, "duzenleme": 0, "kayit": 0,
+                    "sessizlikte": 0, "ucusta": 0}
+        return {
+            "giris": self._giris.qsize(),
+            "aramada": self._aramada,
+            "sirada": sum(len(y) for y in self._bekleyen.values()),
+            "duzenleme": self._duzenleme.qsize(),
+            "kayit": self._kayit.qsize(),
+            "sessizlikte": len(self._zamanlayicilar),
+            "ucusta": len(self._ucusta),
+        }
+
+    async def _arama_iscisi(self, no: int):
+        while True:
+            kanal_id, nesil, message, zorla, sadece = await self._giris.get()
+            sira = self._sira_al(kanal_id)
+            anahtar = (kanal_id, message.id)
+            is_ = None
+            if not self._guncel_mi(anahtar, nesil):
+                self._bayat_is_sayildi(anahtar, "kuyrukta")
+            else:
+                self._aramada += 1
+                # Ayrı görev: aynı mesaja yeni iş gelirse / mesaj silinirse
+                # yalnızca bu arama kesilir
+                isaret = threading.Event()
+                gorev = asyncio.create_task(self._ara(message, zorla, sadece, isaret))
+                self._ucusta[anahtar] = (gorev, isaret)
+                try:
+                    is_ = await gorev
+                except asyncio.CancelledError:
+                    # İşaretsiz iptal işçinin kendisine gelmiştir (kapat())
+                    if not isaret.is_set():
+                        raise
+                except Exception as e:
+                    logger.error(f"❌ Arama aşaması hatası: {e}", exc_info=True)
+                    bot_stats.increment("islem_hatalari")
+                    MessageHandler.stats["su_an_islenen"] = "Hata!"
+                finally:
+                    self._aramada -= 1
+                    if self._ucusta.get(anahtar, (None,))[0] is gorev:
+                        del self._ucusta[anahtar]
+                if is_ is not None:
+                    is_["nesil"] = nesil
+                else:
+                    self._bitir(anahtar, nesil)
+            try:
+                # Atlanan / hatalı mesaj da sırasını bırakır, kanal tıkanmaz
+                await self._sirayla_ilet(kanal_id, sira, is_)
+                if is_ is None:
+                    await self._is_bitti(kanal_id, message.id)
+            finally:
+                self._giris.task_done()
+
+    @staticmethod
+    async def _ara(message, zorla: bool, sadece: bool, isaret: threading.Event):
+        with iptal_edilebilir(isaret):
+            return await MessageHandler.bilgi_hazirla(message, zorla, sadece)
+
+    async def _sirayla_ilet(self, kanal_id: int, sira: int, is_: Optional[Dict[str, Any]]):
+        """Sonucu, kanalda kendinden önceki bütün sonuçlar iletildikten sonra düzenlemeye ver"""
+        heapq.heappush(self._bekleyen.setdefault(kanal_id, []), (sira, next(self._esitlik), is_))
+        kilit = self._kilitler.setdefault(kanal_id, asyncio.Lock())
+        async with kilit:
+            yigin = self._bekleyen[kanal_id]
+            while yigin and yigin[0][0] == self._beklenen[kanal_id]:
+                _, _, hazir = heapq.heappop(yigin)
+                self._beklenen[kanal_id] += 1
+                if hazir is not None:
+                    # Kuyrukta bekleyenlerin varlık doğrulaması toplu yapılır;
+                    # altyazısı aynı (düzenlenmeyecek) mesaj doğrulanmaz
+                    if not hazir.get("altyazi_ayni"):
+                        mesaj_dogrulayici.onden_dogrula(hazir["message"])
+                    await self._duzenleme.put(hazir)
+
+    async def _duzenleme_iscisi(self):
+        while True:
+            is_ = await self._duzenleme.get()
+            message = is_["message"]
+            anahtar = (message.chat_id, message.id)
+            try:
+                if not self._guncel_mi(anahtar, is_["nesil"]):
+                    self._bayat_is_sayildi(anahtar, "düzenleme öncesi")
+                    await self._is_bitti(*anahtar)
+                    continue
+                # Hız sınırı ve FloodWait utils.telegram_scheduler'da
+                await MessageHandler.mesaji_duzenle(is_)
+                await self._kayit.put(is_)
+            except Exception as e:
+                logger.error(f"❌ Düzenleme aşaması hatası: {e}", exc_info=True)
+                bot_stats.increment("islem_hatalari")
+                self._bitir(anahtar, is_["nesil"])
+                await self._is_bitti(*anahtar)
+            finally:
+                self._duzenleme.task_done()
+
+    async def _kayit_iscisi(self):
+        while True:
+            is_ = await self._kayit.get()
+            try:
+                await MessageHandler.kaydi_yaz(is_)
+            except Exception as e:
+                logger.error(f"❌ Kayıt aşaması hatası: {e}", exc_info=True)
+            finally:
+                message = is_["message"]
+                self._bitir((message.chat_id, message.id), is_["nesil"])
+                # bosalt() döndüğünde iş bitmemişlerden düşmüş olsun
+                await self._is_bitti(message.chat_id, message.id)
+                self._kayit.task_done()
+
+
+# Global instance
+mesaj_hatti = MesajHatti(
+    arama_isci=settings.HAT_ARAMA_ISCI,
+    kuyruk_boyutu=settings.HAT_KUYRUK_BOYUTU,
+)
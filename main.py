@@ -4,6 +4,7 @@ Modüler Mimari v9.5 - Stats Entegrasyonlu
 """
 import asyncio
 import sys
+import time
 from datetime import datetime
 from telethon import TelegramClient, events
 from telethon.errors import MessageNotModifiedError
@@ -11,11 +12,20 @@ from telethon.errors import MessageNotModifiedError
 from config.settings import settings
 from handlers.message_handler import MessageHandler
 from handlers.admin_handler import AdminHandler
+from handlers.pipeline import mesaj_hatti
+from services.enrichment_planner import enrichment_planner, KAYIT_ARALIGI
+from utils.message_verifier import mesaj_dogrulayici
+from utils.telegram_scheduler import tg_zamanlayici
+from database.db_manager import db
+from database.snapshot import katalog_snapshot, snapshot_yenile
 from utils.logger import logger  # Tek logger yeterli
 from utils.statistics import bot_stats  # Yeni stats sistemi
 
 # Telethon client
 client = TelegramClient('user_oturumu', settings.API_ID, settings.API_HASH)
+# FloodWait'ler Telethon'da uyutulmaz, hızı ayarlayan zamanlayıcıya düşer;
+# bu yüzden bütün çağrılar tg_zamanlayici.cagir üzerinden yapılır
+client.flood_sleep_threshold = 0
 
 
 # ==================== MESAJ İŞLEYİCİLERİ ====================
@@ -29,7 +39,8 @@ async def yeni_mesaj_handler(event):
         bot_stats.set("son_islem_zamani", datetime.now().isoformat())
         
         logger.info(f"🔔 Yeni Mesaj (Kanal ID: {event.chat_id})")
-        await MessageHandler.process_message(event.message)
+        await mesaj_hatti.ekle(event.message)
+        _canli_mesaj_goruldu(event.chat_id, event.message.id)
         
         bot_stats.increment("basarili")
         
@@ -42,6 +53,12 @@ async def yeni_mesaj_handler(event):
 async def duzenlenen_mesaj_handler(event):
     """Mesaj düzenlendiğinde"""
     try:
+        # Bot'un kendi düzenlemesinin yankısı: metne bakmadan bırak
+        if MessageHandler.kendi_duzenlemesi_mi(event.message):
+            logger.debug("⏩ Kendi düzenlememizin yankısı, atlanıyor")
+            bot_stats.increment("yanki_atlandi")
+            return
+        
         text = event.message.text or ""
         
         # Zaten bot tarafından düzenlenmişse ve link yoksa atla
@@ -63,7 +80,12 @@ async def duzenlenen_mesaj_handler(event):
         bot_stats.increment("toplam_duzenleme")
         
         logger.info(f"🔔 Düzenleme Algılandı (Kanal ID: {event.chat_id})")
-        await MessageHandler.process_message(event.message, zorla_guncelle=True)
+        # Art arda düzenlemelerde yalnızca sonuncusu işlenir
+        await mesaj_hatti.ekle(
+            event.message,
+            zorla_guncelle=True,
+            sessizlik=settings.DUZENLEME_SESSIZLIK
+        )
         
         bot_stats.increment("basarili")
         
@@ -72,6 +94,21 @@ async def duzenlenen_mesaj_handler(event):
         bot_stats.increment("basarisiz")
 
 
+@client.on(events.MessageDeleted(chats=settings.HEDEF_KANALLAR))
+async def silinen_mesaj_handler(event):
+    """Mesaj silindiğinde: hattaki işini iptal et"""
+    try:
+        if event.chat_id is not None:
+            mesaj_dogrulayici.silindi(event.chat_id, event.deleted_ids)
+        
+        iptal = mesaj_hatti.silindi(event.chat_id, event.deleted_ids)
+        if iptal:
+            logger.info(f"🗑️ Silinen {iptal} mesajın işi iptal edildi (Kanal ID: {event.chat_id})")
+        
+    except Exception as e:
+        logger.error(f"❌ Silme işleme hatası: {e}", exc_info=True)
+
+
 # ==================== ADMIN KOMUTLARI ====================
 
 @client.on(events.NewMessage(pattern='/admin'))
@@ -114,6 +151,38 @@ async def sonkayitlar_handler(event):
     await AdminHandler.sonkayitlar(event, client)
 
 
+@client.on(events.NewMessage(pattern=r'/ara\b'))
+async def ara_handler(event):
+    """Katalog arama komutu"""
+    if not await _admin_check(event):
+        return
+    await AdminHandler.ara(event, client)
+
+
+@client.on(events.NewMessage(pattern=r'/sabitle\b'))
+async def sabitle_handler(event):
+    """Eşleşme sabitleme komutu"""
+    if not await _admin_check(event):
+        return
+    await AdminHandler.sabitle(event, client)
+
+
+@client.on(events.NewMessage(pattern='/sabitkaldir'))
+async def sabitkaldir_handler(event):
+    """Sabitleme kaldırma komutu"""
+    if not await _admin_check(event):
+        return
+    await AdminHandler.sabitkaldir(event, client)
+
+
+@client.on(events.NewMessage(pattern='/sabitler'))
+async def sabitler_handler(event):
+    """Sabitleme listesi komutu"""
+    if not await _admin_check(event):
+        return
+    await AdminHandler.sabitler(event, client)
+
+
 @client.on(events.NewMessage(pattern='/logtemizle'))
 async def logtemizle_handler(event):
     """Log temizleme komutu"""
@@ -130,11 +199,11 @@ async def stats_handler(event):
     
     try:
         report = bot_stats.get_report()
-        await event.respond(report)
+        await tg_zamanlayici.cagir(event.chat_id, event.respond, report)
         logger.info("📊 Stats raporu gönderildi")
     except Exception as e:
         logger.error(f"Stats raporu hatası: {e}", exc_info=True)
-        await event.respond("❌ Stats raporu oluşturulamadı!")
+        await tg_zamanlayici.cagir(event.chat_id, event.respond, "❌ Stats raporu oluşturulamadı!")
 
 
 @client.on(events.NewMessage(pattern='/statsreset'))
@@ -145,17 +214,17 @@ async def stats_reset_handler(event):
     
     try:
         bot_stats.reset()
-        await event.respond("✅ İstatistikler sıfırlandı!")
+        await tg_zamanlayici.cagir(event.chat_id, event.respond, "✅ İstatistikler sıfırlandı!")
         logger.info("📊 Stats sıfırlandı")
     except Exception as e:
         logger.error(f"Stats sıfırlama hatası: {e}", exc_info=True)
-        await event.respond("❌ Sıfırlama başarısız!")
+        await tg_zamanlayici.cagir(event.chat_id, event.respond, "❌ Sıfırlama başarısız!")
 
 
 async def _admin_check(event) -> bool:
     """Admin yetkisi kontrol et"""
     if event.sender_id != settings.ADMIN_ID:
-        await event.respond("⛔ Bu komutu kullanma yetkiniz yok!")
+        await tg_zamanlayici.cagir(event.chat_id, event.respond, "⛔ Bu komutu kullanma yetkiniz yok!")
         logger.warning(f"⚠️ Yetkisiz komut denemesi: {event.sender_id}")
         return False
     return True
@@ -163,8 +232,174 @@ async def _admin_check(event) -> bool:
 
 # ==================== GEÇMİŞ TARAMA ====================
 
+# Kanal başına kontrol noktası (tarama ve canlı mod ortak kullanır):
+#   en_yuksek : işi biten en yeni mesaj; yeniden başlatmada bundan yenisi çekilir
+#   en_dusuk  : geriye taramada işi biten en eski mesaj
+#   imlec     : geriye taramanın devam edeceği offset_id
+#   tamamlandi: geriye tarama kanalın başına ulaştı
+#   canli     : bu çalışmada yetişme bitti, canlı mesajlar en_yuksek'i ilerletebilir
+# Yalnızca bellekte tutulan tarama konumu:
+#   gorulen_ust: yetişmede / canlı modda görülen en yeni mesaj
+#   geri_ust, geri_konum: geriye taramada görülen ilk ve son (en eski) mesaj
+#   geri_bitti : geriye taramanın iterasyonu bitti
+_tarama_noktalari = {}
+
+
+def _noktayi_ilerlet(kanal_id: int, nokta: dict):
+    """
+    Görülen konumları, hatta işi bitmemiş mesajların gerisinde kalacak
+    şekilde noktaya işle (hat boşaltılmaz)
+    """
+    bitmemis = mesaj_hatti.bitmemis(kanal_id)
+    
+    # Yetişme / canlı: en_yuksek, kendisine kadar her mesajın işi bitince ilerler
+    # (geriye taranan bölgeyi imleç korur, o bölgenin işleri burada beklenmez)
+    ust = nokta["gorulen_ust"]
+    eski = nokta["en_yuksek"] or 0
+    if ust and ust > eski:
+        alt = max(eski, nokta["geri_ust"] or 0)
+        arada = [i for i in bitmemis if alt < i <= ust]
+        nokta["en_yuksek"] = max(eski, min(arada) - 1) if arada else ust
+    
+    # Geriye tarama: imleç, üstündeki her mesajın işi bitene kadar inmez
+    if nokta["geri_ust"] is not None:
+        konum = nokta["geri_konum"]
+        arada = [i for i in bitmemis if konum <= i <= nokta["geri_ust"]]
+        if arada:
+            nokta["imlec"] = nokta["en_dusuk"] = max(arada) + 1
+        elif nokta["geri_bitti"]:
+            nokta["en_dusuk"], nokta["imlec"], nokta["tamamlandi"] = konum, None, True
+        else:
+            nokta["imlec"] = nokta["en_dusuk"] = konum
+
+
+async def _tarama_noktasi_yaz(kanal_id: int, nokta: dict):
+    """İşi biten mesajlara kadar ilerlemeyi noktaya işle, değiştiyse yaz"""
+    onceki = (nokta["en_yuksek"], nokta["en_dusuk"], nokta["imlec"], nokta["tamamlandi"])
+    _noktayi_ilerlet(kanal_id, nokta)
+    simdiki = (nokta["en_yuksek"], nokta["en_dusuk"], nokta["imlec"], nokta["tamamlandi"])
+    if simdiki != onceki:
+        await db.tarama_noktasi_kaydet(kanal_id, *simdiki)
+
+
+def _canli_mesaj_goruldu(kanal_id: int, mesaj_id: int):
+    """Yetişmesi biten kanalda canlı mesajı görülen konuma işle (yazma iş bitince)"""
+    nokta = _tarama_noktalari.get(kanal_id)
+    if nokta and nokta["canli"]:
+        nokta["gorulen_ust"] = max(nokta["gorulen_ust"] or 0, mesaj_id)
+
+
+async def _hat_isi_bitti(kanal_id: int, mesaj_id: int):
+    """Hat bir işi kaydettiğinde / bıraktığında canlı mesajlarla en_yuksek'i ilerlet"""
+    nokta = _tarama_noktalari.get(kanal_id)
+    if nokta and nokta["canli"] and mesaj_id > (nokta["en_yuksek"] or 0):
+        await _tarama_noktasi_yaz(kanal_id, nokta)
+
+
+mesaj_hatti.bitis_bildirimi = _hat_isi_bitti
+
+
+async def _gecmis_mesaji_isle(mesaj, zorla_modu: bool) -> bool:
+    """Mesaj işlenecekse hatta ver (verildiyse True)"""
+    # Sadece dosya olanlar
+    if not mesaj.file:
+        return False
+    
+    dosya_adi = mesaj.file.name
+    if not dosya_adi:
+        return False
+    
+    dosya_adi_lower = dosya_adi.lower()
+    if not (dosya_adi_lower.endswith('.pdf') or dosya_adi_lower.endswith('.epub')):
+        return False
+    
+    # Zaten işlenmişse atla (zorla güncelleme yoksa)
+    if not zorla_modu and mesaj.text:
+        if "✍️" in mesaj.text or "Kitap adı:" in mesaj.text or "📖" in mesaj.text:
+            return False
+    
+    # İşle
+    use_filename_only = False
+    if zorla_modu:
+        text = mesaj.text or ""
+        if "http" not in text:
+            use_filename_only = True
+    
+    # Hatta ver (hat doluysa yer açılana kadar bekler)
+    await mesaj_hatti.ekle(
+        mesaj,
+        zorla_guncelle=zorla_modu,
+        sadece_dosya_adi=use_filename_only
+    )
+    bot_stats.increment("gecmis_tarama_sayac")
+    return True
+
+
+async def _kanal_tara(kanal_id: int, zorla_modu: bool) -> int:
+    """
+    Kanalı kontrol noktasından devam ederek tara
+    
+    Önce son görülen mesajdan yeni olanlar eskiden yeniye çekilir (yetişme),
+    sonra yarım kalan geriye tarama imleçten eskiye sürdürülür. Zorla
+    güncelleme modunda kayıtlı nokta yok sayılır, kanal baştan taranır.
+    
+    Returns:
+        Hatta verilen mesaj sayısı
+    """
+    kayitli = None if zorla_modu else await db.tarama_noktasi(kanal_id)
+    nokta = dict(kayitli or {"en_yuksek": None, "en_dusuk": None, "imlec": None, "tamamlandi": False})
+    nokta.update(
+        canli=False, gorulen_ust=nokta["en_yuksek"],
+        geri_ust=None, geri_konum=None, geri_bitti=False,
+    )
+    _tarama_noktalari[kanal_id] = nokta
+    aralik = max(1, settings.TARAMA_NOKTA_ARALIGI)
+    sayac = 0
+    
+    # 1. Yetişme: son görülen mesajdan yeni olanlar (eskiden yeniye)
+    if nokta["en_yuksek"]:
+        logger.info(f"   ↪️ {nokta['en_yuksek']} sonrası yeni mesajlar çekiliyor")
+        gorulen = 0
+        async for mesaj in tg_zamanlayici.iter_messages(
+            client, kanal_id, min_id=nokta["en_yuksek"], reverse=True
+        ):
+            sayac += await _gecmis_mesaji_isle(mesaj, zorla_modu)
+            nokta["gorulen_ust"] = max(nokta["gorulen_ust"], mesaj.id)
+            gorulen += 1
+            if gorulen % aralik == 0:
+                await _tarama_noktasi_yaz(kanal_id, nokta)
+        if gorulen:
+            await _tarama_noktasi_yaz(kanal_id, nokta)
+    nokta["canli"] = True
+    
+    # 2. Geriye tarama: imleçten (yoksa en yeniden) kanalın başına
+    if not nokta["tamamlandi"]:
+        if nokta["imlec"]:
+            logger.info(f"   ↩️ Geriye tarama {nokta['imlec']} mesajından sürdürülüyor")
+        gorulen = 0
+        async for mesaj in tg_zamanlayici.iter_messages(
+            client, kanal_id, offset_id=nokta["imlec"] or 0
+        ):
+            if nokta["geri_ust"] is None:
+                nokta["geri_ust"] = mesaj.id
+                # İlk taramada en yeni mesaj canlı modun başlangıcıdır
+                nokta["gorulen_ust"] = max(nokta["gorulen_ust"] or 0, mesaj.id)
+            sayac += await _gecmis_mesaji_isle(mesaj, zorla_modu)
+            nokta["geri_konum"] = mesaj.id
+            gorulen += 1
+            if gorulen % aralik == 0:
+                await _tarama_noktasi_yaz(kanal_id, nokta)
+        if not gorulen:
+            nokta["geri_ust"] = nokta["geri_konum"] = nokta["en_dusuk"] or nokta["imlec"] or 0
+        nokta["geri_bitti"] = True
+        # Hatta kalan işler bitince gecmis_tarama noktayı yeniden yazar
+        await _tarama_noktasi_yaz(kanal_id, nokta)
+    
+    return sayac
+
+
 async def gecmis_tarama(zorla_modu: bool = False):
-    """Geçmiş mesajları tara"""
+    """Geçmiş mesajları tara (kanal başına kaldığı yerden)"""
     logger.info(f"\n{'='*60}")
     logger.info(f"⏳ GEÇMİŞ TARAMA BAŞLATILIYOR...")
     logger.info(f"Sürüm: {settings.SURUM}")
@@ -185,55 +420,21 @@ async def gecmis_tarama(zorla_modu: bool = False):
         logger.info(f"   ID: {kanal_id}")
         
         try:
-            sayac = 0
-            async for mesaj in client.iter_messages(kanal_id, limit=None):
-                # Sadece dosya olanlar
-                if not mesaj.file:
-                    continue
-                
-                dosya_adi = mesaj.file.name
-                if not dosya_adi:
-                    continue
-                
-                dosya_adi_lower = dosya_adi.lower()
-                if not (dosya_adi_lower.endswith('.pdf') or dosya_adi_lower.endswith('.epub')):
-                    continue
-                
-                # Zaten işlenmişse atla (zorla güncelleme yoksa)
-                if not zorla_modu and mesaj.text:
-                    if "✍️" in mesaj.text or "Kitap adı:" in mesaj.text or "📖" in mesaj.text:
-                        continue
-                
-                # İşle
-                use_filename_only = False
-                if zorla_modu:
-                    text = mesaj.text or ""
-                    if "http" not in text:
-                        use_filename_only = True
-                
-                try:
-                    await MessageHandler.process_message(
-                        mesaj,
-                        zorla_guncelle=zorla_modu,
-                        sadece_dosya_adi=use_filename_only
-                    )
-                    sayac += 1
-                    toplam_islem += 1
-                    bot_stats.increment("gecmis_tarama_sayac")
-                    
-                except Exception as e:
-                    logger.error(f"   ⚠️ Mesaj işleme hatası: {e}")
-                    bot_stats.increment("gecmis_tarama_hata")
-                
-                # Rate limit
-                await asyncio.sleep(1)
-            
-            logger.info(f"   ✅ {kanal_adi}: {sayac} mesaj işlendi")
+            sayac = await _kanal_tara(kanal_id, zorla_modu)
+            toplam_islem += sayac
+            logger.info(f"   ✅ {kanal_adi}: {sayac} mesaj hatta verildi")
         
         except Exception as e:
             logger.error(f"   ⚠️ Kanal hatası ({kanal_adi}): {e}", exc_info=True)
             continue
     
+    # Hattaki son mesajlar da düzenlenip kaydedilsin, noktalar son haline gelsin
+    await mesaj_hatti.bosalt()
+    for kanal_id in settings.HEDEF_KANALLAR:
+        nokta = _tarama_noktalari.get(kanal_id)
+        if nokta:
+            await _tarama_noktasi_yaz(kanal_id, nokta)
+    
     tarama_suresi = (datetime.now() - tarama_baslangic).total_seconds()
     
     logger.info(f"\n{'='*60}")
@@ -247,6 +448,38 @@ async def gecmis_tarama(zorla_modu: bool = False):
     bot_stats.set("son_tarama_islem_sayisi", toplam_islem)
 
 
+# ==================== KATALOG SNAPSHOT ====================
+
+async def snapshot_dongusu():
+    """Katalog snapshot'ını periyodik olarak yeniden üret"""
+    aralik = settings.SNAPSHOT_YENILEME_SAAT * 3600
+    
+    while True:
+        yas = time.time() - katalog_snapshot.olusturma
+        if not katalog_snapshot.acik or yas >= aralik:
+            try:
+                baslangic = time.monotonic()
+                sayi = await snapshot_yenile()
+                logger.info(
+                    f"🗂️ Snapshot üretildi: {sayi} anahtar "
+                    f"({time.monotonic() - baslangic:.1f}s)"
+                )
+            except Exception as e:
+                logger.error(f"❌ Snapshot üretim hatası: {e}", exc_info=True)
+            yas = 0
+        
+        await asyncio.sleep(max(60, aralik - yas))
+
+
+# ==================== ZENGİNLEŞTİRME MODELİ ====================
+
+async def model_kayit_dongusu():
+    """Zenginleştirme planlayıcı modelini değiştikçe periyodik olarak yaz"""
+    while True:
+        await asyncio.sleep(KAYIT_ARALIGI)
+        await enrichment_planner.kaydet()
+
+
 # ==================== ANA FONKSİYON ====================
 
 async def main():
@@ -266,6 +499,17 @@ async def main():
     bot_stats.set("baslangic_zamani", datetime.now().isoformat())
     bot_stats.set("surum", settings.SURUM)
     
+    # Salt okunur katalog snapshot'ı (mmap, yükleme yok); üretildikten sonra
+    # veritabanına yazılmışsa eski kayıt sunmaması için kapatılıp yeniden üretilir
+    if not katalog_snapshot.ac():
+        logger.info("ℹ️  Katalog snapshot'ı yok, arka planda üretilecek")
+    elif await db.son_yazma_zamani() >= int(katalog_snapshot.olusturma):
+        katalog_snapshot.kapat()
+        logger.info("ℹ️  Katalog snapshot'ı veritabanından eski, arka planda yeniden üretilecek")
+    
+    # Önceki çalışmadan kalan mesaj önbelleği (ayarlıysa)
+    MessageHandler.onbellegi_yukle()
+    
     # Client'ı başlat
     try:
         await client.start()
@@ -275,7 +519,7 @@ async def main():
     
     # Bot bilgileri
     try:
-        me = await client.get_me()
+        me = await tg_zamanlayici.cagir(None, client.get_me)
         logger.info(f"👤 Giriş Yapıldı: {me.first_name}")
         logger.info(f"📱 Telefon: +{me.phone}")
         if me.username:
@@ -301,6 +545,9 @@ async def main():
     logger.info("🚀 BOT AKTİF!")
     logger.info(f"{'='*60}\n")
     
+    asyncio.create_task(snapshot_dongusu())
+    asyncio.create_task(model_kayit_dongusu())
+    
     # Geçmiş tarama
     if settings.GECMIS_TARAMA_AKTIF:
         logger.info("⏳ Geçmiş tarama aktif, arka planda başlatılıyor...\n")
@@ -316,7 +563,12 @@ async def main():
     logger.info(f"   Stats dosyası: logs/stats.json\n")
     
     # Sürekli çalış
-    await client.run_until_disconnected()
+    try:
+        await client.run_until_disconnected()
+    finally:
+        await mesaj_hatti.kapat()
+        MessageHandler.onbellegi_kaydet()
+        await enrichment_planner.kaydet()
 
 
 if __name__ == '__main__':
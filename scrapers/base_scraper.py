@@ -1,11 +1,13 @@
 """Temel scraper"""
 import requests
 import logging
+import threading
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
 from bs4 import BeautifulSoup
 from config.constants import HEADERS
 from config.settings import settings
+from utils.deadline import butce_doldu, istek_zaman_asimi
 
 try:
     import cloudscraper
@@ -27,17 +29,35 @@ class BaseScraper(ABC):
         else:
             self.scraper = None
         self.timeout = settings.REQUEST_TIMEOUT
+        # Thread başına: izlenen çağrıda yanıtsız kalan istek oldu mu
+        self._istek_durumu = threading.local()
+    
+    def istek_izlemeyi_baslat(self):
+        """Bu thread'deki sonraki istekler için hata işaretini sıfırla"""
+        self._istek_durumu.hata = False
+    
+    def istek_hatasi_oldu(self) -> bool:
+        """İzleme başladığından beri atlanan (bütçe) ya da hata veren istek oldu mu"""
+        return getattr(self._istek_durumu, "hata", False)
+    
+    def _zaman_asimi(self) -> float:
+        """İstek zaman aşımı (mesajın kalan zaman bütçesiyle sınırlı)"""
+        return istek_zaman_asimi(self.timeout)
     
     def get_response(self, url: str, use_scraper: bool = True) -> Optional[requests.Response]:
+        if butce_doldu(f"{self.get_name()} isteği"):
+            self._istek_durumu.hata = True
+            return None
         try:
             if use_scraper and self.scraper:
-                response = self.scraper.get(url, timeout=self.timeout)
+                response = self.scraper.get(url, timeout=self._zaman_asimi())
             else:
-                response = self.session.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=self._zaman_asimi())
             response.raise_for_status()
             return response
         except Exception as e:
             logger.error(f"❌ HTTP hatası: {e}")
+            self._istek_durumu.hata = True
             return None
     
     def parse_html(self, response: requests.Response) -> Optional[BeautifulSoup]:
@@ -1,6 +1,6 @@
 import json
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from urllib.parse import quote_plus
 from datetime import datetime
 import logging
@@ -72,6 +72,58 @@ class GoodreadsScraper(BaseScraper):
             logger.error(f"❌ Goodreads arama hatası: {e}")
             return None
     
+    def fetch_series(self, series_url: str) -> List[Dict[str, Any]]:
+        """
+        Goodreads seri sayfasındaki ciltleri çek
+        
+        Args:
+            series_url: https://www.goodreads.com/series/... linki
+        
+        Returns:
+            [{"cilt_no": "1", "baslik": "...", "link": "..."}, ...]
+            (yalnızca tam sayı numaralı ana ciltler)
+        """
+        try:
+            response = self.get_response(series_url)
+            if not response:
+                return []
+            response.encoding = 'utf-8'
+            soup = self.parse_html(response)
+            if not soup:
+                return []
+            
+            ciltler = {}
+            for item in soup.select('div.listWithDividers__item'):
+                baslik_h3 = item.select_one('h3')
+                link_tag = item.select_one('a[href*="/book/show/"]')
+                if not baslik_h3 or not link_tag:
+                    continue
+                
+                no_match = re.match(r'^\s*(?:Book|Kitap)\s+(\d+)\s*$', baslik_h3.get_text(), re.IGNORECASE)
+                if not no_match:
+                    continue
+                cilt_no = no_match.group(1)
+                if cilt_no in ciltler:
+                    continue
+                
+                ad_tag = item.select_one('span[itemprop="name"]') or link_tag
+                link = link_tag['href']
+                if not link.startswith("http"):
+                    link = self.BASE_URL + link
+                
+                ciltler[cilt_no] = {
+                    "cilt_no": cilt_no,
+                    "baslik": metin_duzelt(ad_tag.get_text()),
+                    "link": link.split('?')[0],
+                }
+            
+            logger.info(f"📚 Goodreads seri sayfası: {len(ciltler)} cilt")
+            return list(ciltler.values())
+            
+        except Exception as e:
+            logger.error(f"❌ Goodreads seri hatası: {e}")
+            return []
+    
     def _parse_detail_page(self, soup, link: str) -> Optional[Dict[str, Any]]:
         """Detay sayfasını parse et"""
         data = veri_kalibi()
@@ -150,7 +202,7 @@ class GoodreadsScraper(BaseScraper):
                     series_info = series_list[0]
                     series_name = series_info.get("series", {}).get("title")
                     if series_name:
-                        data["seri"] = metin_duzelt(series_name)
+                        parsed["seri"] = metin_duzelt(series_name)
             
             # ➕ Orijinal başlık (ÖNEMLİ!)
             if book_data.get("details"):
@@ -164,6 +216,12 @@ class GoodreadsScraper(BaseScraper):
                         parsed["orijinal_ad"] = original_title
                         logger.info(f"🌍 Orijinal Ad: {parsed['orijinal_ad']}")
             
+            # Eser (work) kimliği: farklı baskılar aynı esere bağlanır
+            work_ref = (book_data.get("work") or {}).get("__ref")
+            if work_ref:
+                work_data = apollo_state.get(work_ref) or {}
+                parsed["eser_id"] = str(work_data.get("legacyId") or work_ref)
+            
             # Work referansından da dene
             if not parsed.get("orijinal_ad") and book_data.get("work"):
                 work_ref = book_data["work"].get("__ref")
@@ -276,6 +334,9 @@ class GoodreadsScraper(BaseScraper):
                     series_title = apollo_state[series_ref].get("title")
                     if series_title:
                         parsed["seri"] = f"{series_title} #{series_pos}" if series_pos else series_title
+                    series_url = apollo_state[series_ref].get("webUrl")
+                    if series_url:
+                        parsed["seri_url"] = series_url
             
             # Detaylar
             details = book_data.get("details", {})
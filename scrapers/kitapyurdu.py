@@ -122,7 +122,9 @@ class KitapyurduScraper(BaseScraper):
             link = ilk_kitap.select_one('a')['href']
             
             # Detay sayfasını çek
-            detay_res = self.session.get(link, timeout=self.timeout)
+            detay_res = self.get_response(link, use_scraper=False)
+            if not detay_res:
+                return None
             try:
                 html_detay = detay_res.content.decode('utf-8')
             except:
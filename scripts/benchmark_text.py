@@ -0,0 +1,190 @@
+# scripts/benchmark_text.py
+"""
+Metin işleme mikro-benchmark'ları
+
+Kullanım:
+    python scripts/benchmark_text.py
+"""
+import difflib
+import html
+import re
+import sys
+import timeit
+from pathlib import Path
+
+import ftfy
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.constants import GURULTU_KELIMELERI
+from utils.text_utils import (
+    metni_temizle, turkce_kucult, gurultu_temizleyici, metin_duzelt,
+    _metin_duzelt_onbellekli,
+)
+from utils.similarity import BenzerlikMotoru, HAS_RAPIDFUZZ
+
+ORNEK_DOSYALAR = [
+    "Sarah_J_Maas_Cam_Sato_2_Karanlik_Tac_[cs]_v2.epub",
+    "C_S_Lewis_Narnia_Günlükleri_6_Gümüş_Sandalye.epub",
+    "Dostoyevski - Suç ve Ceza (İş Bankası Yayınları) 2019.pdf",
+    "Frank Herbert - Dune - Kum Gezegeni (Ithaki Yayınları) ocr_ham.pdf",
+    "Project_Hail_Mary_Andy_Weir_retail_ebook.epub",
+    "Orhan_Pamuk_Kar_okunmadı.epub",
+    "Tolkien-Yuzuklerin_Efendisi-Yuzuk_Kardesligi_baskı 3.pdf",
+]
+
+
+def _eski_metni_temizle(metin: str, manuel_mod: bool = False) -> str:
+    """Kelime başına re.sub yapan eski uygulama (karşılaştırma için)"""
+    saf_rakamlar = re.sub(r'[^\d]', '', metin)
+    if len(saf_rakamlar) in [10, 13]:
+        if re.match(r'^[\d\-\sX]+$', metin.strip(), re.IGNORECASE):
+            return saf_rakamlar
+    temiz = turkce_kucult(metin)
+    if not manuel_mod:
+        temiz = temiz.replace('.pdf', '').replace('.epub', '')
+        temiz = re.sub(r'\b(19|20)\d{2}\b', '', temiz)
+    temiz = re.sub(r'-km$', '', temiz)
+    temiz = re.sub(r'(\[|\(|\{|_|-|\s)+(cs|ham|bls)(\]|\)|\}|\b)', '', temiz)
+    temiz = temiz.replace('_okunmadı', '').replace('_okunmadi', '')
+    temiz = re.sub(r'\(.*?\)', '', temiz)
+    temiz = re.sub(r'\[.*?\]', '', temiz)
+    temiz = temiz.replace('_', ' ')
+    for kelime in GURULTU_KELIMELERI:
+        pattern = r'\b' + re.escape(kelime) + r'(\s+\d+)?\b'
+        temiz = re.sub(pattern, '', temiz)
+    if not manuel_mod:
+        parcalar = temiz.split('-')
+        if len(parcalar) >= 3:
+            yeni_metin = f"{parcalar[0]} {parcalar[-1]}"
+            temiz = " ".join(yeni_metin.split())
+        else:
+            temiz = temiz.replace('-', ' ')
+    return " ".join(temiz.split())
+
+
+def _eski_gurultu_mu(metin: str) -> bool:
+    return metin.lower().strip() in [g.lower() for g in GURULTU_KELIMELERI]
+
+
+# Tipik bir detay sayfasında metin_duzelt'e giden alanlar
+ORNEK_SAYFA_ALANLARI = [
+    "Sarah J. Maas", "Dostoyevski", "İş Bankası Kültür Yayınları", "Can Yayınları",
+    "Ithaki Yayınları", "Fantastik", "Bilim Kurgu", "Roman", "Klasikler",
+    "Sayfa Sayısı", "464", "Yayın Tarihi", "Ocak 2019", "9786053753421",
+    "Çevirmen", "Orijinal Adı", "Throne of Glass", "Cam Şato #2",
+    "Tom &amp; Jerry", "It’s “quoted”",
+    "<p>Ardan Krallığı'nın en korkulan suikastçısı Celaena Sardothien,"
+    " <b>Cam Şato</b>'da şampiyon olarak hizmet etmektedir.<br/>Ancak"
+    " kralın emirleri onu zor bir seçimle karşı karşıya bırakır.</p>",
+] * 3
+
+
+def _eski_metin_duzelt(metin: str) -> str:
+    """Her çağrıda BeautifulSoup + ftfy çalıştıran eski uygulama"""
+    if not metin:
+        return ""
+    try:
+        if "<" in str(metin) and ">" in str(metin):
+            soup = BeautifulSoup(str(metin), 'html.parser')
+            metin = soup.get_text(separator=' ')
+    except:
+        pass
+    metin = html.unescape(str(metin))
+    metin = ftfy.fix_text(metin)
+    metin = re.sub(r'\s+', ' ', metin).strip()
+    return metin.strip()
+
+
+def _olc(ad: str, func, tekrar: int) -> float:
+    sure = timeit.timeit(func, number=tekrar)
+    print(f"   {ad:<32} {sure / tekrar * 1e6:10.1f} µs/çağrı")
+    return sure
+
+
+def gurultu_benchmark(tekrar: int = 200):
+    print("🧹 Gürültü temizleme (metni_temizle)")
+
+    farklar = [d for d in ORNEK_DOSYALAR if _eski_metni_temizle(d) != metni_temizle(d)]
+    for d in farklar:
+        print(f"   ⚠️ Fark: {d!r}: {_eski_metni_temizle(d)!r} → {metni_temizle(d)!r}")
+
+    eski = _olc("eski (kelime başına re.sub)",
+                lambda: [_eski_metni_temizle(d) for d in ORNEK_DOSYALAR], tekrar)
+    yeni = _olc("yeni (ön kontrol + sıralı)",
+                lambda: [metni_temizle(d) for d in ORNEK_DOSYALAR], tekrar)
+    print(f"   ⚡ Hızlanma: {eski / yeni:.1f}x\n")
+
+    print("🔎 Tam token gürültü kontrolü")
+    tokenler = ["cs", "Yayınları", "dune", "v2", "kum gezegeni", "ISBN"]
+    eski = _olc("eski (liste yeniden kurulumu)",
+                lambda: [_eski_gurultu_mu(t) for t in tokenler], tekrar * 10)
+    yeni = _olc("yeni (frozenset)",
+                lambda: [gurultu_temizleyici.gurultu_mu(t) for t in tokenler], tekrar * 10)
+    print(f"   ⚡ Hızlanma: {eski / yeni:.1f}x\n")
+
+
+def metin_duzelt_benchmark(tekrar: int = 200):
+    print("🔤 metin_duzelt (sayfa başına alanlar)")
+
+    farklar = [a for a in ORNEK_SAYFA_ALANLARI if _eski_metin_duzelt(a) != metin_duzelt(a)]
+    for a in farklar:
+        print(f"   ⚠️ Fark: {a!r}")
+
+    eski = _olc("eski (BeautifulSoup + ftfy)",
+                lambda: [_eski_metin_duzelt(a) for a in ORNEK_SAYFA_ALANLARI], tekrar)
+
+    def soguk():
+        _metin_duzelt_onbellekli.cache_clear()
+        return [metin_duzelt(a) for a in ORNEK_SAYFA_ALANLARI]
+
+    yeni_soguk = _olc("yeni (önbellek boş)", soguk, tekrar)
+    yeni_sicak = _olc("yeni (önbellek dolu)",
+                      lambda: [metin_duzelt(a) for a in ORNEK_SAYFA_ALANLARI], tekrar)
+    print(f"   ⚡ Hızlanma: {eski / yeni_soguk:.1f}x (soğuk), {eski / yeni_sicak:.1f}x (sıcak)\n")
+
+
+def _eski_benzerlik_orani(a: str, b: str) -> float:
+    return difflib.SequenceMatcher(None, turkce_kucult(a), turkce_kucult(b)).ratio()
+
+
+def benzerlik_benchmark(tekrar: int = 20):
+    print("🧠 Benzerlik (difflib → BenzerlikMotoru)")
+
+    kisa = ("Cam Şato 2: Karanlık Taç", "Karanlık Taç (Cam Şato #2)")
+    uzun = (
+        "Yüzüklerin Efendisi 1: Yüzük Kardeşliği - Orta Dünya'nın Üçüncü Çağı "
+        "ve Tek Yüzük'ün Hikâyesi, Genişletilmiş Türkçe Basım",
+        "The Fellowship of the Ring: Being the First Part of The Lord of the "
+        "Rings - Yüzük Kardeşliği, Yüzüklerin Efendisi Birinci Kitap",
+    )
+    motorlar = [("python", BenzerlikMotoru(hizlandirma=False))]
+    if HAS_RAPIDFUZZ:
+        motorlar.append(("rapidfuzz", BenzerlikMotoru()))
+
+    for etiket, (a, b) in (("kısa başlık", kisa), ("uzun başlık", uzun)):
+        print(f"   [{etiket}]")
+        eski = _olc("difflib.SequenceMatcher",
+                    lambda: _eski_benzerlik_orani(a, b), tekrar * 50)
+        for ad, motor in motorlar:
+            yeni = _olc(f"{ad} oran", lambda: motor.oran(a, b), tekrar * 50)
+            print(f"   ⚡ {ad}: {eski / yeni:.1f}x")
+
+    adaylar = [f"{s} {i}" for i in range(100) for s in ORNEK_SAYFA_ALANLARI[:10]]
+    sorgu = "Karanlık Taç Sarah J Maas"
+    print(f"   [toplu: 1 sorgu × {len(adaylar)} aday]")
+    eski = _olc("difflib döngüsü",
+                lambda: max(adaylar, key=lambda c: _eski_benzerlik_orani(sorgu, c)), tekrar)
+    for ad, motor in motorlar:
+        yeni = _olc(f"{ad} en_iyi_eslesmeler",
+                    lambda: motor.en_iyi_eslesmeler(sorgu, adaylar, yontem="oran", limit=5),
+                    tekrar)
+        print(f"   ⚡ {ad}: {eski / yeni:.1f}x")
+    print()
+
+
+if __name__ == '__main__':
+    gurultu_benchmark()
+    metin_duzelt_benchmark()
+    benzerlik_benchmark()
@@ -2,18 +2,35 @@
 Kitap arama ve zenginleştirme servisi
 """
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable, AsyncIterator, List, Tuple
 from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import re
+import time
 
 from scrapers.kitapyurdu import KitapyurduScraper
 from scrapers.goodreads import GoodreadsScraper
 from scrapers.binkitap import BinKitapScraper
+from config.settings import settings
+from config.constants import ALAN_TTL_SAAT
 from utils.async_utils import run_sync
-from utils.text_utils import metin_duzelt, benzerlik_orani
+from utils.deadline import butce_doldu, zaman_butcesi, aktif_butce, butcesiz
+from utils.statistics import bot_stats
+from services.enrichment_planner import enrichment_planner
+from services.work_store import eserden_tamamla, eseri_kaydet
+from services.series_cache import seri_onbellegi
+from services.language_router import dil_yonlendirici
+from services.strategy_learner import strateji_ogrenici, dosya_deseni
+from services.manual_overrides import manuel_eslesmeler
+from services.catalog import katalog
+from database.snapshot import katalog_snapshot
+from services.freshness import (
+    zaman_damgala, deneme_damgala, bayat_alanlar, kaynaklara_gore_grupla,
+    kaynak_linki_kaydet, kaynak_linki,
+)
+from utils.rate_limiter import host_limiter
+from utils.text_utils import metin_duzelt, benzerlik_orani, gurultu_temizleyici, metni_temizle
 from utils.series_utils import translate_series_name, prefer_turkish_series
-from config.constants import GURULTU_KELIMELERI
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +38,12 @@ logger = logging.getLogger(__name__)
 class BookService:
     """Kitap arama ve zenginleştirme servisi"""
     
+    KAYNAK_ADLARI = {
+        'kitapyurdu': "Kitapyurdu",
+        'goodreads': "Goodreads",
+        'binkitap': "1000Kitap",
+    }
+    
     def __init__(self):
         self.scrapers = {
             'kitapyurdu': KitapyurduScraper(),
@@ -29,8 +52,11 @@ class BookService:
         }
         self.executor = ThreadPoolExecutor(max_workers=3)
         
-        # Gürültü kelimelerini regex pattern'e çevir (performans için)
-        self._gurultu_pattern = self._create_noise_pattern()
+        # Gürültü temizleyici (tek derlenmiş trie-regex + frozenset, paylaşımlı)
+        self._gurultu = gurultu_temizleyici
+        
+        # Liste ön getirmesi süren seriler (seri başına tek görev)
+        self._seri_on_getirme: Dict[str, asyncio.Task] = {}
         
         # Kitapyurdu URL pattern
         self._kitapyurdu_url_pattern = re.compile(
@@ -38,12 +64,6 @@ class BookService:
             re.IGNORECASE
         )
     
-    def _create_noise_pattern(self) -> re.Pattern:
-        """Gürültü kelimelerinden tek bir regex pattern oluştur"""
-        escaped_words = [re.escape(word) for word in GURULTU_KELIMELERI]
-        pattern_str = r'\b(' + '|'.join(escaped_words) + r')\b'
-        return re.compile(pattern_str, re.IGNORECASE | re.UNICODE)
-    
     def _extract_kitapyurdu_id(self, text: str) -> Optional[str]:
         """
         Metinden Kitapyurdu kitap ID'sini çıkar
@@ -80,12 +100,50 @@ class BookService:
             return False
         return 'kitapyurdu.com/kitap/' in text.lower()
     
+    def _link_kaynagi(self, url: str) -> Optional[str]:
+        """Linkin hangi scraper'a ait olduğunu bul (kitapyurdu/goodreads/binkitap)"""
+        if not url:
+            return None
+        url_lower = url.lower()
+        if 'kitapyurdu.com' in url_lower:
+            return 'kitapyurdu'
+        if 'goodreads.com' in url_lower:
+            return 'goodreads'
+        if '1000kitap.com' in url_lower:
+            return 'binkitap'
+        return None
+    
+    async def _scrape(self, kaynak: str, func, *args, dusuk_oncelik: bool = False, **kwargs):
+        """
+        Scraper çağrısını host limiti altında thread'de çalıştır
+        
+        Args:
+            kaynak: Scraper anahtarı (host limiti bu ada göre uygulanır)
+            func: Senkron scraper metodu
+            dusuk_oncelik: Ön getirme gibi arka plan işleri için True
+        """
+        async with host_limiter.slot(kaynak, dusuk_oncelik=dusuk_oncelik):
+            return await run_sync(func, *args, **kwargs)
+    
+    @staticmethod
+    def _izlenen_arama(scraper, sorgu: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Scraper araması (thread'de) + sonucun kesinliği
+
+        Returns:
+            (sonuç, kesin): kesin=False ise bir istek atlandı / hata verdi,
+            boş sonuç "bulunamadı" anlamına gelmez
+        """
+        scraper.istek_izlemeyi_baslat()
+        sonuc = scraper.search(sorgu)
+        return sonuc, not scraper.istek_hatasi_oldu()
+    
     def _temizle_gurultu(self, text: str) -> str:
         """Metinden gürültü kelimelerini temizle"""
         if not text:
             return text
         
-        temiz = self._gurultu_pattern.sub(' ', text)
+        temiz = self._gurultu.temizle(text)
         temiz = re.sub(r'[_\-\.]+', ' ', temiz)
         temiz = re.sub(r'\[([^\]]*)\]', lambda m: '' if self._is_noise(m.group(1)) else m.group(0), temiz)
         temiz = re.sub(r'\(([^\)]*)\)', lambda m: '' if self._is_noise(m.group(1)) else m.group(0), temiz)
@@ -108,7 +166,7 @@ class BookService:
         if re.match(r'^[\d\s\.\-_]+$', text_lower):
             return True
         
-        return text_lower in [g.lower() for g in GURULTU_KELIMELERI]
+        return self._gurultu.gurultu_mu(text_lower)
     
     async def search_book(
         self, 
@@ -133,6 +191,17 @@ class BookService:
         """
         logger.info(f"🔎 Aranıyor (ham): {query[:100] if query else 'N/A'}...")
         
+        # ============================================
+        # 📌 ELLE SABİTLENMİŞ EŞLEŞME
+        # Admin bu dosya adını / ISBN'i bir linke sabitlediyse arama
+        # zinciri çalışmaz, doğrudan o link çekilir
+        # ============================================
+        if not book_id and not direct_url and (query or isbn):
+            sabit_url = await manuel_eslesmeler.bul(query, isbn)
+            if sabit_url:
+                bot_stats.increment("manuel_eslesme_kullanimi")
+                direct_url = sabit_url
+        
         # ============================================
         # 🔗 ÖNCELİK SIRASI: 
         # 1. book_id parametresi (en yüksek)
@@ -167,21 +236,31 @@ class BookService:
                 kitapyurdu_data = await self._fetch_by_id(book_id)
                 
                 if kitapyurdu_data:
-                    kaynak = "Kitapyurdu"
-                    kitapyurdu_data["kaynak"] = kaynak
-                    logger.info(f"✅ Bulundu: {kaynak} - {kitapyurdu_data.get('baslik', 'N/A')}")
-                    
-                    if not manuel_mod:
-                        enriched_data = await self._enrich_data(kitapyurdu_data)
-                        return (enriched_data, kaynak, True)
-                    else:
-                        logger.info("ℹ️ Manuel mod, zenginleştirme atlandı")
-                        return (kitapyurdu_data, kaynak, True)
+                    return await self._tamamla(kitapyurdu_data, 'kitapyurdu', manuel_mod)
                 else:
                     logger.warning(f"⚠️ ID ile bulunamadı: {book_id}")
             except Exception as e:
                 logger.error(f"❌ ID ile çekme hatası: {e}")
         
+        # ============================================
+        # 🔗 GOODREADS / 1000KİTAP LİNKİ
+        # ============================================
+        link_kaynagi = self._link_kaynagi(direct_url)
+        if link_kaynagi in ('goodreads', 'binkitap'):
+            logger.info(f"🔗 {link_kaynagi} linki ile direkt çekiliyor: {direct_url}")
+            try:
+                link_data = await self._scrape(
+                    link_kaynagi,
+                    self.scrapers[link_kaynagi].search,
+                    "",
+                    direct_url=direct_url
+                )
+                if link_data:
+                    return await self._tamamla(link_data, link_kaynagi, manuel_mod)
+                logger.warning(f"⚠️ Link ile bulunamadı: {direct_url}")
+            except Exception as e:
+                logger.error(f"❌ Link ile çekme hatası: {e}")
+        
         # ============================================
         # 🔍 NORMAL ARAMA
         # ============================================
@@ -200,26 +279,58 @@ class BookService:
         logger.info(f"🧹 Temizlenmiş sorgu: {temiz_query}")
         
         try:
+            # Snapshot: dosya adı / ISBN anahtarıyla salt okunur kayıt (mmap)
+            snapshot_data = self._snapshottan_getir(query, isbn)
+            if snapshot_data:
+                bot_stats.increment("snapshot_isabet")
+                logger.info(f"🗂️ Snapshot'ta bulundu: {snapshot_data.get('baslik')}")
+                return (snapshot_data, snapshot_data.get("kaynak") or "Katalog", True)
+            
+            # Daha önce çözülmüş kitapsa yerel katalogdan (ağa çıkmadan) döner
+            katalog_isbn = isbn
+            if not katalog_isbn and re.fullmatch(r'\d{10}|\d{13}', temiz_query):
+                katalog_isbn = temiz_query
+            katalog_sonucu = await katalog.bul(
+                temiz_query, katalog_isbn, esik=settings.KATALOG_GUVEN_ESIGI
+            )
+            if katalog_sonucu:
+                katalog_data, guven = katalog_sonucu
+                bot_stats.increment("katalog_isabet")
+                logger.info(f"📇 Katalogda bulundu (güven {guven:.2f}): {katalog_data.get('baslik')}")
+                return (katalog_data, katalog_data.get("kaynak") or "Katalog", True)
+            
+            # Bilinen serinin kardeş cildi ise arama zinciri atlanır
+            seri_sonucu = None if isbn else await self._seriden_coz(temiz_query)
+            if seri_sonucu:
+                return await self._tamamla(seri_sonucu[0], seri_sonucu[1], manuel_mod)
+            
+            # İngilizce sorgular önce Goodreads'te, Kitapyurdu'nda ise kısa zincirle aranır
+            strateji_limiti = None
+            if not isbn and await dil_yonlendirici.goodreads_once_mi(temiz_query):
+                bot_stats.increment("dil_yonlendirme_en")
+                tam_zincir = len(self._strateji_listesi(temiz_query))
+                goodreads_data = await self._search_goodreads(temiz_query)
+                if goodreads_data:
+                    bot_stats.increment("dil_yonlendirme_dogru")
+                    bot_stats.increment("dil_tasarruf_istek", max(0, tam_zincir - 1))
+                    return await self._tamamla(goodreads_data, 'goodreads', manuel_mod)
+                bot_stats.increment("dil_yonlendirme_yanlis")
+                strateji_limiti = settings.EN_KITAPYURDU_STRATEJI
+                # Atlanan stratejiler eksi fazladan yapılan Goodreads isteği
+                bot_stats.increment(
+                    "dil_tasarruf_istek", max(0, tam_zincir - strateji_limiti - 1)
+                )
+            
             # Kitapyurdu'da ara
-            kitapyurdu_data = await self._search_kitapyurdu(temiz_query, isbn)
+            kitapyurdu_data = await self._search_kitapyurdu(
+                temiz_query, isbn, strateji_limiti, desen=dosya_deseni(query)
+            )
             
             if not kitapyurdu_data:
                 logger.warning(f"❌ Hiçbir kaynakta bulunamadı: {temiz_query}")
                 return (None, "Yok", False)
             
-            # Kaynak bilgisi
-            kaynak = "Kitapyurdu"
-            kitapyurdu_data["kaynak"] = kaynak
-            
-            logger.info(f"✅ Bulundu: {kaynak} - {kitapyurdu_data.get('baslik', 'N/A')}")
-            
-            # Zenginleştirme
-            if not manuel_mod:
-                enriched_data = await self._enrich_data(kitapyurdu_data)
-                return (enriched_data, kaynak, True)
-            else:
-                logger.info("ℹ️ Manuel mod, zenginleştirme atlandı")
-                return (kitapyurdu_data, kaynak, True)
+            return await self._tamamla(kitapyurdu_data, 'kitapyurdu', manuel_mod)
         
         except Exception as e:
             logger.error(f"❌ Arama hatası: {e}")
@@ -227,6 +338,126 @@ class BookService:
             traceback.print_exc()
             return (None, "Hata", False)
 
+    async def _tamamla(self, data: Dict[str, Any], kaynak_anahtari: str, manuel_mod: bool):
+        """
+        Bulunan kaydı işaretle, gerekirse zenginleştir ve sonuç tuple'ı döndür
+        
+        Args:
+            data: Scraper sonucu
+            kaynak_anahtari: Kaydı bulan scraper ('kitapyurdu', 'goodreads', 'binkitap')
+            manuel_mod: True ise zenginleştirme atlanır
+        """
+        kaynak = self.KAYNAK_ADLARI[kaynak_anahtari]
+        data["kaynak"] = kaynak
+        kaynak_linki_kaydet(data, kaynak_anahtari, data.get("link"))
+        if data.get("seri_url"):
+            data["_seri_url"] = data.pop("seri_url")
+            data.setdefault("_seri_orijinal", data.get("seri"))
+        logger.info(f"✅ Bulundu: {kaynak} - {data.get('baslik', 'N/A')}")
+        
+        if not manuel_mod:
+            data = await self._enrich_data(data)
+        else:
+            logger.info("ℹ️ Manuel mod, zenginleştirme atlandı")
+        
+        # Boş kalan değişken alanlar denenmiş sayılır: BOS_ALAN_TTL_SAAT dolunca
+        # (manuel modda da) arka planda bir kez yenilenir, her sunumda değil
+        deneme_damgala(data, [a for a in ALAN_TTL_SAAT if not data.get(a)])
+        zaman_damgala(data)
+        if not manuel_mod:
+            await eseri_kaydet(data)
+        await katalog.kaydet(data)
+        await self._seriyi_kaydet(data, kaynak_anahtari)
+        await dil_yonlendirici.yazar_kaydet(data)
+        return (data, kaynak, True)
+    
+    def _snapshottan_getir(self, query: str, isbn: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Ham sorgunun dosya / ISBN anahtarını salt okunur snapshot'ta ara
+        
+        search_book / search_many içindir; canlı mesajlar aynı dosya: kaydını
+        zaten veritabanından okur. Snapshot'tan sonra yazılan anahtarlar
+        geçersiz sayılır, sabitlemeler bu aramadan önce uygulanır.
+        """
+        if not katalog_snapshot.acik:
+            return None
+        
+        anahtarlar = []
+        temiz_isbn = re.sub(r'\D', '', isbn or "")
+        if len(temiz_isbn) in (10, 13):
+            anahtarlar.append(f"isbn:{temiz_isbn}")
+        parmak_izi = metni_temizle(query) if query else ""
+        if parmak_izi:
+            anahtarlar.append(f"dosya:{parmak_izi}")
+        
+        for anahtar in anahtarlar:
+            data = katalog_snapshot.getir(anahtar)
+            if data and data.get("baslik"):
+                return data
+        return None
+    
+    async def _seriyi_kaydet(self, data: Dict[str, Any], kaynak_anahtari: str):
+        """Kitabı seri önbelleğine işle, seri listesi yoksa arka planda çek"""
+        try:
+            seri_id = await seri_onbellegi.kitabi_kaydet(data, kaynak_anahtari)
+            if not seri_id or seri_id in self._seri_on_getirme:
+                return
+            
+            liste_url = await seri_onbellegi.liste_gerekli(seri_id)
+            if liste_url:
+                # Ön getirme mesajın zaman bütçesini ve iptalini devralmaz
+                with butcesiz():
+                    gorev = asyncio.create_task(self._seri_listesini_getir(seri_id, liste_url))
+                self._seri_on_getirme[seri_id] = gorev
+        except Exception as e:
+            logger.debug(f"Seri önbelleği hatası: {e}")
+    
+    async def _seri_listesini_getir(self, seri_id: str, liste_url: str):
+        """Goodreads seri sayfasını düşük öncelikle çekip tüm ciltleri kaydet"""
+        try:
+            scraper = self.scrapers['goodreads']
+            ciltler = await self._scrape(
+                'goodreads', scraper.fetch_series, liste_url, dusuk_oncelik=True
+            )
+            if ciltler:
+                await seri_onbellegi.listeyi_kaydet(seri_id, ciltler, 'goodreads')
+                bot_stats.increment("seri_listesi_cekildi")
+                logger.info(f"📚 Seri listesi kaydedildi: {seri_id} ({len(ciltler)} cilt)")
+        except Exception as e:
+            logger.error(f"❌ Seri listesi hatası ({seri_id}): {e}")
+        finally:
+            self._seri_on_getirme.pop(seri_id, None)
+    
+    async def _seriden_coz(self, sorgu: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Sorgu bilinen bir serinin cildiyse doğrudan linkinden çek
+        
+        Returns:
+            (kitap_verisi, kaynak_anahtari) veya None
+        """
+        cilt = await seri_onbellegi.cilt_bul(sorgu)
+        if not cilt:
+            return None
+        
+        logger.info(f"📚 Seri önbelleği: {cilt['seri_id']} #{cilt['cilt_no']} → {cilt['kaynak']}")
+        kaynak = cilt["kaynak"]
+        try:
+            if kaynak == 'kitapyurdu':
+                kitap_id = self._extract_kitapyurdu_id(cilt["link"])
+                data = await self._fetch_by_id(kitap_id) if kitap_id else None
+            else:
+                data = await self._scrape(
+                    kaynak, self.scrapers[kaynak].search, "", direct_url=cilt["link"]
+                )
+        except Exception as e:
+            logger.debug(f"Seri cildi çekme hatası: {e}")
+            return None
+        
+        if not data:
+            return None
+        bot_stats.increment("seri_yerel_eslesme")
+        return data, kaynak
+    
     async def _fetch_by_id(self, book_id: str) -> Optional[Dict[str, Any]]:
         """Kitap ID'si ile direkt çek"""
         scraper = self.scrapers.get('kitapyurdu')
@@ -235,35 +466,42 @@ class BookService:
             return None
         
         try:
-            result = await run_sync(scraper.fetch_by_id, book_id)
+            result = await self._scrape('kitapyurdu', scraper.fetch_by_id, book_id)
             return result
         except Exception as e:
             logger.error(f"❌ fetch_by_id hatası: {e}")
             return None
 
-    async def _search_kitapyurdu(
-        self, 
-        query: str, 
-        isbn: str = None
-    ):
-        """Kitapyurdu'da akıllı arama (ID/URL kontrolü zaten yapıldı)"""
+    async def _search_goodreads(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        İngilizce sorguyu Goodreads'te ara
         
-        scraper = self.scrapers.get('kitapyurdu')
-        if not scraper:
-            logger.error("❌ Kitapyurdu scraper bulunamadı")
+        İlk sonuç sorguya yeterince benzemiyorsa (başlık + yazar) reddedilir.
+        """
+        if butce_doldu("Goodreads (dil yönlendirme)"):
             return None
         
-        # ISBN varsa ISBN ile ara
-        if isbn:
-            try:
-                result = await run_sync(scraper.search, isbn)
-                if result:
-                    logger.info(f"✅ ISBN ile bulundu: {isbn}")
-                    return result
-            except Exception as e:
-                logger.debug(f"ISBN araması başarısız: {e}")
+        try:
+            data = await self._scrape('goodreads', self.scrapers['goodreads'].search, query)
+        except Exception as e:
+            logger.debug(f"Goodreads (dil yönlendirme) hatası: {e}")
+            return None
         
-        # Arama stratejileri
+        if not data or not data.get("baslik"):
+            return None
+        
+        bulunan = f"{data.get('baslik', '')} {data.get('yazar', '')}"
+        if benzerlik_orani(query, bulunan) < 0.5:
+            logger.info(f"⚠️ Goodreads sonucu sorguya benzemiyor: {data.get('baslik')}")
+            return None
+        return data
+    
+    def _strateji_listesi(self, query: str) -> List[Tuple[str, str]]:
+        """
+        Kitapyurdu arama stratejileri (ad, sorgu) - varsayılan öncelik sırasıyla
+        
+        Aynı sorguyu üreten stratejilerden yalnızca ilki tutulur.
+        """
         strategies = []
         
         if query and len(query) >= 3:
@@ -308,19 +546,82 @@ class BookService:
             if len(son_iki) >= 5:
                 strategies.append(("Son 2 kelime", son_iki))
         
+        tekil = []
+        gorulen = set()
+        for strateji_adi, sorgu in strategies:
+            anahtar = ' '.join(sorgu.lower().split())
+            if len(anahtar) < 3 or anahtar in gorulen:
+                continue
+            gorulen.add(anahtar)
+            tekil.append((strateji_adi, sorgu))
+        return tekil
+
+    async def _search_kitapyurdu(
+        self, 
+        query: str, 
+        isbn: str = None,
+        strateji_limiti: int = None,
+        desen: str = None
+    ):
+        """
+        Kitapyurdu'da akıllı arama (ID/URL kontrolü zaten yapıldı)
+        
+        Args:
+            query: Temizlenmiş sorgu
+            isbn: ISBN (varsa önce onunla aranır)
+            strateji_limiti: Denenecek en fazla strateji (None = hepsi)
+            desen: Ham dosya adının deseni (strateji sırası buna göre öğrenilir)
+        """
+        
+        scraper = self.scrapers.get('kitapyurdu')
+        if not scraper:
+            logger.error("❌ Kitapyurdu scraper bulunamadı")
+            return None
+        
+        # ISBN varsa ISBN ile ara
+        if isbn:
+            try:
+                result = await self._scrape('kitapyurdu', scraper.search, isbn)
+                if result:
+                    logger.info(f"✅ ISBN ile bulundu: {isbn}")
+                    return result
+            except Exception as e:
+                logger.debug(f"ISBN araması başarısız: {e}")
+        
+        # Arama stratejileri
+        desen = desen or dosya_deseni(query)
+        strategies = await strateji_ogrenici.sirala(desen, self._strateji_listesi(query))
+        strategies = strategies[:strateji_limiti]
+        
         for index, (strateji_adi, sorgu) in enumerate(strategies, 1):
             if not sorgu or len(sorgu) < 3:
                 continue
             
+            if butce_doldu(f"Kitapyurdu stratejisi: {strateji_adi}"):
+                break
+            
             logger.info(f"🔍 [{index}/{len(strategies)}] {strateji_adi}: '{sorgu[:60]}...'")
             
+            bot_stats.increment("strateji_istegi")
+            baslangic = time.monotonic()
+            result, kesin = None, False
             try:
-                result = await run_sync(scraper.search, sorgu)
-                if result:
-                    logger.info(f"✅ {strateji_adi} ile bulundu!")
-                    return result
+                result, kesin = await self._scrape(
+                    'kitapyurdu', self._izlenen_arama, scraper, sorgu
+                )
             except Exception as e:
                 logger.debug(f"{strateji_adi} hatası: {e}")
+            
+            # Yalnızca bulunan ya da bütün istekleri yanıt alıp boş dönen
+            # strateji gözlemlenir; bütçe / ağ hatası stratejiye yazılmaz
+            if result or (kesin and not butce_doldu()):
+                await strateji_ogrenici.gozlem_kaydet(
+                    desen, strateji_adi, bool(result), time.monotonic() - baslangic
+                )
+            if result:
+                logger.info(f"✅ {strateji_adi} ile bulundu!")
+                bot_stats.increment("strateji_cozulen")
+                return result
         
         logger.warning(f"❌ {len(strategies)} aşamada da bulunamadı: {query[:60]}")
         return None
@@ -329,9 +630,39 @@ class BookService:
         """Kitap bilgilerini zenginleştir"""
         logger.info("✨ Zenginleştirme başlatılıyor...")
         
+        zenginlestiriciler = {
+            'goodreads': lambda d: self.enrich_with_goodreads(d, d.get("isbn")),
+            'binkitap': self.enrich_with_binkitap,
+        }
+        
         try:
-            data = await self.enrich_with_goodreads(data, data.get("isbn"))
-            data = await self.enrich_with_binkitap(data)
+            # Aynı eserin başka bir baskısı biliniyorsa ortak alanlar ağ isteği olmadan gelir
+            await eserden_tamamla(data)
+            
+            denenenler = set()
+            while True:
+                butce = aktif_butce()
+                kaynak = enrichment_planner.sonraki_kaynak(
+                    data,
+                    haric=denenenler,
+                    kalan_sure=butce.kalan() if butce else None
+                )
+                if not kaynak:
+                    break
+                if butce_doldu(f"{kaynak} zenginleştirme"):
+                    break
+                
+                denenenler.add(kaynak)
+                eksikler = enrichment_planner.eksik_alanlar(data)
+                baslangic = time.monotonic()
+                data = await zenginlestiriciler[kaynak](data)
+                enrichment_planner.gozlem_kaydet(
+                    kaynak, eksikler, data, time.monotonic() - baslangic
+                )
+            
+            atlananlar = set(zenginlestiriciler) - denenenler
+            if atlananlar and enrichment_planner.eksik_alanlar(data):
+                logger.info(f"ℹ️ Planlayıcı atladı: {', '.join(sorted(atlananlar))}")
             logger.info("✅ Zenginleştirme tamamlandı")
         except Exception as e:
             logger.error(f"❌ Zenginleştirme hatası: {e}")
@@ -364,7 +695,8 @@ class BookService:
                 logger.info(f"🔍 Goodreads'te aranıyor: {search_term}...")
                 
                 try:
-                    gr_result = await run_sync(
+                    gr_result = await self._scrape(
+                        'goodreads',
                         scraper.search, 
                         search_term, 
                         is_isbn_search=True
@@ -381,19 +713,25 @@ class BookService:
             if not gr_result:
                 search_term = f"{data.get('baslik', '')} {data.get('yazar', '')}".strip()
                 
-                if not search_term:
+                if not search_term or butce_doldu("Goodreads başlık araması"):
                     return data
                 
                 logger.info(f"🔍 Goodreads'te aranıyor: {search_term[:50]}...")
                 
                 try:
-                    gr_result = await run_sync(scraper.search, search_term)
+                    gr_result = await self._scrape('goodreads', scraper.search, search_term)
                 except Exception as e:
                     logger.debug(f"Goodreads arama hatası: {e}")
                     return data
             
             if gr_result:
                 updated = False
+                kaynak_linki_kaydet(data, 'goodreads', gr_result.get("link"))
+                if gr_result.get("seri_url"):
+                    data["_seri_url"] = gr_result["seri_url"]
+                    data["_seri_orijinal"] = gr_result.get("seri")
+                if gr_result.get("eser_id") and not data.get("eser_id"):
+                    data["eser_id"] = gr_result["eser_id"]
                 
                 if not data.get("orijinal_ad") and gr_result.get("orijinal_ad"):
                     data["orijinal_ad"] = gr_result["orijinal_ad"]
@@ -465,7 +803,7 @@ class BookService:
             scraper = self.scrapers['binkitap']
             
             try:
-                bk_result = await run_sync(scraper.search, search_term)
+                bk_result = await self._scrape('binkitap', scraper.search, search_term)
             except Exception as e:
                 logger.debug(f"1000Kitap arama hatası: {e}")
                 return data
@@ -481,6 +819,7 @@ class BookService:
                     return data
                 
                 updated = False
+                kaynak_linki_kaydet(data, 'binkitap', bk_result.get("link"))
                 
                 if not data.get("orijinal_ad") and bk_result.get("orijinal_ad"):
                     data["orijinal_ad"] = bk_result["orijinal_ad"]
@@ -509,6 +848,196 @@ class BookService:
         
         return data
     
+    async def yeniden_zenginlestir(self, data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Kayıtlı kitabın yalnızca süresi dolmuş değişken alanlarını yenile
+        
+        Başlık, yazar, ISBN gibi sabit alanlara dokunulmaz; tam arama yapılmaz.
+        Her kaynak için önce kayıtlı doğrudan link, yoksa ISBN, yoksa
+        başlık+yazar araması kullanılır.
+        
+        Args:
+            data: Daha önce kaydedilmiş kitap kaydı
+        
+        Returns:
+            (güncel_kayit, yenilenen_alanlar)
+        """
+        bayatlar = bayat_alanlar(data)
+        if not bayatlar:
+            logger.info("ℹ️ Tüm alanlar taze, istek atılmadı")
+            return data, []
+        
+        yenilenenler = []
+        for kaynak, alanlar in kaynaklara_gore_grupla(bayatlar).items():
+            if butce_doldu(f"{kaynak} yenileme"):
+                break
+            
+            logger.info(f"♻️ {kaynak} üzerinden yenileniyor: {', '.join(alanlar)}")
+            sonuc = await self._kaynaktan_cek(kaynak, data)
+            # Bütçe dolup çağrı yapılmadıysa deneme sayılmaz
+            if not sonuc and butce_doldu():
+                break
+            # Boş sonuç da deneme olarak damgalanır (her sunumda yeniden istenmesin)
+            deneme_damgala(data, alanlar)
+            if not sonuc:
+                continue
+            
+            kaynak_linki_kaydet(data, kaynak, sonuc.get("link"))
+            if sonuc.get("eser_id") and not data.get("eser_id"):
+                data["eser_id"] = sonuc["eser_id"]
+            bulunanlar = [alan for alan in alanlar if sonuc.get(alan)]
+            for alan in bulunanlar:
+                if sonuc[alan] != data.get(alan):
+                    data[alan] = sonuc[alan]
+                    yenilenenler.append(alan)
+            zaman_damgala(data, bulunanlar, zorla=True)
+        
+        if yenilenenler:
+            logger.info(f"✅ Yenilenen alanlar: {', '.join(yenilenenler)}")
+            await eseri_kaydet(data)
+            await katalog.kaydet(data)
+        return data, yenilenenler
+    
+    async def _kaynaktan_cek(self, kaynak: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Tek kaynaktan kitabı en ucuz yoldan çek (link > ISBN > başlık+yazar)"""
+        scraper = self.scrapers.get(kaynak)
+        if not scraper:
+            return None
+        
+        try:
+            link = kaynak_linki(data, kaynak)
+            if link:
+                return await self._scrape(kaynak, scraper.search, "", direct_url=link)
+            
+            if kaynak == 'goodreads' and data.get("isbn"):
+                sonuc = await self._scrape(
+                    kaynak, scraper.search, data["isbn"], is_isbn_search=True
+                )
+                if sonuc:
+                    return sonuc
+            
+            sorgu = f"{data.get('baslik', '')} {data.get('yazar', '')}".strip()
+            if not sorgu:
+                return None
+            sonuc = await self._scrape(kaynak, scraper.search, sorgu)
+            if not sonuc:
+                return None
+            # 1000Kitap başlık araması alakasız kitap döndürebilir
+            if kaynak == 'binkitap' and benzerlik_orani(data.get('baslik', ''), sonuc.get('baslik', '')) < 0.6:
+                return None
+            return sonuc
+        except Exception as e:
+            logger.debug(f"{kaynak} yenileme hatası: {e}")
+        
+        return None
+    
+    def _toplu_girdi(self, girdi: str, manuel_mod: bool) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Toplu arama girdisini sınıflandır
+        
+        Returns:
+            (tekillestirme_anahtari, kaynak_grubu, search_book_kwargs)
+        """
+        girdi = (girdi or "").strip()
+        
+        # Link
+        if re.match(r'^https?://', girdi, re.IGNORECASE):
+            kaynak = self._link_kaynagi(girdi) or 'kitapyurdu'
+            kitap_id = self._extract_kitapyurdu_id(girdi) if kaynak == 'kitapyurdu' else None
+            anahtar = f"kitapyurdu:{kitap_id}" if kitap_id else f"url:{girdi.lower()}"
+            return anahtar, kaynak, {
+                "query": "", "direct_url": girdi, "book_id": kitap_id, "manuel_mod": manuel_mod
+            }
+        
+        # ISBN
+        saf_rakamlar = re.sub(r'[^\dXx]', '', girdi)
+        if len(saf_rakamlar) in (10, 13) and re.match(r'^[\d\-\sX]+$', girdi, re.IGNORECASE):
+            return f"isbn:{saf_rakamlar.upper()}", 'kitapyurdu', {
+                "query": saf_rakamlar, "isbn": saf_rakamlar, "manuel_mod": manuel_mod
+            }
+        
+        # Dosya adı / serbest metin
+        anahtar = metni_temizle(girdi, manuel_mod) or girdi.lower()
+        return f"metin:{anahtar}", 'kitapyurdu', {"query": girdi, "manuel_mod": manuel_mod}
+    
+    async def search_many(
+        self,
+        items: Iterable[str],
+        manuel_mod: bool = False,
+        eszamanlilik: int = None
+    ) -> AsyncIterator[Tuple[str, tuple]]:
+        """
+        Çok sayıda dosya adı / link / ISBN'i toplu ara
+        
+        Aynı kitaba işaret eden girdiler tek aramaya indirgenir, girdiler
+        kaynak sitesine göre gruplanır ve her grup kendi eşzamanlılık
+        sınırıyla çalışır. Tüm scraper çağrıları host limitinden geçer.
+        
+        Args:
+            items: Dosya adları, kitap linkleri veya ISBN'ler
+            manuel_mod: True ise zenginleştirme atlanır
+            eszamanlilik: Kaynak grubu başına aynı anda işlenen kitap
+                (varsayılan: settings.TOPLU_ARAMA_ESZAMANLI)
+        
+        Yields:
+            (girdi, (kitap_bilgileri, kaynak, basarili)) - tamamlanma sırasıyla
+        
+        Examples:
+            >>> async for girdi, (bilgi, kaynak, basarili) in book_service.search_many(dosyalar):
+            ...     print(girdi, basarili)
+        """
+        eszamanlilik = eszamanlilik or settings.TOPLU_ARAMA_ESZAMANLI
+        
+        # Tekilleştir + grupla
+        esler: Dict[str, List[str]] = {}
+        gruplar: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        for girdi in items:
+            if not girdi or not str(girdi).strip():
+                continue
+            anahtar, kaynak, kwargs = self._toplu_girdi(str(girdi), manuel_mod)
+            if anahtar in esler:
+                esler[anahtar].append(girdi)
+                continue
+            esler[anahtar] = [girdi]
+            gruplar.setdefault(kaynak, []).append((anahtar, kwargs))
+        
+        if not esler:
+            return
+        
+        toplam = sum(len(v) for v in esler.values())
+        logger.info(
+            f"📦 Toplu arama: {toplam} girdi → {len(esler)} benzersiz, "
+            f"gruplar: {', '.join(f'{k}={len(v)}' for k, v in gruplar.items())}"
+        )
+        
+        kuyruk: asyncio.Queue = asyncio.Queue()
+        
+        async def _grup_calistir(isler: List[Tuple[str, Dict[str, Any]]]):
+            semafor = asyncio.Semaphore(eszamanlilik)
+            
+            async def _tek(anahtar: str, kwargs: Dict[str, Any]):
+                async with semafor:
+                    try:
+                        with zaman_butcesi(settings.MESAJ_ZAMAN_BUTCESI, anahtar):
+                            sonuc = await self.search_book(**kwargs)
+                    except Exception as e:
+                        logger.error(f"❌ Toplu arama hatası ({anahtar}): {e}")
+                        sonuc = (None, "Hata", False)
+                await kuyruk.put((anahtar, sonuc))
+            
+            await asyncio.gather(*(_tek(a, k) for a, k in isler))
+        
+        gorevler = [asyncio.create_task(_grup_calistir(isler)) for isler in gruplar.values()]
+        
+        try:
+            for _ in range(len(esler)):
+                anahtar, sonuc = await kuyruk.get()
+                for girdi in esler[anahtar]:
+                    yield girdi, sonuc
+        finally:
+            for gorev in gorevler:
+                gorev.cancel()
+    
     def close(self):
         """Kaynakları temizle"""
         self.executor.shutdown(wait=False)
@@ -0,0 +1,190 @@
+"""
+Yerel katalog araması
+Daha önce çözülmüş kitapları ağa çıkmadan (FTS5) bulur
+"""
+import logging
+import re
+from typing import Dict, Any, Optional, Tuple
+
+from database.db_manager import db
+from services.series_cache import seri_ayir
+from utils.similarity import normalize_et
+
+logger = logging.getLogger(__name__)
+
+# FTS'ten güven hesabına alınan en fazla aday
+ADAY_SAYISI = 20
+# Tek harfli kelimeler FTS sorgusuna katılmaz
+MIN_TOKEN_UZUNLUGU = 2
+
+# Katalog kaydına yazılmayan geçici alanlar
+_GECICI_ALANLAR = ("_katalog_anahtari", "_seri_url", "_seri_orijinal")
+
+
+def _tokenler(metin: str) -> frozenset:
+    return frozenset(normalize_et(metin).split())
+
+
+def katalog_anahtari(data: Dict[str, Any]) -> Optional[str]:
+    """Kitabın katalogdaki kimliği: kaynak linki, yoksa başlık|yazar"""
+    if data.get("link"):
+        return f"link:{data['link']}"
+    baslik = normalize_et(data.get("baslik") or "")
+    if not baslik:
+        return None
+    return f"ay:{baslik}|{normalize_et(data.get('yazar') or '')}"
+
+
+def _sayilar(tokenler: frozenset) -> frozenset:
+    return frozenset(str(int(t)) for t in tokenler if t.isdigit())
+
+
+def eslesme_guveni(sorgu_tokenleri: frozenset, data: Dict[str, Any]) -> float:
+    """
+    Sorgunun katalog kaydını gösterme güveni (0-1)
+
+    Başlığın (veya orijinal adın) bütün kelimeleri sorguda olmalı; güven,
+    sorgu kelimelerinin başlık + yazar + seri ile açıklanan oranıdır.
+    Böylece "Kar" sorgusu "Kar Tanesi" kaydına, fazla kelimeli bir sorgu da
+    yalnızca başlığı tutan alakasız bir kayda eşleşmez.
+
+    Sorgudaki her sayı kaydın başlığında veya cilt numarasında olmalı;
+    serinin başka cildi ("Açlık Oyunları 2" → 1. cilt kaydı) eşleşmez.
+
+    Examples:
+        >>> eslesme_guveni(_tokenler("Dostoyevski Suç ve Ceza"),
+        ...                {"baslik": "Suç ve Ceza", "yazar": "Fyodor Dostoyevski"})
+        1.0
+        >>> eslesme_guveni(_tokenler("Suzanne Collins Açlık Oyunları 2"),
+        ...                {"baslik": "Açlık Oyunları", "yazar": "Suzanne Collins",
+        ...                 "seri": "Açlık Oyunları #1"})
+        0.0
+    """
+    if not sorgu_tokenleri:
+        return 0.0
+
+    basliklar = [t for t in (_tokenler(data.get("baslik") or ""),
+                             _tokenler(data.get("orijinal_ad") or "")) if t]
+    if not any(baslik <= sorgu_tokenleri for baslik in basliklar):
+        return 0.0
+
+    sorgu_sayilari = _sayilar(sorgu_tokenleri)
+    if sorgu_sayilari:
+        _, cilt_no = seri_ayir(data.get("seri") or "")
+        kayit_sayilari = _sayilar(frozenset().union(*basliklar))
+        if cilt_no:
+            kayit_sayilari |= {cilt_no}
+        if not sorgu_sayilari <= kayit_sayilari:
+            return 0.0
+
+    aciklanan = _tokenler(
+        f"{data.get('baslik') or ''} {data.get('orijinal_ad') or ''} "
+        f"{data.get('yazar') or ''} {data.get('seri') or ''}"
+    )
+    return len(sorgu_tokenleri & aciklanan) / len(sorgu_tokenleri)
+
+
+class Katalog:
+    """
+    Çözülmüş kitapların FTS5 dizini
+
+    İlk kullanımda katalog boşsa mevcut kitap kayıtlarından doldurulur.
+
+    Examples:
+        >>> await katalog.kaydet(data)
+        >>> sonuc = await katalog.bul("Orhan Pamuk Kar", esik=0.8)
+    """
+
+    def __init__(self):
+        self._hazir = False
+
+    async def _hazirla(self):
+        if self._hazir:
+            return
+        self._hazir = True
+        if await db.katalog_sayisi():
+            return
+        kayitlar = [k for k in await db.kayitli_veriler() if k.get("baslik")]
+        for kayit in kayitlar:
+            await self.kaydet(kayit)
+        if kayitlar:
+            logger.info(f"📇 Katalog mevcut kayıtlardan dolduruldu: {len(kayitlar)} kitap")
+
+    async def kaydet(self, data: Dict[str, Any]) -> bool:
+        """Çözülmüş kitabı kataloğa işle"""
+        anahtar = katalog_anahtari(data)
+        if not anahtar or not data.get("baslik"):
+            return False
+        await self._hazirla()
+
+        alanlar = {
+            alan: normalize_et(str(data.get(alan) or ""))
+            for alan in ("baslik", "yazar", "orijinal_ad", "seri")
+        }
+        alanlar["isbn"] = re.sub(r'\D', '', str(data.get("isbn") or ""))
+        veri = {k: v for k, v in data.items() if k not in _GECICI_ALANLAR}
+        return await db.katalog_kaydet(anahtar, alanlar, veri)
+
+    async def bul(
+        self,
+        sorgu: str,
+        isbn: str = None,
+        esik: float = 0.8
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Sorguyu katalogda ara
+
+        Args:
+            sorgu: Temizlenmiş sorgu
+            isbn: ISBN (varsa tam eşleşme aranır)
+            esik: Kabul için en düşük güven
+
+        Returns:
+            (kitap_verisi, güven) veya None (eşleşme yok / belirsiz)
+        """
+        await self._hazirla()
+
+        temiz_isbn = re.sub(r'\D', '', isbn or "")
+        if len(temiz_isbn) in (10, 13):
+            adaylar = await db.katalog_ara(f'isbn : "{temiz_isbn}"', limit=1)
+            if adaylar:
+                return self._temizle(adaylar[0]), 1.0
+
+        sorgu_tokenleri = _tokenler(sorgu)
+        fts_tokenleri = [t for t in sorgu_tokenleri if len(t) >= MIN_TOKEN_UZUNLUGU]
+        if not fts_tokenleri:
+            return None
+
+        fts_sorgusu = " OR ".join(f'"{t}"' for t in fts_tokenleri)
+        adaylar = await db.katalog_ara(fts_sorgusu, limit=ADAY_SAYISI)
+
+        puanli = sorted(
+            ((eslesme_guveni(sorgu_tokenleri, aday), aday) for aday in adaylar),
+            key=lambda p: p[0],
+            reverse=True,
+        )
+        if not puanli or puanli[0][0] < esik:
+            return None
+
+        guven, en_iyi = puanli[0]
+        # Aynı güvende farklı bir kitap varsa (aynı adlı iki eser) karar verilmez
+        for diger_guven, diger in puanli[1:]:
+            if diger_guven < guven:
+                break
+            if (
+                normalize_et(diger.get("baslik") or "") != normalize_et(en_iyi.get("baslik") or "")
+                or normalize_et(diger.get("yazar") or "") != normalize_et(en_iyi.get("yazar") or "")
+            ):
+                logger.debug(f"📇 Katalogda belirsiz eşleşme: {sorgu[:60]}")
+                return None
+
+        return self._temizle(en_iyi), guven
+
+    @staticmethod
+    def _temizle(kayit: Dict[str, Any]) -> Dict[str, Any]:
+        kayit.pop("_katalog_anahtari", None)
+        return kayit
+
+
+# Global instance
+katalog = Katalog()
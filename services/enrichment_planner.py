@@ -0,0 +1,221 @@
+"""
+Maliyet farkındalıklı zenginleştirme planlayıcı
+Eksik alanlara göre hangi kaynağa (Goodreads / 1000Kitap) gidileceğini seçer
+"""
+import json
+import logging
+import os
+import random
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional, Set
+
+from utils.async_utils import run_sync
+
+logger = logging.getLogger(__name__)
+
+
+# Zenginleştirmenin doldurmaya çalıştığı alanlar
+ZENGINLESTIRME_ALANLARI = ("turu", "puan", "orijinal_ad", "seri", "cevirmen")
+
+# Kaynak → alan → başlangıç doldurma olasılığı (gözlem yokken kullanılır)
+ON_KABILIYET = {
+    "goodreads": {"turu": 0.8, "puan": 0.85, "orijinal_ad": 0.6, "seri": 0.4},
+    "binkitap": {"orijinal_ad": 0.5, "seri": 0.35, "cevirmen": 0.55},
+}
+
+# Kaynak başına başlangıç maliyeti (saniye)
+ON_MALIYET = {
+    "goodreads": 4.0,
+    "binkitap": 3.0,
+}
+
+# Ön bilginin kaç gözlem ağırlığında sayılacağı
+ON_AGIRLIK = 5.0
+# Gecikme için üstel hareketli ortalama katsayısı
+EWMA_ALFA = 0.2
+# Bir kaynağa gitmeye değmesi için beklenen en az doldurulan alan sayısı
+MIN_BEKLENEN_KAZANC = 0.25
+# Eşiğin altına düşmüş kaynağı yine de deneme olasılığı (model kendini düzeltebilsin)
+KESIF_ORANI = 0.05
+# Değişen modelin diske yazılma aralığı (saniye)
+KAYIT_ARALIGI = 60
+
+
+class EnrichmentPlanner:
+    """
+    Kaynak × alan kabiliyet/maliyet modeli + açgözlü küme örtüsü
+
+    Her kaynak için alan başına "eksikken sorgulandı / doldurdu" sayaçları
+    ve ortalama gecikme tutulur. Plan, eksik alanları beklenen
+    doldurma / maliyet oranı en yüksek kaynaktan başlayarak örter;
+    geçmişte hiçbir şey eklemeyen kaynaklar atlanır.
+
+    Gözlemler yalnızca bellekteki modeli değiştirir; model kirli
+    işaretlenir ve kaydet() ile (periyodik / kapanışta) thread'de yazılır.
+
+    Examples:
+        >>> kaynak = enrichment_planner.sonraki_kaynak(data, haric={"goodreads"})
+        >>> enrichment_planner.gozlem_kaydet(kaynak, eksikler, data, sure)
+        >>> await enrichment_planner.kaydet()
+    """
+
+    def __init__(self, model_dosyasi: str = 'logs/zenginlestirme_modeli.json'):
+        self.model_dosyasi = Path(model_dosyasi)
+        self.model_dosyasi.parent.mkdir(exist_ok=True)
+
+        self.model: Dict[str, Dict[str, Any]] = {
+            kaynak: {
+                "alanlar": {alan: {"deneme": 0, "dolan": 0} for alan in alanlar},
+                "gecikme": ON_MALIYET[kaynak],
+                "cagri": 0,
+            }
+            for kaynak, alanlar in ON_KABILIYET.items()
+        }
+        self._kirli = False
+        self._yukle()
+
+    def _yukle(self):
+        """Model dosyasından sayaçları yükle"""
+        if not self.model_dosyasi.exists():
+            return
+        try:
+            with open(self.model_dosyasi, 'r', encoding='utf-8') as f:
+                kayitli = json.load(f)
+            for kaynak, durum in kayitli.items():
+                if kaynak not in self.model:
+                    continue
+                self.model[kaynak]["gecikme"] = durum.get("gecikme", ON_MALIYET[kaynak])
+                self.model[kaynak]["cagri"] = durum.get("cagri", 0)
+                for alan, sayac in durum.get("alanlar", {}).items():
+                    if alan in self.model[kaynak]["alanlar"]:
+                        self.model[kaynak]["alanlar"][alan].update(sayac)
+        except Exception as e:
+            logger.warning(f"⚠️ Zenginleştirme modeli yüklenemedi: {e}")
+
+    def _yaz(self, icerik: str):
+        """Model metnini dosyaya yaz (atomik, thread'de çalışır)"""
+        gecici = self.model_dosyasi.with_suffix(self.model_dosyasi.suffix + ".tmp")
+        with open(gecici, 'w', encoding='utf-8') as f:
+            f.write(icerik)
+        os.replace(gecici, self.model_dosyasi)
+
+    async def kaydet(self):
+        """Model değiştiyse dosyaya kaydet (yazma thread'de yapılır)"""
+        if not self._kirli:
+            return
+        self._kirli = False
+        # Anlık görüntü event loop'ta alınır; model küçük, yazma thread'de
+        icerik = json.dumps(self.model, indent=2, ensure_ascii=False)
+        try:
+            await run_sync(self._yaz, icerik)
+        except Exception as e:
+            self._kirli = True
+            logger.warning(f"⚠️ Zenginleştirme modeli kaydedilemedi: {e}")
+
+    @staticmethod
+    def eksik_alanlar(data: Dict[str, Any]) -> Set[str]:
+        """Kayıtta boş olan zenginleştirme alanları"""
+        return {alan for alan in ZENGINLESTIRME_ALANLARI if not data.get(alan)}
+
+    def doldurma_olasiligi(self, kaynak: str, alan: str) -> float:
+        """Kaynağın alanı doldurma olasılığı (ön bilgiyle yumuşatılmış oran)"""
+        on = ON_KABILIYET.get(kaynak, {}).get(alan)
+        if on is None:
+            return 0.0
+        sayac = self.model[kaynak]["alanlar"][alan]
+        return (sayac["dolan"] + on * ON_AGIRLIK) / (sayac["deneme"] + ON_AGIRLIK)
+
+    def maliyet(self, kaynak: str) -> float:
+        """Kaynağın ortalama gecikmesi (saniye)"""
+        return max(0.1, self.model[kaynak]["gecikme"])
+
+    def beklenen_kazanc(self, kaynak: str, eksikler: Iterable[str]) -> float:
+        """Kaynağa gidilirse beklenen doldurulacak alan sayısı"""
+        return sum(self.doldurma_olasiligi(kaynak, alan) for alan in eksikler)
+
+    def sonraki_kaynak(
+        self,
+        data: Dict[str, Any],
+        haric: Iterable[str] = (),
+        kalan_sure: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Sıradaki en verimli kaynağı seç (açgözlü küme örtüsü adımı)
+
+        Args:
+            data: Güncel kitap kaydı
+            haric: Bu çağrıda zaten denenmiş kaynaklar
+            kalan_sure: Kalan zaman bütçesi; ortalama maliyeti bunu aşan
+                kaynaklar seçilmez (None = sınırsız)
+
+        Returns:
+            Kaynak adı veya None (gidilmeye değer kaynak yok)
+        """
+        eksikler = self.eksik_alanlar(data)
+        if not eksikler:
+            return None
+
+        en_iyi, en_iyi_oran = None, 0.0
+        for kaynak in self.model:
+            if kaynak in haric:
+                continue
+            if kalan_sure is not None and self.maliyet(kaynak) > kalan_sure:
+                continue
+            kazanc = self.beklenen_kazanc(kaynak, eksikler)
+            if kazanc < MIN_BEKLENEN_KAZANC and random.random() >= KESIF_ORANI:
+                continue
+            oran = kazanc / self.maliyet(kaynak)
+            if oran > en_iyi_oran:
+                en_iyi, en_iyi_oran = kaynak, oran
+
+        return en_iyi
+
+    def gozlem_kaydet(
+        self,
+        kaynak: str,
+        eksikler: Iterable[str],
+        data: Dict[str, Any],
+        sure: float
+    ):
+        """
+        Kaynak çağrısının sonucunu modele işle
+
+        Args:
+            kaynak: Çağrılan kaynak
+            eksikler: Çağrıdan önce eksik olan alanlar
+            data: Çağrıdan sonraki kayıt
+            sure: Çağrının süresi (saniye)
+        """
+        durum = self.model.get(kaynak)
+        if durum is None:
+            return
+
+        for alan in eksikler:
+            sayac = durum["alanlar"].get(alan)
+            if sayac is None:
+                continue
+            sayac["deneme"] += 1
+            if data.get(alan):
+                sayac["dolan"] += 1
+
+        durum["cagri"] += 1
+        durum["gecikme"] = (1 - EWMA_ALFA) * durum["gecikme"] + EWMA_ALFA * sure
+        self._kirli = True
+
+    def ozet(self) -> Dict[str, Dict[str, Any]]:
+        """Kaynak başına gecikme ve alan doldurma oranları"""
+        return {
+            kaynak: {
+                "gecikme": round(durum["gecikme"], 2),
+                "cagri": durum["cagri"],
+                "oranlar": {
+                    alan: round(self.doldurma_olasiligi(kaynak, alan), 2)
+                    for alan in durum["alanlar"]
+                },
+            }
+            for kaynak, durum in self.model.items()
+        }
+
+
+# Global instance
+enrichment_planner = EnrichmentPlanner()
@@ -0,0 +1,115 @@
+"""
+Alan bazlı tazelik (fetched-at) takibi
+Kayıt içinde her alanın ne zaman çekildiği, ne zaman denendiği ve kaynak
+linkleri saklanır
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterable, List, Optional
+
+from config.constants import ALAN_TTL_SAAT, ALAN_KAYNAGI, BOS_ALAN_TTL_SAAT
+
+# Kayıt içindeki meta anahtarlar (mesaj formatında kullanılmaz)
+ALAN_ZAMANLARI = "_alan_zamanlari"
+DENEME_ZAMANLARI = "_deneme_zamanlari"
+KAYNAK_LINKLERI = "_kaynak_linkleri"
+
+
+def zaman_damgala(
+    data: Dict[str, Any],
+    alanlar: Optional[Iterable[str]] = None,
+    zorla: bool = False,
+    simdi: datetime = None
+) -> Dict[str, Any]:
+    """
+    Alanların çekilme zamanını kaydet
+
+    Args:
+        data: Kitap kaydı
+        alanlar: Damgalanacak alanlar (None = dolu tüm alanlar)
+        zorla: True ise mevcut damgaların üzerine yaz
+        simdi: Damga zamanı (varsayılan: şimdi)
+    """
+    damgalar = data.setdefault(ALAN_ZAMANLARI, {})
+    zaman = (simdi or datetime.now()).isoformat(timespec='seconds')
+    if alanlar is None:
+        alanlar = [k for k, v in data.items() if v and not k.startswith('_')]
+    for alan in alanlar:
+        if zorla or alan not in damgalar:
+            damgalar[alan] = zaman
+    return data
+
+
+def deneme_damgala(
+    data: Dict[str, Any],
+    alanlar: Iterable[str],
+    simdi: datetime = None
+) -> Dict[str, Any]:
+    """
+    Alanlar için kaynağa gidildiğini kaydet (sonuç boş dönse de)
+
+    Böylece kaynakta olmayan alan (puanı olmayan kitap, Goodreads'te
+    bulunmayan kitap) her sunumda yeniden istenmez; BOS_ALAN_TTL_SAAT
+    sonra yeniden denenir.
+    """
+    denemeler = data.setdefault(DENEME_ZAMANLARI, {})
+    zaman = (simdi or datetime.now()).isoformat(timespec='seconds')
+    for alan in alanlar:
+        denemeler[alan] = zaman
+    return data
+
+
+def _suresi_icinde(damga: Optional[str], simdi: datetime, ttl_saat: float) -> bool:
+    try:
+        return bool(damga) and simdi - datetime.fromisoformat(damga) < timedelta(hours=ttl_saat)
+    except ValueError:
+        return False
+
+
+def bayat_alanlar(
+    data: Dict[str, Any],
+    simdi: datetime = None,
+    sadece_damgali: bool = False
+) -> List[str]:
+    """
+    Süresi dolmuş değişken alanlar
+
+    Alan, çekilme damgası ALAN_TTL_SAAT içindeyse ya da son denemesi
+    (boş sonuç dahil) BOS_ALAN_TTL_SAAT içindeyse tazedir. Damgası olmayan
+    değişken alanlar bayat sayılır; sadece_damgali=True ise (sunum anında
+    arka plan yenileme kararı) hiç denenmemiş alanlar atlanır, yalnızca
+    süresi dolmuş bir damga yenileme başlatır.
+    """
+    simdi = simdi or datetime.now()
+    damgalar = data.get(ALAN_ZAMANLARI) or {}
+    denemeler = data.get(DENEME_ZAMANLARI) or {}
+    bayatlar = []
+    for alan, ttl_saat in ALAN_TTL_SAAT.items():
+        if _suresi_icinde(damgalar.get(alan), simdi, ttl_saat):
+            continue
+        if _suresi_icinde(denemeler.get(alan), simdi, min(ttl_saat, BOS_ALAN_TTL_SAAT)):
+            continue
+        if sadece_damgali and alan not in damgalar and alan not in denemeler:
+            continue
+        bayatlar.append(alan)
+    return bayatlar
+
+
+def kaynaklara_gore_grupla(alanlar: Iterable[str]) -> Dict[str, List[str]]:
+    """Bayat alanları yenileneceği kaynağa göre grupla"""
+    gruplar: Dict[str, List[str]] = {}
+    for alan in alanlar:
+        kaynak = ALAN_KAYNAGI.get(alan)
+        if kaynak:
+            gruplar.setdefault(kaynak, []).append(alan)
+    return gruplar
+
+
+def kaynak_linki_kaydet(data: Dict[str, Any], kaynak: str, link: Optional[str]):
+    """Kaynağın doğrudan kitap linkini kayda ekle (sonraki yenilemeler için)"""
+    if link:
+        data.setdefault(KAYNAK_LINKLERI, {})[kaynak] = link
+
+
+def kaynak_linki(data: Dict[str, Any], kaynak: str) -> Optional[str]:
+    """Kayıttaki doğrudan kaynak linki"""
+    return (data.get(KAYNAK_LINKLERI) or {}).get(kaynak)
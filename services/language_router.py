@@ -0,0 +1,84 @@
+"""
+Dile göre kaynak yönlendirme
+İngilizce sorgular Goodreads'ten, diğerleri Kitapyurdu'ndan başlar
+"""
+import logging
+from typing import Dict, Any, Optional, Tuple
+
+from database.db_manager import db
+from utils.language import dil_tahmin_et, EN
+from utils.similarity import normalize_et
+
+logger = logging.getLogger(__name__)
+
+# Yazar adı bu kadar kısaysa sorgu içinde aranmaz (yanlış eşleşme)
+MIN_YAZAR_UZUNLUGU = 5
+
+
+class DilYonlendirici:
+    """
+    Sorgu dil sınıflandırıcı + bilinen yazar dizini
+
+    Dizin, çözülen her kitapta yazarın yerli mi (orijinal adı yok) çeviri mi
+    (orijinal adı farklı) eser verdiğini sayar; sorgudaki bilinen yazar
+    sınıflandırmaya ek sinyal olarak girer.
+    """
+    
+    def __init__(self):
+        self._yazarlar: Optional[Dict[str, Tuple[int, int]]] = None
+    
+    async def _yukle(self):
+        if self._yazarlar is None:
+            self._yazarlar = await db.yazar_dilleri()
+    
+    def _yazar_sinyali(self, sorgu: str) -> Tuple[bool, bool]:
+        metin = f" {normalize_et(sorgu)} "
+        yerli = yabanci = False
+        for yazar, (yerli_sayi, yabanci_sayi) in self._yazarlar.items():
+            if len(yazar) < MIN_YAZAR_UZUNLUGU or f" {yazar} " not in metin:
+                continue
+            if yerli_sayi > yabanci_sayi:
+                yerli = True
+            elif yabanci_sayi > yerli_sayi:
+                yabanci = True
+        return yerli, yabanci
+    
+    async def siniflandir(self, sorgu: str) -> Tuple[str, float]:
+        """
+        Sorgunun dilini tahmin et
+
+        Returns:
+            (dil, fark) - bkz. utils.language.dil_tahmin_et
+        """
+        await self._yukle()
+        yerli, yabanci = self._yazar_sinyali(sorgu)
+        return dil_tahmin_et(sorgu, yerli_yazar=yerli, yabanci_yazar=yabanci)
+    
+    async def goodreads_once_mi(self, sorgu: str) -> bool:
+        """Sorgu İngilizce görünüyorsa Goodreads'ten başlanmalı"""
+        dil, fark = await self.siniflandir(sorgu)
+        if dil == EN:
+            logger.info(f"🌐 İngilizce sorgu (fark {fark:.1f}), Goodreads önce: {sorgu[:60]}")
+            return True
+        return False
+    
+    async def yazar_kaydet(self, data: Dict[str, Any]):
+        """Çözülen kitabın yazarını yerli/çeviri olarak dizine ekle"""
+        yazar = normalize_et(data.get("yazar") or "")
+        if not yazar:
+            return
+        
+        orijinal = normalize_et(data.get("orijinal_ad") or "")
+        yabanci = bool(orijinal) and orijinal != normalize_et(data.get("baslik") or "")
+        
+        await self._yukle()
+        if await db.yazar_dili_kaydet(yazar, yabanci):
+            yerli_sayi, yabanci_sayi = self._yazarlar.get(yazar, (0, 0))
+            self._yazarlar[yazar] = (
+                yerli_sayi + (0 if yabanci else 1),
+                yabanci_sayi + (1 if yabanci else 0),
+            )
+
+
+# Global instance
+dil_yonlendirici = DilYonlendirici()
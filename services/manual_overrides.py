@@ -0,0 +1,147 @@
+"""
+Elle sabitlenen eşleşmeler
+Yanlış çözülen dosya adları / ISBN'ler için admin tarafından verilen kaynak linki
+"""
+import logging
+import re
+from typing import Dict, Any, List, Optional
+
+from database.db_manager import db
+from utils.text_utils import metni_temizle, isbn_bul
+
+logger = logging.getLogger(__name__)
+
+
+def _isbn_mi(metin: str) -> bool:
+    return bool(re.fullmatch(r'\d{10}|\d{13}', metin or ""))
+
+
+def eslesme_anahtari(girdi: str) -> Optional[str]:
+    """
+    Dosya adı veya ISBN'den sabitleme anahtarı
+
+    Dosya anahtarı mesaj kaydının anahtarıyla aynı parmak izini
+    (metni_temizle) kullanır; PDF/EPUB kopyaları aynı sabitlemeyi paylaşır.
+
+    Examples:
+        >>> eslesme_anahtari("978-605-375-342-1")
+        'isbn:9786053753421'
+        >>> eslesme_anahtari("Dostoyevski - Suç ve Ceza.pdf")
+        'dosya:dostoyevski suç ve ceza'
+    """
+    if not girdi or not girdi.strip():
+        return None
+    parmak_izi = metni_temizle(girdi.strip())
+    if not parmak_izi:
+        return None
+    if _isbn_mi(parmak_izi):
+        return f"isbn:{parmak_izi}"
+    return f"dosya:{parmak_izi}"
+
+
+class ManuelEslesmeler:
+    """
+    Anahtar → kaynak linki sözlüğü (SQLite'ta kalıcı, bellekte O(1) arama)
+
+    Examples:
+        >>> await manuel_eslesmeler.sabitle("Kar.epub", "https://www.kitapyurdu.com/kitap/kar/1234.html")
+        >>> await manuel_eslesmeler.bul("Kar.epub")
+        'https://www.kitapyurdu.com/kitap/kar/1234.html'
+    """
+
+    def __init__(self):
+        self._eslesmeler: Optional[Dict[str, str]] = None
+
+    async def _yukle(self):
+        if self._eslesmeler is None:
+            self._eslesmeler = {
+                kayit["anahtar"]: kayit["hedef_url"]
+                for kayit in await db.manuel_eslesmeler()
+            }
+            if self._eslesmeler:
+                logger.info(f"📌 {len(self._eslesmeler)} manuel eşleşme yüklendi")
+
+    async def bul(self, query: str, isbn: str = None) -> Optional[str]:
+        """
+        Sorguya / ISBN'e sabitlenmiş link
+
+        Önce ISBN (parametre veya dosya adındaki), sonra dosya parmak izi bakılır.
+        """
+        await self._yukle()
+        if not self._eslesmeler:
+            return None
+
+        adaylar = []
+        for aday in (isbn, isbn_bul(query or "")):
+            temiz = re.sub(r'\D', '', aday or "")
+            if _isbn_mi(temiz):
+                adaylar.append(f"isbn:{temiz}")
+        dosya_anahtari = eslesme_anahtari(query)
+        if dosya_anahtari:
+            adaylar.append(dosya_anahtari)
+
+        for anahtar in adaylar:
+            hedef = self._eslesmeler.get(anahtar)
+            if hedef:
+                logger.info(f"📌 Manuel eşleşme: {anahtar} → {hedef[:70]}")
+                return hedef
+        return None
+
+    async def sabitle(
+        self,
+        girdi: str,
+        hedef_url: str,
+        ekleyen: int = None,
+        dosya_adi: str = None
+    ) -> Optional[str]:
+        """
+        Dosya adını / ISBN'i linke sabitle
+
+        Sabitlenen dosyanın, yanıtlanan dosyanın (dosya_adi) ve ISBN
+        sabitlemesinde o ISBN'le kaydedilmiş kitapların yanlış kayıtları
+        silinir; kayıt sabitlemeden önce okunduğundan aksi halde bir sonraki
+        mesaj yine yanlış kayıttan düzenlenirdi.
+
+        Returns:
+            Kaydedilen anahtar veya None
+        """
+        anahtar = eslesme_anahtari(girdi)
+        if not anahtar:
+            return None
+
+        await self._yukle()
+        if not await db.manuel_eslesme_kaydet(anahtar, hedef_url, ekleyen):
+            return None
+        self._eslesmeler[anahtar] = hedef_url
+
+        dosya_anahtarlari = {anahtar} if anahtar.startswith("dosya:") else set()
+        yanitlanan = eslesme_anahtari(dosya_adi) if dosya_adi else None
+        if yanitlanan and yanitlanan.startswith("dosya:"):
+            dosya_anahtarlari.add(yanitlanan)
+        for dosya_anahtari in dosya_anahtarlari:
+            await db.sil(dosya_anahtari)
+        if anahtar.startswith("isbn:"):
+            silinen = await db.isbn_kayitlarini_sil(anahtar[len("isbn:"):])
+            if silinen:
+                logger.info(f"🗑 {anahtar} için {silinen} kayıt silindi")
+        return anahtar
+
+    async def kaldir(self, girdi: str) -> Optional[str]:
+        """Sabitlemeyi kaldır; kaldırılan anahtar veya None"""
+        anahtar = eslesme_anahtari(girdi)
+        if not anahtar:
+            return None
+
+        await self._yukle()
+        if not await db.manuel_eslesme_sil(anahtar):
+            return None
+        self._eslesmeler.pop(anahtar, None)
+        return anahtar
+
+    async def liste(self) -> List[Dict[str, Any]]:
+        """Tüm sabitlemeler (en yeni önce)"""
+        return await db.manuel_eslesmeler()
+
+
+# Global instance
+manuel_eslesmeler = ManuelEslesmeler()
@@ -0,0 +1,156 @@
+"""
+Seri önbelleği
+Bir cilt çözülünce serinin diğer ciltleri saklanır; kardeş ciltler
+arama zinciri çalışmadan yerel olarak eşleşir
+"""
+import logging
+import re
+from typing import Dict, Any, List, Optional, Tuple
+
+from database.db_manager import db
+from utils.similarity import normalize_et
+from utils.series_utils import translate_series_name
+
+logger = logging.getLogger(__name__)
+
+_SERI_NO = re.compile(r'^(.+?)\s*#\s*(\d+)\s*$')
+_CILT_NO = re.compile(r'\b(\d{1,2})\b')
+
+# Yerel eşleşmede kaynak tercihi (Türkçe baskı önce)
+KAYNAK_TERCIHI = ("kitapyurdu", "binkitap", "goodreads")
+
+# Bu kadar kısa seri adları yanlış eşleşmeye açık
+MIN_TAKMA_AD_UZUNLUGU = 3
+
+
+def seri_ayir(seri: str) -> Tuple[str, Optional[str]]:
+    """
+    "Cam Şato #2" → ("Cam Şato", "2"); numarasız seride ("Narnia", None)
+    """
+    if not seri:
+        return "", None
+    match = _SERI_NO.match(seri.strip())
+    if match:
+        return match.group(1).strip(), str(int(match.group(2)))
+    return seri.strip(), None
+
+
+class SeriOnbellegi:
+    """Seri takma adı dizini (bellekte) + SQLite'taki cilt listesi"""
+    
+    def __init__(self):
+        self._takma_adlar: Optional[Dict[str, str]] = None
+    
+    async def _yukle(self):
+        if self._takma_adlar is None:
+            self._takma_adlar = await db.seri_takma_adlari()
+    
+    async def eslestir(self, sorgu: str) -> Optional[Tuple[str, str]]:
+        """
+        Sorgudaki seri adını ve cilt numarasını bul
+        
+        Returns:
+            (seri_id, cilt_no) veya None
+        """
+        await self._yukle()
+        if not sorgu or not self._takma_adlar:
+            return None
+        
+        metin = f" {normalize_et(sorgu)} "
+        en_iyi = None
+        for takma_ad in self._takma_adlar:
+            if f" {takma_ad} " in metin and (en_iyi is None or len(takma_ad) > len(en_iyi)):
+                en_iyi = takma_ad
+        if not en_iyi:
+            return None
+        
+        kalan = metin.replace(f" {en_iyi} ", " ", 1)
+        no_match = _CILT_NO.search(kalan)
+        if not no_match:
+            return None
+        return self._takma_adlar[en_iyi], str(int(no_match.group(1)))
+    
+    async def cilt_bul(self, sorgu: str) -> Optional[Dict[str, Any]]:
+        """
+        Sorgu bilinen bir serinin cildiyse en iyi kaynaktaki kaydını döndür
+        
+        Returns:
+            {"seri_id", "cilt_no", "kaynak", "baslik", "link"} veya None
+        """
+        eslesme = await self.eslestir(sorgu)
+        if not eslesme:
+            return None
+        
+        seri_id, cilt_no = eslesme
+        ciltler = await db.seri_cildi(seri_id, cilt_no)
+        if not ciltler:
+            return None
+        
+        ciltler.sort(key=lambda c: KAYNAK_TERCIHI.index(c["kaynak"]) if c["kaynak"] in KAYNAK_TERCIHI else 99)
+        return {"seri_id": seri_id, **ciltler[0]}
+    
+    def takma_adlar(self, data: Dict[str, Any]) -> List[str]:
+        """Kaydın seri adlarının normalize halleri (Türkçe, orijinal, çeviri)"""
+        adlar = []
+        for seri in (data.get("seri"), data.get("_seri_orijinal")):
+            ad, _ = seri_ayir(seri or "")
+            if not ad:
+                continue
+            for aday in (ad, seri_ayir(translate_series_name(ad) or "")[0]):
+                normal = normalize_et(aday)
+                if len(normal) >= MIN_TAKMA_AD_UZUNLUGU and normal not in adlar:
+                    adlar.append(normal)
+        return adlar
+    
+    async def kitabi_kaydet(self, data: Dict[str, Any], kaynak: str) -> Optional[str]:
+        """
+        Çözülen kitabı serisinin cildi olarak kaydet
+        
+        Args:
+            data: Kitap kaydı ("seri", opsiyonel "_seri_orijinal" / "_seri_url")
+            kaynak: Kaydı bulan scraper anahtarı
+        
+        Returns:
+            seri_id (seri yoksa None)
+        """
+        ad, cilt_no = seri_ayir(data.get("seri") or "")
+        adlar = self.takma_adlar(data)
+        if not ad or not adlar:
+            return None
+        
+        await self._yukle()
+        seri_id = next((self._takma_adlar[a] for a in adlar if a in self._takma_adlar), None)
+        if not seri_id:
+            seri_id = data.get("_seri_url") or f"ad:{adlar[0]}"
+        
+        ciltler = []
+        if cilt_no and data.get("link"):
+            ciltler.append({
+                "cilt_no": cilt_no, "kaynak": kaynak,
+                "baslik": data.get("baslik"), "link": data["link"],
+            })
+        
+        if await db.seri_kaydet(seri_id, ad, adlar, ciltler, liste_url=data.get("_seri_url")):
+            for takma_ad in adlar:
+                self._takma_adlar[takma_ad] = seri_id
+        return seri_id
+    
+    async def liste_gerekli(self, seri_id: str) -> Optional[str]:
+        """Seri listesi henüz çekilmediyse liste adresini döndür"""
+        bilgi = await db.seri_bilgisi(seri_id)
+        if bilgi and bilgi["liste_url"] and not bilgi["liste_tarihi"]:
+            return bilgi["liste_url"]
+        return None
+    
+    async def listeyi_kaydet(self, seri_id: str, ciltler: List[Dict[str, Any]], kaynak: str):
+        """Seri sayfasından gelen tüm ciltleri kaydet"""
+        bilgi = await db.seri_bilgisi(seri_id) or {}
+        await db.seri_kaydet(
+            seri_id, bilgi.get("seri_adi", seri_id), [],
+            [{**c, "kaynak": kaynak} for c in ciltler],
+            liste_cekildi=True
+        )
+
+
+# Global instance
+seri_onbellegi = SeriOnbellegi()
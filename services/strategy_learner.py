@@ -0,0 +1,151 @@
+"""
+Öğrenen Kitapyurdu strateji sıralayıcı
+Dosya adı desenine göre stratejilerin başarı oranı ve süresini tutar,
+sırayı Beta posterior örneklemesiyle belirler
+"""
+import logging
+import random
+import re
+from typing import Dict, List, Optional, Tuple
+
+from database.db_manager import db
+
+logger = logging.getLogger(__name__)
+
+
+# Dosya adı desenleri
+DESEN_KOSELI = "koseli_etiket"      # "Kitap [cs] v2.epub"
+DESEN_TIRE = "yazar_tire_baslik"    # "Yazar - Başlık.pdf"
+DESEN_ALT_CIZGI = "alt_cizgi"       # "Yazar_Baslik_Seri.epub"
+DESEN_DUZ = "duz"
+
+# Gözlem yokken stratejinin sıradaki yerine göre başlangıç başarı olasılığı
+# (ilk strateji en yüksek; öğrenme başlamadan eski sabit sıra korunur)
+ON_BASARI = 0.5
+ON_SIRA_CARPANI = 0.7
+# Ön bilginin kaç gözlem ağırlığında sayılacağı
+ON_AGIRLIK = 4.0
+# Gözlem yokken varsayılan istek süresi (saniye)
+ON_SURE = 2.0
+# Ortalama süre için üstel hareketli ortalama katsayısı
+EWMA_ALFA = 0.2
+# Budama: bu kadar denemeden sonra posterior ortalaması eşiğin altında kalan
+# strateji çoğunlukla atlanır
+BUDAMA_MIN_DENEME = 20
+BUDAMA_ESIGI = 0.03
+# Budanmış stratejiyi yine de deneme olasılığı (model kendini düzeltebilsin)
+KESIF_ORANI = 0.1
+
+
+def dosya_deseni(dosya_adi: str) -> str:
+    """
+    Ham dosya adının desenini belirle
+
+    Examples:
+        >>> dosya_deseni("Sarah_J_Maas_Cam_Sato_2_[cs].epub")
+        'koseli_etiket'
+        >>> dosya_deseni("Dostoyevski - Suç ve Ceza.pdf")
+        'yazar_tire_baslik'
+    """
+    if not dosya_adi:
+        return DESEN_DUZ
+    if re.search(r'\[[^\]]*\]', dosya_adi):
+        return DESEN_KOSELI
+    if re.search(r'\s-\s', dosya_adi):
+        return DESEN_TIRE
+    if "_" in dosya_adi:
+        return DESEN_ALT_CIZGI
+    return DESEN_DUZ
+
+
+class StratejiOgrenici:
+    """
+    (desen, strateji) başına deneme / başarı sayacı + ortalama süre
+
+    Sıralama, her strateji için Beta(başarı, başarısızlık) posterior'undan
+    örneklenen başarı olasılığının ortalama süreye oranıyla yapılır
+    (Thompson örneklemesi; hiç denenmemiş stratejide ön bilgi ortalaması); hiç işe yaramadığı görülen stratejiler
+    olasılıksal olarak budanır. Sayaçlar SQLite'ta kalıcıdır.
+
+    Examples:
+        >>> sira = await strateji_ogrenici.sirala(desen, stratejiler)
+        >>> await strateji_ogrenici.gozlem_kaydet(desen, "Sayısız", True, 1.4)
+    """
+
+    def __init__(self):
+        self._tablo: Optional[Dict[Tuple[str, str], Tuple[int, int, float]]] = None
+
+    async def _yukle(self):
+        if self._tablo is None:
+            self._tablo = await db.strateji_istatistikleri()
+
+    def _posterior(self, desen: str, strateji: str, sira: int) -> Tuple[float, float, int, float]:
+        """(alfa, beta, deneme, ort_sure) - sıraya bağlı ön bilgiyle"""
+        deneme, basari, sure = self._tablo.get((desen, strateji), (0, 0, ON_SURE))
+        on = ON_BASARI * (ON_SIRA_CARPANI ** sira)
+        alfa = basari + on * ON_AGIRLIK
+        beta = (deneme - basari) + (1 - on) * ON_AGIRLIK
+        return alfa, beta, deneme, sure
+
+    async def sirala(self, desen: str, stratejiler: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        Stratejileri beklenen verime göre sırala, işe yaramayanları buda
+
+        Args:
+            desen: Dosya adı deseni
+            stratejiler: (ad, sorgu) listesi - varsayılan sırayla
+
+        Returns:
+            Yeniden sıralanmış (ad, sorgu) listesi (en az bir strateji kalır)
+        """
+        if len(stratejiler) <= 1:
+            return list(stratejiler)
+
+        await self._yukle()
+        puanli = []
+        for sira, (ad, sorgu) in enumerate(stratejiler):
+            alfa, beta, deneme, sure = self._posterior(desen, ad, sira)
+            ortalama = alfa / (alfa + beta)
+            if (
+                deneme >= BUDAMA_MIN_DENEME
+                and ortalama < BUDAMA_ESIGI
+                and random.random() >= KESIF_ORANI
+            ):
+                logger.debug(f"✂️ Strateji budandı ({desen}): {ad} (~{ortalama:.1%})")
+                continue
+            # Hiç denenmemiş strateji ön bilgi ortalamasıyla (varsayılan sırasında) kalır
+            ornek = random.betavariate(alfa, beta) if deneme else ortalama
+            puanli.append((ornek / max(0.1, sure), sira, ad, sorgu))
+
+        if not puanli:
+            return [stratejiler[0]]
+
+        puanli.sort(key=lambda p: (-p[0], p[1]))
+        return [(ad, sorgu) for _, _, ad, sorgu in puanli]
+
+    async def gozlem_kaydet(self, desen: str, strateji: str, basarili: bool, sure: float):
+        """Strateji denemesinin sonucunu işle"""
+        await self._yukle()
+        if not await db.strateji_gozlemi_kaydet(desen, strateji, basarili, sure, EWMA_ALFA):
+            return
+        deneme, basari, ort = self._tablo.get((desen, strateji), (0, 0, None))
+        self._tablo[(desen, strateji)] = (
+            deneme + 1,
+            basari + int(basarili),
+            sure if ort is None else ort * (1 - EWMA_ALFA) + sure * EWMA_ALFA,
+        )
+
+    async def ozet(self) -> Dict[str, List[Tuple[str, int, float, float]]]:
+        """Desen başına (strateji, deneme, başarı oranı, ort. süre) - orana göre"""
+        await self._yukle()
+        sonuc: Dict[str, List[Tuple[str, int, float, float]]] = {}
+        for (desen, strateji), (deneme, basari, sure) in self._tablo.items():
+            oran = basari / deneme if deneme else 0.0
+            sonuc.setdefault(desen, []).append((strateji, deneme, oran, sure))
+        for satirlar in sonuc.values():
+            satirlar.sort(key=lambda s: -s[2])
+        return sonuc
+
+
+# Global instance
+strateji_ogrenici = StratejiOgrenici()
@@ -0,0 +1,74 @@
+"""
+Eser (Goodreads work) deposu
+Aynı eserin farklı baskıları ortak alanları tek kayıttan paylaşır
+"""
+import logging
+from typing import Dict, Any, List
+
+from database.db_manager import db
+from services.freshness import ALAN_ZAMANLARI
+from utils.similarity import normalize_et
+from utils.statistics import bot_stats
+
+logger = logging.getLogger(__name__)
+
+# Baskıdan bağımsız, eser düzeyinde ortak alanlar
+ESER_ALANLARI = ("orijinal_ad", "seri", "turu", "puan", "oy_sayisi")
+
+
+def takma_adlar(data: Dict[str, Any]) -> List[str]:
+    """
+    Kaydın esere çözülebileceği anahtarlar (öncelik sırasıyla)
+
+    ISBN → başlık+yazar → orijinal ad+yazar
+    """
+    anahtarlar = []
+    if data.get("isbn"):
+        anahtarlar.append(f"isbn:{data['isbn']}")
+    
+    yazar = normalize_et(data.get("yazar") or "")
+    if data.get("baslik") and yazar:
+        anahtarlar.append(f"ay:{normalize_et(data['baslik'])}|{yazar}")
+    if data.get("orijinal_ad") and yazar:
+        anahtarlar.append(f"orijinal:{normalize_et(data['orijinal_ad'])}|{yazar}")
+    return anahtarlar
+
+
+async def eserden_tamamla(data: Dict[str, Any]) -> bool:
+    """
+    Kaydı eserine bağla ve eksik ortak alanları eserden doldur
+
+    Returns:
+        Eser bulunduysa True
+    """
+    eser = await db.eser_bul(takma_adlar(data))
+    if not eser:
+        return False
+    
+    data["eser_id"] = eser["eser_id"]
+    eser_zamanlari = eser.get(ALAN_ZAMANLARI, {})
+    eklenenler = []
+    for alan in ESER_ALANLARI:
+        if not data.get(alan) and eser.get(alan):
+            data[alan] = eser[alan]
+            # Devralınan alanın tazeliği eserdeki çekilme zamanıdır
+            if alan in eser_zamanlari:
+                data.setdefault(ALAN_ZAMANLARI, {})[alan] = eser_zamanlari[alan]
+            eklenenler.append(alan)
+    
+    if eklenenler:
+        bot_stats.increment("eser_mirasi")
+        logger.info(f"📚 Eserden devralındı ({eser['eser_id']}): {', '.join(eklenenler)}")
+    return True
+
+
+async def eseri_kaydet(data: Dict[str, Any]) -> bool:
+    """Kaydın eser kimliği varsa ortak alanları ve takma adları esere yaz"""
+    eser_id = data.get("eser_id")
+    if not eser_id:
+        return False
+    
+    zamanlar = data.get(ALAN_ZAMANLARI, {})
+    alanlar = {alan: data.get(alan) for alan in ESER_ALANLARI if data.get(alan)}
+    alanlar[ALAN_ZAMANLARI] = {a: zamanlar[a] for a in alanlar if a in zamanlar}
+    return await db.eser_kaydet(eser_id, alanlar, takma_adlar(data))
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
-"""search_book() test"""
+"""search_book() / search_many() test"""
 import asyncio
+import threading
 from services.book_service import book_service
 
 async def test():
@@ -30,5 +31,79 @@ async def test():
         except Exception as e:
             print(f"   ❌ Exception: {e}")
 
+async def test_toplu():
+    items = [
+        "Harry Potter",
+        "C_S_Lewis_Narnia_Günlükleri_6_Gümüş_Sandalye.epub",
+        "C_S_Lewis_Narnia_Günlükleri_6_Gümüş_Sandalye.pdf",
+        "GIBBERISH_INVALID_QUERY_12345",
+    ]
+    
+    print(f"\n📦 Toplu test: {len(items)} girdi")
+    
+    async for girdi, (bilgi, kaynak, basarili) in book_service.search_many(items, manuel_mod=True):
+        durum = "✅" if basarili else "❌"
+        baslik = bilgi.get("baslik") if bilgi else "-"
+        print(f"   {durum} {girdi} → {kaynak}: {baslik}")
+
+async def test_katalog_cilt():
+    from services.catalog import eslesme_guveni, _tokenler
+    
+    birinci_cilt = {
+        "baslik": "Açlık Oyunları",
+        "yazar": "Suzanne Collins",
+        "seri": "Açlık Oyunları #1",
+    }
+    sorgular = [
+        ("Suzanne Collins Açlık Oyunları", True),
+        ("Suzanne Collins Açlık Oyunları 1", True),
+        ("Suzanne Collins Açlık Oyunları 2", False),
+    ]
+    
+    print("\n📇 Katalog cilt testi: kayıtlı 1. cilt")
+    
+    for sorgu, beklenen in sorgular:
+        guven = eslesme_guveni(_tokenler(sorgu), birinci_cilt)
+        durum = "✅" if (guven >= 0.8) == beklenen else "❌"
+        print(f"   {durum} {sorgu} → güven {guven:.2f}")
+
+async def test_iptal_on_getirme():
+    from utils.deadline import iptal_edilebilir, butce_doldu
+    
+    gorulen = []
+    
+    async def on_getir(seri_id, liste_url):
+        gorulen.append(not butce_doldu())
+        book_service._seri_on_getirme.pop(seri_id, None)
+    
+    data = {
+        "baslik": "İptal Testi",
+        "seri": "İptal Testi Serisi #1",
+        "link": "https://www.goodreads.com/book/show/iptal-testi",
+        "_seri_url": "https://www.goodreads.com/series/iptal-testi",
+    }
+    
+    print("\n✂️ İptal edilen aramanın seri ön getirmesi")
+    
+    orijinal = book_service._seri_listesini_getir
+    book_service._seri_listesini_getir = on_getir
+    try:
+        isaret = threading.Event()
+        with iptal_edilebilir(isaret):
+            isaret.set()
+            await book_service._seriyi_kaydet(data, "goodreads")
+        await asyncio.sleep(0.1)
+    finally:
+        book_service._seri_listesini_getir = orijinal
+    
+    durum = "✅" if gorulen == [True] else "❌"
+    print(f"   {durum} ön getirme çalıştı: {gorulen}")
+
+async def main():
+    await test()
+    await test_toplu()
+    await test_katalog_cilt()
+    await test_iptal_on_getirme()
+
 if __name__ == "__main__":
-    asyncio.run(test())
\ No newline at end of file
+    asyncio.run(main())
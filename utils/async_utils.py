@@ -2,6 +2,7 @@
 Asenkron yardımcı fonksiyonlar
 """
 import asyncio
+import contextvars
 from typing import Callable, Any, Optional
 from concurrent.futures import ThreadPoolExecutor
 import logging
@@ -42,10 +43,11 @@ async def run_sync(func: Callable, *args, **kwargs) -> Any:
         loop = asyncio.get_event_loop()
         executor = get_executor()
         
-        # Fonksiyonu executor'da çalıştır
+        # Fonksiyonu executor'da çalıştır (contextvars, örn. zaman bütçesi, thread'e taşınır)
+        ctx = contextvars.copy_context()
         return await loop.run_in_executor(
             executor,
-            lambda: func(*args, **kwargs)
+            lambda: ctx.run(func, *args, **kwargs)
         )
     
     except Exception as e:
@@ -0,0 +1,208 @@
+"""
+LRU + TTL önbellek
+Boyut (öğe ve bayt) sınırlı, süreli, isabet / ıska / çıkarma sayaçlı
+"""
+import json
+import logging
+import os
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def tahmini_boyut(deger: Any) -> int:
+    """Değerin bayt olarak yaklaşık boyutu (JSON'a çevrilemezse sys.getsizeof)"""
+    try:
+        return len(json.dumps(deger, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return sys.getsizeof(deger)
+
+
+class LRUOnbellek:
+    """
+    O(1) LRU önbellek, önbellek genelinde sabit TTL
+
+    Kullanım sırası bir OrderedDict'te, bitiş sırası ikincisinde tutulur.
+    Bütün kayıtlar aynı TTL'i kullandığından bitiş sırası yazma sırasıdır;
+    her okuma / yazmada süresi dolanlar baştan atılır (amorti O(1)).
+    Sınır aşılınca en uzun süredir kullanılmayan kayıt çıkarılır.
+
+    Args:
+        max_oge: En fazla kayıt sayısı
+        max_bayt: Değerlerin toplam tahmini boyutu (0: sınırsız)
+        ttl: Kayıt ömrü (saniye, 0: süresiz)
+        ad: Loglarda / durum özetinde görünecek ad
+        boyut_olc: Değer boyutunu bayt olarak veren fonksiyon
+
+    Examples:
+        >>> onbellek = LRUOnbellek(max_oge=500, max_bayt=2_000_000, ttl=3600)
+        >>> onbellek.koy((kanal_id, mesaj_id), bilgi)
+        >>> onbellek.al((kanal_id, mesaj_id))
+    """
+
+    def __init__(
+        self,
+        max_oge: int = 1000,
+        max_bayt: int = 0,
+        ttl: float = 0,
+        ad: str = "önbellek",
+        boyut_olc: Callable[[Any], int] = tahmini_boyut
+    ):
+        self.max_oge = max(1, max_oge)
+        self.max_bayt = max_bayt
+        self.ttl = ttl
+        self.ad = ad
+        self._boyut_olc = boyut_olc
+
+        # anahtar → (değer, boyut); sıra: en eski kullanılan başta
+        self._kayitlar: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        # anahtar → bitiş (time.time); sıra: en erken biten başta
+        self._bitisler: "OrderedDict[Hashable, float]" = OrderedDict()
+        self.bayt = 0
+
+        self.isabet = 0
+        self.iska = 0
+        self.cikarilan = 0
+        self.suresi_dolan = 0
+
+    def __len__(self) -> int:
+        self._suresi_dolanlari_at()
+        return len(self._kayitlar)
+
+    def __contains__(self, anahtar: Hashable) -> bool:
+        self._suresi_dolanlari_at()
+        return anahtar in self._kayitlar
+
+    def al(self, anahtar: Hashable, varsayilan: Any = None) -> Any:
+        """Değeri al ve en son kullanılan yap (yoksa / süresi dolduysa varsayılan)"""
+        self._suresi_dolanlari_at()
+        kayit = self._kayitlar.get(anahtar)
+        if kayit is None:
+            self.iska += 1
+            return varsayilan
+        self._kayitlar.move_to_end(anahtar)
+        self.isabet += 1
+        return kayit[0]
+
+    def koy(self, anahtar: Hashable, deger: Any):
+        """Değeri yaz (varsa ömrü yenilenir), sınırlar aşılırsa LRU çıkar"""
+        self._suresi_dolanlari_at()
+        self._cikar(anahtar)
+
+        boyut = self._boyut_olc(deger)
+        self._kayitlar[anahtar] = (deger, boyut)
+        self.bayt += boyut
+        if self.ttl:
+            self._bitisler[anahtar] = time.time() + self.ttl
+
+        while len(self._kayitlar) > self.max_oge or (
+            self.max_bayt and self.bayt > self.max_bayt and len(self._kayitlar) > 1
+        ):
+            en_eski = next(iter(self._kayitlar))
+            self._cikar(en_eski)
+            self.cikarilan += 1
+
+    def sil(self, anahtar: Hashable) -> bool:
+        """Kaydı sil (yoksa False)"""
+        return self._cikar(anahtar)
+
+    def temizle(self):
+        """Bütün kayıtları sil (sayaçlar korunur)"""
+        self._kayitlar.clear()
+        self._bitisler.clear()
+        self.bayt = 0
+
+    def _cikar(self, anahtar: Hashable) -> bool:
+        kayit = self._kayitlar.pop(anahtar, None)
+        self._bitisler.pop(anahtar, None)
+        if kayit is None:
+            return False
+        self.bayt -= kayit[1]
+        return True
+
+    def _suresi_dolanlari_at(self):
+        if not self._bitisler:
+            return
+        simdi = time.time()
+        while self._bitisler:
+            anahtar, bitis = next(iter(self._bitisler.items()))
+            if bitis > simdi:
+                break
+            self._cikar(anahtar)
+            self.suresi_dolan += 1
+
+    def durum(self) -> Dict[str, Any]:
+        """Boyut ve isabet / ıska / çıkarma sayaçları"""
+        self._suresi_dolanlari_at()
+        toplam = self.isabet + self.iska
+        return {
+            "ad": self.ad,
+            "oge": len(self._kayitlar),
+            "bayt": self.bayt,
+            "isabet": self.isabet,
+            "iska": self.iska,
+            "isabet_orani": self.isabet / toplam if toplam else 0.0,
+            "cikarilan": self.cikarilan,
+            "suresi_dolan": self.suresi_dolan,
+        }
+
+    # ==================== KALICILIK ====================
+
+    def diske_yaz(self, dosya: str) -> int:
+        """
+        Süresi dolmamış kayıtları JSON dosyasına yaz (atomik)
+
+        Anahtarlar JSON'da liste olarak saklanır; demet anahtarlar
+        diskten_yukle'de yeniden demete çevrilir.
+
+        Returns:
+            Yazılan kayıt sayısı
+        """
+        self._suresi_dolanlari_at()
+        kayitlar = [
+            [list(a) if isinstance(a, tuple) else a, deger, self._bitisler.get(a)]
+            for a, (deger, _) in self._kayitlar.items()
+        ]
+        hedef = Path(dosya)
+        hedef.parent.mkdir(parents=True, exist_ok=True)
+        gecici = hedef.with_suffix(hedef.suffix + ".tmp")
+        with open(gecici, "w", encoding="utf-8") as f:
+            json.dump(kayitlar, f, ensure_ascii=False, default=str)
+        os.replace(gecici, hedef)
+        return len(kayitlar)
+
+    def diskten_yukle(self, dosya: str) -> int:
+        """
+        diske_yaz ile yazılmış kayıtları yükle (süresi dolanlar atlanır)
+
+        Returns:
+            Yüklenen kayıt sayısı
+        """
+        yol = Path(dosya)
+        if not yol.exists():
+            return 0
+        try:
+            with open(yol, "r", encoding="utf-8") as f:
+                kayitlar: Iterable = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ {self.ad} diskten yüklenemedi: {e}")
+            return 0
+
+        simdi = time.time()
+        sayi = 0
+        # Dosya LRU sırasında; en son kullanılan en sona yerleşir
+        for anahtar, deger, bitis in kayitlar:
+            if bitis is not None and bitis <= simdi:
+                continue
+            anahtar = tuple(anahtar) if isinstance(anahtar, list) else anahtar
+            self.koy(anahtar, deger)
+            if bitis is not None and self.ttl:
+                self._bitisler[anahtar] = bitis
+            sayi += 1
+        # Yüklenen bitiş zamanları yazma sırasını bozmuş olabilir
+        self._bitisler = OrderedDict(sorted(self._bitisler.items(), key=lambda k: k[1]))
+        return sayi
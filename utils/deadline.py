@@ -0,0 +1,161 @@
+"""
+Mesaj başına zaman bütçesi (deadline) ve iptal işareti
+contextvars ile MessageHandler → BookService → scraper zincirine taşınır
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from utils.statistics import bot_stats
+
+logger = logging.getLogger(__name__)
+
+# Tek bir HTTP isteğine bütçe ne kadar az kalmış olursa olsun verilen süre
+MIN_ISTEK_SURESI = 1.0
+
+
+class ZamanButcesi:
+    """
+    Bitiş anı sabit bir zaman bütçesi
+
+    Args:
+        saniye: Toplam bütçe (saniye)
+        etiket: Loglarda görünecek ad (örn. dosya adı)
+    """
+
+    def __init__(self, saniye: float, etiket: str = ""):
+        self.baslangic = time.monotonic()
+        self.bitis = self.baslangic + saniye
+        self.etiket = etiket
+        self.asildi = False
+        self.atlanan_asamalar = []
+
+    def kalan(self) -> float:
+        """Kalan süre (saniye, negatif olmaz)"""
+        return max(0.0, self.bitis - time.monotonic())
+
+    def gecen(self) -> float:
+        """Başlangıçtan beri geçen süre"""
+        return time.monotonic() - self.baslangic
+
+    @property
+    def doldu(self) -> bool:
+        return time.monotonic() >= self.bitis
+
+    def asim_kaydet(self, asama: str):
+        """Bütçe yüzünden atlanan aşamayı kaydet (istatistik bütçe başına bir kez)"""
+        self.atlanan_asamalar.append(asama)
+        if not self.asildi:
+            self.asildi = True
+            bot_stats.increment("zaman_butcesi_asimi")
+            logger.warning(
+                f"⏱️ Zaman bütçesi doldu ({self.gecen():.1f}s): {self.etiket[:60]} "
+                f"→ '{asama}' ve sonrası atlanıyor"
+            )
+
+
+_aktif_butce: ContextVar[Optional[ZamanButcesi]] = ContextVar("zaman_butcesi", default=None)
+_iptal_isareti: ContextVar[Optional[threading.Event]] = ContextVar("iptal_isareti", default=None)
+
+
+@contextmanager
+def zaman_butcesi(saniye: float, etiket: str = ""):
+    """
+    Blok süresince geçerli zaman bütçesi aç
+
+    İç içe kullanımda iç bütçe dış bütçeden uzun olamaz.
+
+    Examples:
+        >>> with zaman_butcesi(20, "Dune.epub") as butce:
+        ...     await book_service.search_book("Dune")
+        >>> butce.asildi
+    """
+    ust = _aktif_butce.get()
+    if ust is not None:
+        saniye = min(saniye, ust.kalan())
+    butce = ZamanButcesi(saniye, etiket)
+    token = _aktif_butce.set(butce)
+    try:
+        yield butce
+    finally:
+        _aktif_butce.reset(token)
+
+
+def aktif_butce() -> Optional[ZamanButcesi]:
+    """Geçerli bağlamdaki bütçe (yoksa None)"""
+    return _aktif_butce.get()
+
+
+@contextmanager
+def iptal_edilebilir(isaret: threading.Event):
+    """
+    Blok süresince iptal işareti aç
+
+    İşaret kurulunca butce_doldu() True döner: asyncio görevi iptal edilse
+    de thread'de süren senkron scraper bir sonraki istekte durur.
+
+    Examples:
+        >>> isaret = threading.Event()
+        >>> with iptal_edilebilir(isaret):
+        ...     await book_service.search_book("Dune")
+        >>> isaret.set()   # başka bir görevden
+    """
+    token = _iptal_isareti.set(isaret)
+    try:
+        yield isaret
+    finally:
+        _iptal_isareti.reset(token)
+
+
+def iptal_edildi() -> bool:
+    """Geçerli bağlamın işi iptal edildi mi"""
+    isaret = _iptal_isareti.get()
+    return isaret is not None and isaret.is_set()
+
+
+def butce_doldu(asama: str = None) -> bool:
+    """
+    Bütçe doldu mu? Doluysa ve aşama adı verildiyse aşım kaydedilir
+
+    İş iptal edildiyse de True döner (aşım sayılmaz). Bütçe yoksa (test,
+    script) her zaman False döner.
+    """
+    if iptal_edildi():
+        if asama:
+            logger.debug(f"✂️ İş iptal edildi, '{asama}' atlanıyor")
+        return True
+    butce = _aktif_butce.get()
+    if butce is None or not butce.doldu:
+        return False
+    if asama:
+        butce.asim_kaydet(asama)
+    return True
+
+
+def istek_zaman_asimi(varsayilan: float) -> float:
+    """HTTP isteği için zaman aşımı: varsayılan ile kalan bütçenin küçüğü"""
+    butce = _aktif_butce.get()
+    if butce is None:
+        return varsayilan
+    return max(MIN_ISTEK_SURESI, min(varsayilan, butce.kalan()))
+
+
+@contextmanager
+def butcesiz():
+    """
+    Blok süresince bütçeyi ve iptal işaretini kaldır
+
+    Mesaj işlenirken başlatılan arka plan görevleri (ön getirme vb.) mesajın
+    bütçesini ve iptalini devralmasın diye kullanılır; iş iptal edilse de
+    başlattığı ön getirme sürer.
+    """
+    butce_token = _aktif_butce.set(None)
+    iptal_token = _iptal_isareti.set(None)
+    try:
+        yield
+    finally:
+        _iptal_isareti.reset(iptal_token)
+        _aktif_butce.reset(butce_token)
@@ -0,0 +1,125 @@
+"""
+Süreli bellek içi kayıtlar
+Zaman çarkı (hashed timing wheel) ile amorti O(1) süre sonu; kısa ömürlü
+durumlar (elle düzenleme beklemesi, yankı bastırma...) uzun çalışmada birikmez
+"""
+import math
+import time
+import weakref
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+# Bütün süreli sözlükler (durum raporu için)
+_kayitli: "weakref.WeakSet[SureliSozluk]" = weakref.WeakSet()
+
+
+class SureliSozluk:
+    """
+    Kayıtları ttl sonunda kendiliğinden silinen sözlük
+
+    Kayıtlar bitiş tikine göre çarkın yuvalarına dağıtılır. Her erişimde
+    çark şimdiki tike kadar ilerletilir ve yalnızca geçilen yuvalardaki
+    kayıtlara bakılır: bir kayıt en fazla bir kez (ttl çarkın turundan
+    uzunsa tur başına bir kez) ziyaret edilir, süre sonu amorti O(1)'dir.
+    Çark, varsayılan ttl bir turda bitecek kadar yuvayla kurulur.
+
+    Süre sonu çözünürlük kadar gecikebilir; al / içerir bitişi ayrıca
+    kontrol ettiğinden süresi dolmuş kayıt hiçbir zaman döndürülmez.
+
+    Args:
+        ttl: Varsayılan kayıt ömrü (saniye)
+        ad: Durum raporunda görünecek ad
+        cozunurluk: Çarkın bir tikinin süresi (saniye)
+
+    Examples:
+        >>> elle_duzenlenen = SureliSozluk(ttl=300, ad="Elle düzenleme")
+        >>> elle_duzenlenen.koy(mesaj_id, time.time())
+        >>> mesaj_id in elle_duzenlenen
+    """
+
+    def __init__(self, ttl: float, ad: str = "süreli kayıt", cozunurluk: float = 1.0):
+        self.ttl = ttl
+        self.ad = ad
+        self.cozunurluk = cozunurluk
+        self._yuva_sayisi = max(8, math.ceil(ttl / cozunurluk) + 1)
+        self._yuvalar: List[Set[Hashable]] = [set() for _ in range(self._yuva_sayisi)]
+        # anahtar → (değer, bitiş (monotonic), bitiş tiki)
+        self._kayitlar: Dict[Hashable, Tuple[Any, float, int]] = {}
+        self._tik = self._simdiki_tik()
+        self.suresi_dolan = 0
+        _kayitli.add(self)
+
+    def _simdiki_tik(self) -> int:
+        return int(time.monotonic() / self.cozunurluk)
+
+    def __len__(self) -> int:
+        self._ilerlet()
+        return len(self._kayitlar)
+
+    def __contains__(self, anahtar: Hashable) -> bool:
+        return self._canli(anahtar) is not None
+
+    def _canli(self, anahtar: Hashable) -> Optional[Tuple[Any, float, int]]:
+        self._ilerlet()
+        kayit = self._kayitlar.get(anahtar)
+        if kayit is None:
+            return None
+        if kayit[1] <= time.monotonic():
+            self._cikar(anahtar)
+            self.suresi_dolan += 1
+            return None
+        return kayit
+
+    def al(self, anahtar: Hashable, varsayilan: Any = None) -> Any:
+        """Değer (yoksa / süresi dolduysa varsayılan)"""
+        kayit = self._canli(anahtar)
+        return varsayilan if kayit is None else kayit[0]
+
+    def koy(self, anahtar: Hashable, deger: Any, ttl: Optional[float] = None):
+        """Değeri yaz; varsa ömrü baştan başlar"""
+        self._ilerlet()
+        self._cikar(anahtar)
+        bitis = time.monotonic() + (self.ttl if ttl is None else ttl)
+        # Bitiş tikine yukarı yuvarlanır: yuva geçildiğinde bitiş gelmiş olur
+        bitis_tiki = max(self._tik + 1, math.ceil(bitis / self.cozunurluk))
+        self._kayitlar[anahtar] = (deger, bitis, bitis_tiki)
+        self._yuvalar[bitis_tiki % self._yuva_sayisi].add(anahtar)
+
+    def sil(self, anahtar: Hashable) -> bool:
+        """Kaydı sil (yoksa False)"""
+        return self._cikar(anahtar)
+
+    def _cikar(self, anahtar: Hashable) -> bool:
+        kayit = self._kayitlar.pop(anahtar, None)
+        if kayit is None:
+            return False
+        self._yuvalar[kayit[2] % self._yuva_sayisi].discard(anahtar)
+        return True
+
+    def _ilerlet(self):
+        """Çarkı şimdiki tike kadar döndür, geçilen yuvalarda bitenleri at"""
+        simdi = self._simdiki_tik()
+        if simdi <= self._tik:
+            return
+        # Bir turdan uzun aralıkta her yuvaya bir kez bakmak yeter
+        bas = max(self._tik + 1, simdi - self._yuva_sayisi + 1)
+        for tik in range(bas, simdi + 1):
+            yuva = self._yuvalar[tik % self._yuva_sayisi]
+            if not yuva:
+                continue
+            # Sonraki turlara ait kayıtlar yuvada kalır
+            bitenler = [a for a in yuva if self._kayitlar[a][2] <= simdi]
+            for anahtar in bitenler:
+                yuva.discard(anahtar)
+                del self._kayitlar[anahtar]
+            self.suresi_dolan += len(bitenler)
+        self._tik = simdi
+
+    def durum(self) -> Dict[str, Any]:
+        """Canlı ve süresi dolan kayıt sayıları"""
+        self._ilerlet()
+        return {"ad": self.ad, "canli": len(self._kayitlar), "suresi_dolan": self.suresi_dolan}
+
+
+def sureli_durumlari() -> List[Dict[str, Any]]:
+    """Bütün süreli sözlüklerin durum özetleri"""
+    return sorted((s.durum() for s in list(_kayitli)), key=lambda d: d["ad"])
@@ -0,0 +1,109 @@
+"""
+Hafif dil/yazı sınıflandırıcı
+Temizlenmiş dosya adı / sorgu için Türkçe mi İngilizce mi tahmini
+"""
+import functools
+import re
+from typing import Iterable, Tuple
+
+TR = "tr"
+EN = "en"
+BILINMIYOR = "bilinmiyor"
+
+_TURKCE_HARFLER = set("çğıöşüÇĞİÖŞÜ")
+_KELIME = re.compile(r"[^\W\d_]+", re.UNICODE)
+
+TR_DURAK_KELIMELERI = frozenset({
+    "ve", "bir", "ile", "icin", "için", "bu", "su", "şu", "da", "de", "ki", "mi",
+    "ne", "cok", "çok", "gibi", "kadar", "sonra", "once", "önce", "ben", "sen",
+    "biz", "siz", "onlar", "hic", "hiç", "her", "nasil", "nasıl", "neden",
+    "olan", "olarak", "uzerine", "üzerine", "hakkinda", "hakkında", "ya", "veya",
+})
+
+EN_DURAK_KELIMELERI = frozenset({
+    "the", "of", "and", "to", "in", "for", "with", "on", "at", "from", "by",
+    "is", "are", "was", "my", "your", "his", "her", "our", "their", "how",
+    "why", "what", "who", "when", "an", "into", "over", "under", "about",
+    "you", "we", "it", "this", "that", "be", "all", "no", "not", "last",
+})
+
+# ASCII'ye çevrilmiş Türkçe dosya adlarında da kalan ekler
+_TR_EKLERI = ("lari", "leri", "larin", "lerin", "nin", "nun", "sinin", "ligi",
+              "lugu", "cilik", "ciligi", "siz", "suz", "daki", "deki", "dan", "den")
+
+# Türkçede bulunmayan harfler / İngilizceye özgü harf grupları
+_EN_HARFLER = set("wqxWQX")
+_EN_IKILILER = ("th", "ck", "ph", "wh", "sh", "ee", "oo", "ea", "ou", "gh")
+_EN_EKLERI = ("ing", "tion", "ness", "ight", "ful", "less", "ship", "ough")
+_EN_SON_Y = re.compile(r"[bcdfghklmnprstvz]y$")
+
+
+@functools.lru_cache(maxsize=4096)
+def _puanla(metin: str) -> Tuple[float, float]:
+    tr_puan = 0.0
+    en_puan = 0.0
+
+    if any(h in _TURKCE_HARFLER for h in metin):
+        tr_puan += 3.0
+
+    for kelime in _KELIME.findall(metin.lower()):
+        if kelime in TR_DURAK_KELIMELERI:
+            tr_puan += 1.0
+            continue
+        if kelime in EN_DURAK_KELIMELERI:
+            en_puan += 1.0
+            continue
+        if len(kelime) >= 5 and kelime.endswith(_TR_EKLERI):
+            tr_puan += 0.5
+        en_puan += sum(1.0 for h in kelime if h in _EN_HARFLER)
+        en_puan += 0.5 * sum(1 for ikili in _EN_IKILILER if ikili in kelime)
+        if len(kelime) >= 3 and _EN_SON_Y.search(kelime):
+            en_puan += 0.5
+        if len(kelime) >= 4 and kelime.endswith(_EN_EKLERI):
+            en_puan += 0.5
+
+    return tr_puan, en_puan
+
+
+def dil_tahmin_et(
+    metin: str,
+    yerli_yazar: bool = False,
+    yabanci_yazar: bool = False
+) -> Tuple[str, float]:
+    """
+    Sorgunun dilini tahmin et
+
+    Args:
+        metin: Temizlenmiş sorgu
+        yerli_yazar: Sorgudaki yazar daha önce Türkçe eserle eşleşti
+        yabanci_yazar: Sorgudaki yazar daha önce çeviri eserle eşleşti
+
+    Returns:
+        (dil, fark) - dil "tr", "en" veya "bilinmiyor"; fark iki puan
+        arasındaki mesafe (büyüdükçe tahmin daha güvenli)
+
+    Examples:
+        >>> dil_tahmin_et("Project Hail Mary Andy Weir")
+        ('en', 2.0)
+        >>> dil_tahmin_et("Narnia Günlükleri 6 Gümüş Sandalye")
+        ('tr', 3.5)
+    """
+    if not metin:
+        return BILINMIYOR, 0.0
+
+    tr_puan, en_puan = _puanla(metin)
+    if yerli_yazar:
+        tr_puan += 2.0
+    if yabanci_yazar and tr_puan == 0:
+        en_puan += 1.0
+
+    if en_puan >= 2.0 and en_puan > tr_puan:
+        return EN, en_puan - tr_puan
+    if tr_puan > en_puan:
+        return TR, tr_puan - en_puan
+    return BILINMIYOR, 0.0
+
+
+def kelimeler(metin: str) -> Iterable[str]:
+    """Sorgudaki harf dizileri (küçük harf)"""
+    return _KELIME.findall((metin or "").lower())
@@ -0,0 +1,129 @@
+"""
+Toplu mesaj varlık doğrulaması
+Kısa bir pencerede biriken mesaj id'leri kanal başına tek get_messages ile sorulur
+"""
+import asyncio
+import logging
+from typing import Dict, Tuple
+
+from utils.cache import LRUOnbellek
+from utils.statistics import bot_stats
+from utils.telegram_scheduler import tg_zamanlayici
+
+logger = logging.getLogger(__name__)
+
+# İlk istekten sonra aynı kanaldan id toplama süresi (saniye)
+TOPLAMA_PENCERESI = 0.05
+# Tek get_messages isteğindeki en fazla id (Telegram sınırı)
+MAX_TOPLU = 100
+# Doğrulama sonucunun geçerli kaldığı süre (saniye); eskimiş "var" sonucu
+# ucuzdur, düzenleme MessageIdInvalidError verirse taze doğrulama yapılır
+SONUC_TTL = 60.0
+# Sonuç önbelleğindeki en fazla mesaj
+MAX_ONBELLEK = 2000
+
+
+class _KanalToplami:
+    """Bir kanal için bekleyen id'ler ve sonuçlarını bekleyenler"""
+
+    def __init__(self, client, peer):
+        self.client = client
+        self.peer = peer
+        self.bekleyenler: Dict[int, asyncio.Future] = {}
+        self.gorev = None
+
+
+class MesajDogrulayici:
+    """
+    Mesajların hâlâ var olup olmadığını toplu sorar
+
+    Aynı kanal için TOPLAMA_PENCERESI içinde gelen istekler birleştirilir;
+    sonuçlar SONUC_TTL boyunca önbellekte tutulur. Sorgu hata verirse mesaj
+    var sayılır (düzenleme hatası zaten ayrıca yakalanır). Düzenleme sırası
+    bekleyen mesajlar onden_dogrula() ile kuyruğa girerken toplanır, böylece
+    tek tek düzenlenseler de doğrulamaları birlikte yapılır.
+
+    Examples:
+        >>> mesaj_dogrulayici.onden_dogrula(message)   # beklemeden başlat
+        >>> if await mesaj_dogrulayici.dogrula(message): ...
+        >>> await mesaj_dogrulayici.dogrula(message, taze=True)   # önbelleği atla
+    """
+
+    def __init__(self):
+        self._toplamlar: Dict[int, _KanalToplami] = {}
+        self._sonuclar = LRUOnbellek(max_oge=MAX_ONBELLEK, ttl=SONUC_TTL, ad="Doğrulama önbelleği")
+        self._ucusta: Dict[Tuple[int, int], asyncio.Future] = {}
+
+    def _onbellekte(self, message):
+        return self._sonuclar.al((message.chat_id, message.id))
+
+    def _istek(self, message) -> asyncio.Future:
+        """Mesaj için bekleyen (yoksa yeni) doğrulama sonucu"""
+        anahtar = (message.chat_id, message.id)
+        gelecek = self._ucusta.get(anahtar)
+        if gelecek is not None:
+            return gelecek
+
+        toplam = self._toplamlar.get(message.chat_id)
+        if toplam is None:
+            toplam = _KanalToplami(message.client, message.peer_id)
+            self._toplamlar[message.chat_id] = toplam
+
+        gelecek = asyncio.get_running_loop().create_future()
+        toplam.bekleyenler[message.id] = gelecek
+        self._ucusta[anahtar] = gelecek
+        if toplam.gorev is None:
+            toplam.gorev = asyncio.create_task(self._bosalt(message.chat_id, toplam))
+        return gelecek
+
+    def onden_dogrula(self, message):
+        """Doğrulamayı beklemeden başlat (sonuç önbelleğe düşer)"""
+        if self._onbellekte(message) is None:
+            self._istek(message)
+
+    async def dogrula(self, message, taze: bool = False) -> bool:
+        """Mesaj var mı (taze=True: önbellek yerine Telegram'a sor)"""
+        if not taze:
+            sonuc = self._onbellekte(message)
+            if sonuc is not None:
+                return sonuc
+        return await asyncio.shield(self._istek(message))
+
+    def silindi(self, kanal_id: int, mesaj_idler):
+        """Silindiği bildirilen mesajları önbelleğe yok olarak yaz"""
+        for mesaj_id in mesaj_idler:
+            self._sonuclar.koy((kanal_id, mesaj_id), False)
+
+    async def _bosalt(self, kanal_id: int, toplam: _KanalToplami):
+        await asyncio.sleep(TOPLAMA_PENCERESI)
+        try:
+            while toplam.bekleyenler:
+                idler = list(toplam.bekleyenler)[:MAX_TOPLU]
+                bekleyenler = {i: toplam.bekleyenler.pop(i) for i in idler}
+
+                try:
+                    mesajlar = await tg_zamanlayici.cagir(
+                        kanal_id, toplam.client.get_messages, toplam.peer, ids=idler
+                    )
+                    bot_stats.increment("dogrulama_istegi")
+                    # get_messages(ids=liste) sırayı korur, olmayan mesaj None döner
+                    varlik = {i: m is not None for i, m in zip(idler, mesajlar)}
+                except Exception as e:
+                    logger.error(f"❌ Mesaj doğrulama hatası: {e}")
+                    varlik = {i: True for i in idler}
+
+                for mesaj_id, gelecek in bekleyenler.items():
+                    var = varlik.get(mesaj_id, True)
+                    self._sonuclar.koy((kanal_id, mesaj_id), var)
+                    self._ucusta.pop((kanal_id, mesaj_id), None)
+                    if not gelecek.done():
+                        gelecek.set_result(var)
+
+                if len(idler) > 1:
+                    logger.debug(f"🔎 {len(idler)} mesaj tek istekte doğrulandı (kanal {kanal_id})")
+        finally:
+            toplam.gorev = None
+
+
+# Global instance
+mesaj_dogrulayici = MesajDogrulayici()
@@ -0,0 +1,95 @@
+"""
+Host bazlı eşzamanlılık ve hız sınırlayıcı
+Aynı siteye giden istekleri sınırlar, farklı siteler birbirini beklemez
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _HostDurumu:
+    """Tek bir host'un semafor ve zamanlama durumu"""
+
+    def __init__(self, max_eszamanli: int):
+        self.semafor = asyncio.Semaphore(max_eszamanli)
+        self.kilit = asyncio.Lock()
+        self.son_baslangic = 0.0
+        self.aktif = 0
+        self.bekleyen = 0
+
+
+class HostLimiter:
+    """
+    Host başına eşzamanlı istek sınırı + ardışık istekler arası minimum aralık
+
+    Examples:
+        >>> async with host_limiter.slot("kitapyurdu"):
+        ...     data = await run_sync(scraper.search, "Dune")
+    """
+
+    def __init__(self, max_eszamanli: int = 2, min_aralik: float = 0.5):
+        self.max_eszamanli = max_eszamanli
+        self.min_aralik = min_aralik
+        self._hostlar: Dict[str, _HostDurumu] = {}
+
+    def _durum(self, host: str) -> _HostDurumu:
+        durum = self._hostlar.get(host)
+        if durum is None:
+            durum = _HostDurumu(self.max_eszamanli)
+            self._hostlar[host] = durum
+        return durum
+
+    @asynccontextmanager
+    async def slot(self, host: str, dusuk_oncelik: bool = False):
+        """
+        Host için bir istek hakkı al (eşzamanlılık + hız sınırı)
+        
+        Args:
+            host: Host / kaynak adı
+            dusuk_oncelik: True ise host boşalana kadar (aktif veya bekleyen
+                normal istek kalmayana kadar) beklenir; ön getirme işleri
+                canlı aramaları yavaşlatmaz
+        """
+        durum = self._durum(host)
+        if dusuk_oncelik:
+            while durum.aktif or durum.bekleyen:
+                await asyncio.sleep(max(self.min_aralik, 0.1))
+        else:
+            durum.bekleyen += 1
+        
+        try:
+            await durum.semafor.acquire()
+        finally:
+            if not dusuk_oncelik:
+                durum.bekleyen -= 1
+        
+        try:
+            async with durum.kilit:
+                loop = asyncio.get_running_loop()
+                bekle = durum.son_baslangic + self.min_aralik - loop.time()
+                if bekle > 0:
+                    await asyncio.sleep(bekle)
+                durum.son_baslangic = loop.time()
+            durum.aktif += 1
+            try:
+                yield
+            finally:
+                durum.aktif -= 1
+        finally:
+            durum.semafor.release()
+
+    def durum_ozeti(self) -> Dict[str, int]:
+        """Host başına aktif istek sayısı"""
+        return {host: d.aktif for host, d in self._hostlar.items()}
+
+
+# Global instance
+host_limiter = HostLimiter(
+    max_eszamanli=settings.HOST_MAX_ESZAMANLI,
+    min_aralik=settings.RATE_LIMIT_DELAY
+)
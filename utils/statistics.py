@@ -37,6 +37,28 @@ class BotStatistics:
             "toplam_api_cagrisi": 0,
             "basarili_api": 0,
             "basarisiz_api": 0,
+            "zaman_butcesi_asimi": 0,
+            
+            # Dil Yönlendirme
+            "dil_yonlendirme_en": 0,
+            "dil_yonlendirme_dogru": 0,
+            "dil_yonlendirme_yanlis": 0,
+            "dil_tasarruf_istek": 0,
+            
+            # Kitapyurdu Strateji Zinciri
+            "strateji_istegi": 0,
+            "strateji_cozulen": 0,
+            "katalog_isabet": 0,
+            "snapshot_isabet": 0,
+            
+            # Telegram API
+            "rate_limit_sayisi": 0,
+            "tg_flood_bekleme_sn": 0,
+            "dogrulama_istegi": 0,
+            "bos_duzenleme_atlandi": 0,
+            "duzenleme_iptal": 0,
+            "yanki_atlandi": 0,
+            "silinen_mesaj_iptal": 0,
         }
         
         self._load_stats()
@@ -103,6 +125,22 @@ class BotStatistics:
             "toplam_api_cagrisi": 0,
             "basarili_api": 0,
             "basarisiz_api": 0,
+            "zaman_butcesi_asimi": 0,
+            "dil_yonlendirme_en": 0,
+            "dil_yonlendirme_dogru": 0,
+            "dil_yonlendirme_yanlis": 0,
+            "dil_tasarruf_istek": 0,
+            "strateji_istegi": 0,
+            "strateji_cozulen": 0,
+            "katalog_isabet": 0,
+            "snapshot_isabet": 0,
+            "rate_limit_sayisi": 0,
+            "tg_flood_bekleme_sn": 0,
+            "dogrulama_istegi": 0,
+            "bos_duzenleme_atlandi": 0,
+            "duzenleme_iptal": 0,
+            "yanki_atlandi": 0,
+            "silinen_mesaj_iptal": 0,
         }
         self._save_stats()
     
@@ -131,6 +169,20 @@ class BotStatistics:
         else:
             api_basari = 0
         
+        # Dil yönlendirme isabeti
+        yonlenen = self.stats.get('dil_yonlendirme_en', 0)
+        if yonlenen > 0:
+            dil_isabet = (self.stats.get('dil_yonlendirme_dogru', 0) / yonlenen) * 100
+        else:
+            dil_isabet = 0
+        
+        # Çözülen kitap başına strateji isteği
+        cozulen = self.stats.get('strateji_cozulen', 0)
+        if cozulen > 0:
+            istek_basina = self.stats.get('strateji_istegi', 0) / cozulen
+        else:
+            istek_basina = 0
+        
         report = f"""📊 sEkitap Bot İstatistikleri
 {'='*40}
 
@@ -155,6 +207,28 @@ class BotStatistics:
    • Başarılı: {self.stats.get('basarili_api', 0)}
    • Başarısız: {self.stats.get('basarisiz_api', 0)}
    • Başarı Oranı: {api_basari:.1f}%
+   • Zaman Bütçesi Aşımı: {self.stats.get('zaman_butcesi_asimi', 0)}
+
+🔤 DİL YÖNLENDİRME:
+   • İngilizce → Goodreads: {yonlenen}
+   • İsabet: {dil_isabet:.1f}%
+   • Tasarruf Edilen İstek: {self.stats.get('dil_tasarruf_istek', 0)}
+
+🧭 STRATEJİ ZİNCİRİ:
+   • Toplam İstek: {self.stats.get('strateji_istegi', 0)}
+   • Çözülen: {cozulen}
+   • Çözülen Kitap Başına İstek: {istek_basina:.2f}
+   • Yerel Katalogdan Çözülen: {self.stats.get('katalog_isabet', 0)}
+   • Snapshot'tan Çözülen: {self.stats.get('snapshot_isabet', 0)}
+
+📡 TELEGRAM API:
+   • FloodWait: {self.stats.get('rate_limit_sayisi', 0)}
+   • Toplam FloodWait Süresi: {self.stats.get('tg_flood_bekleme_sn', 0)} sn
+   • Varlık Doğrulama İsteği: {self.stats.get('dogrulama_istegi', 0)}
+   • Atlanan Boş Düzenleme: {self.stats.get('bos_duzenleme_atlandi', 0)}
+   • Yerine Yenisi Gelen (İptal): {self.stats.get('duzenleme_iptal', 0)}
+   • Atlanan Düzenleme Yankısı: {self.stats.get('yanki_atlandi', 0)}
+   • Silinen Mesaj (İptal): {self.stats.get('silinen_mesaj_iptal', 0)}
 """
         
         if self.stats.get('son_islem_zamani'):
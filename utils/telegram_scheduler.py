@@ -0,0 +1,214 @@
+"""
+Telegram API zamanlayıcı
+Bütün Telegram çağrıları kanal başına ve genel jeton kovalarından geçer;
+FloodWait alındığında hız AIMD ile ayarlanır
+"""
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict
+
+from telethon.errors import FloodWaitError
+
+from config.settings import settings
+from utils.statistics import bot_stats
+
+logger = logging.getLogger(__name__)
+
+# Kova kapasitesi: kaç saniyelik hız birikebilir (kısa patlamalara izin)
+PATLAMA_SURESI = 2.0
+# AIMD: her başarılı çağrıda hız tavanın bu oranı kadar artar,
+# FloodWait'te bu katsayıyla çarpılır
+ARTIS_ORANI = 0.02
+AZALMA_CARPANI = 0.5
+# Hız tavanın bu oranının altına inmez
+TABAN_ORANI = 0.05
+# Aynı çağrı için FloodWait sonrası en fazla deneme
+MAX_DENEME = 5
+# iter_messages'ın tek istekte getirdiği mesaj sayısı (Telethon)
+GECMIS_SAYFA = 100
+
+
+class _Kova:
+    """
+    Jeton kovası
+
+    Kilit FIFO'dur: jeton bekleyen çağrılar (FloodWait sonrası gecikmeli
+    denemeler dahil) geliş sırasıyla kuyrukta bekler.
+    """
+
+    def __init__(self, tavan: float):
+        self.tavan = tavan
+        self.hiz = tavan
+        self.kapasite = max(1.0, tavan * PATLAMA_SURESI)
+        self.jeton = self.kapasite
+        self.son = time.monotonic()
+        self.durdur_bitis = 0.0
+        self.kilit = asyncio.Lock()
+        self.bekleyen = 0
+
+    def _doldur(self, simdi: float):
+        self.jeton = min(self.kapasite, self.jeton + (simdi - self.son) * self.hiz)
+        self.son = simdi
+
+    async def al(self):
+        self.bekleyen += 1
+        try:
+            async with self.kilit:
+                while True:
+                    simdi = time.monotonic()
+                    self._doldur(simdi)
+                    if simdi < self.durdur_bitis:
+                        await asyncio.sleep(self.durdur_bitis - simdi)
+                        continue
+                    if self.jeton >= 1:
+                        self.jeton -= 1
+                        return
+                    await asyncio.sleep((1 - self.jeton) / self.hiz)
+        finally:
+            self.bekleyen -= 1
+
+    def basari(self):
+        self.hiz = min(self.tavan, self.hiz + self.tavan * ARTIS_ORANI)
+
+    def flood(self, saniye: float):
+        self.hiz = max(self.tavan * TABAN_ORANI, self.hiz * AZALMA_CARPANI)
+        self.jeton = 0.0
+        self.durdur_bitis = max(self.durdur_bitis, time.monotonic() + saniye)
+
+
+class TelegramZamanlayici:
+    """
+    Telegram çağrıları için ortak hız kontrolü
+
+    Her çağrı önce kanalın, sonra genel kovanın jetonunu alır. FloodWait
+    gelirse iki kovanın hızı yarıya iner ve bekleme süresi boyunca durur;
+    çağrı özyineleme yerine kova kuyruğuna geri girerek yeniden denenir.
+    Başarılı çağrılarla hız tavana doğru doğrusal olarak geri çıkar.
+
+    İstemcinin flood_sleep_threshold'u 0'dır: Telethon hiçbir FloodWait'i
+    kendisi uyumaz, hepsi burada görülüp hıza yansır. Bu yüzden bot
+    düzenlemeleri, doğrulama ve admin yanıtları dahil bütün Telegram
+    çağrıları bu zamanlayıcıdan geçer.
+
+    Examples:
+        >>> await tg_zamanlayici.cagir(message.chat_id, message.edit, text=metin)
+        >>> async for mesaj in tg_zamanlayici.iter_messages(client, kanal_id):
+        ...     ...
+    """
+
+    def __init__(
+        self,
+        genel_hiz: float,
+        kanal_hizi: float,
+        max_flood_bekleme: float
+    ):
+        self.kanal_hizi = kanal_hizi
+        self.max_flood_bekleme = max_flood_bekleme
+        self._genel = _Kova(genel_hiz)
+        self._kanallar: Dict[Any, _Kova] = {}
+
+    def _kova(self, kanal_id) -> _Kova:
+        kova = self._kanallar.get(kanal_id)
+        if kova is None:
+            kova = _Kova(self.kanal_hizi)
+            self._kanallar[kanal_id] = kova
+        return kova
+
+    async def _al(self, kanal_id):
+        await self._kova(kanal_id).al()
+        await self._genel.al()
+
+    def _basari(self, kanal_id):
+        self._kova(kanal_id).basari()
+        self._genel.basari()
+
+    def _flood(self, kanal_id, e: FloodWaitError, deneme: int) -> bool:
+        """FloodWait'i işle; yeniden denenecekse True"""
+        bot_stats.increment("rate_limit_sayisi")
+        bot_stats.increment("tg_flood_bekleme_sn", e.seconds)
+        if e.seconds > self.max_flood_bekleme or deneme >= MAX_DENEME:
+            logger.error(f"❌ FloodWait {e.seconds}s (kanal {kanal_id}), çağrı bırakıldı")
+            return False
+
+        kova = self._kova(kanal_id)
+        kova.flood(e.seconds)
+        self._genel.flood(e.seconds)
+        logger.warning(
+            f"⏳ FloodWait {e.seconds}s (kanal {kanal_id}) - "
+            f"hız: kanal {kova.hiz:.2f}/s, genel {self._genel.hiz:.2f}/s"
+        )
+        return True
+
+    async def cagir(self, kanal_id, fonksiyon: Callable[..., Awaitable], *args, **kwargs):
+        """
+        Telegram çağrısını hız sınırı altında yap
+
+        Args:
+            kanal_id: Çağrının ait olduğu sohbet
+            fonksiyon: Telethon coroutine fonksiyonu (message.edit, client.get_messages...)
+
+        Raises:
+            FloodWaitError: Bekleme max_flood_bekleme'yi aşarsa / denemeler biterse
+        """
+        deneme = 0
+        while True:
+            deneme += 1
+            await self._al(kanal_id)
+            try:
+                sonuc = await fonksiyon(*args, **kwargs)
+            except FloodWaitError as e:
+                if not self._flood(kanal_id, e, deneme):
+                    raise
+                continue
+            self._basari(kanal_id)
+            return sonuc
+
+    async def iter_messages(self, client, kanal_id, **kwargs) -> AsyncIterator:
+        """
+        client.iter_messages'ın hız sınırlı hali
+
+        Her sayfa isteği bir jeton alır; FloodWait'te beklenip son görülen
+        mesajdan (offset_id) devam edilir.
+        """
+        limit = kwargs.pop("limit", None)
+        verilen = 0
+        deneme = 0
+
+        while True:
+            deneme += 1
+            await self._al(kanal_id)
+            try:
+                kalan = None if limit is None else limit - verilen
+                async for mesaj in client.iter_messages(kanal_id, limit=kalan, **kwargs):
+                    # Devam noktası (reverse=True'da da offset_id, Telethon yönü çevirir)
+                    kwargs["offset_id"] = mesaj.id
+                    verilen += 1
+                    yield mesaj
+                    # Sonraki sayfa bir sonraki yinelemede istenir
+                    if verilen % GECMIS_SAYFA == 0:
+                        self._basari(kanal_id)
+                        deneme = 0
+                        await self._al(kanal_id)
+                self._basari(kanal_id)
+                return
+            except FloodWaitError as e:
+                if not self._flood(kanal_id, e, deneme):
+                    raise
+
+    def durum(self) -> Dict[str, Any]:
+        """Güncel hızlar ve jeton bekleyen çağrı sayısı"""
+        return {
+            "genel_hiz": self._genel.hiz,
+            "genel_tavan": self._genel.tavan,
+            "en_yavas_kanal": min((k.hiz for k in self._kanallar.values()), default=self.kanal_hizi),
+            "bekleyen": self._genel.bekleyen + sum(k.bekleyen for k in self._kanallar.values()),
+        }
+
+
+# Global instance
+tg_zamanlayici = TelegramZamanlayici(
+    genel_hiz=settings.TG_GENEL_HIZ,
+    kanal_hizi=settings.TG_KANAL_HIZI,
+    max_flood_bekleme=settings.TG_MAX_FLOOD_BEKLEME,
+)
@@ -1,8 +1,8 @@
 """Metin işleme fonksiyonları"""
 import re
 import html
-import difflib
-from typing import Optional
+import functools
+from typing import Optional, Iterable, FrozenSet
 import ftfy
 from bs4 import BeautifulSoup
 from config.constants import GURULTU_KELIMELERI
@@ -14,6 +14,105 @@ def turkce_kucult(metin: str) -> str:
     return metin.replace('I', 'ı').replace('İ', 'i').lower()
 
 
+def _trie_deseni(kelimeler: Iterable[str]) -> str:
+    """
+    Kelime listesinden ortak önekleri birleştirilmiş tek bir regex üret
+
+    Örnek: ["yayın", "yayınevi", "yayınları"] → "yayın(?:evi|ları)?"
+    Regex motoru her konumda yüzlerce alternatifi tek tek denemek yerine
+    trie üzerinde ilerler; en uzun eşleşme önce denenir.
+    """
+    trie = {}
+    for kelime in kelimeler:
+        dugum = trie
+        for harf in kelime:
+            dugum = dugum.setdefault(harf, {})
+        dugum[''] = {}
+
+    def _yaz(dugum) -> str:
+        bitis = '' in dugum
+        dallar = [
+            re.escape(harf) + _yaz(alt)
+            for harf, alt in sorted(dugum.items()) if harf
+        ]
+        if not dallar:
+            return ''
+        if len(dallar) == 1 and not bitis:
+            return dallar[0]
+        grup = '(?:' + '|'.join(dallar) + ')'
+        return grup + '?' if bitis else grup
+
+    return _yaz(trie)
+
+
+class GurultuTemizleyici:
+    """
+    Gürültü kelimeleri için önceden derlenmiş temizleme motoru
+
+    - Tüm kelimeler tek bir trie-regex'te (tek geçiş, kelime sınırlı)
+    - Tam token kontrolü için frozenset (O(1))
+    - Kayıt anahtarları için sıralı, büyük/küçük harf duyarlı temizleme
+    """
+
+    def __init__(self, kelimeler: Iterable[str]):
+        kelimeler = [k for k in kelimeler if k and k.strip()]
+        temiz = {turkce_kucult(k).strip() for k in kelimeler}
+        self.kelimeler: FrozenSet[str] = frozenset(temiz)
+
+        govde = _trie_deseni(self.kelimeler)
+        self._desen = re.compile(r'\b(?:' + govde + r')\b', re.IGNORECASE)
+
+        # Sıralı temizleme: listedeki sırayla kelime başına desen (eski
+        # metni_temizle'nin birebir aynısı, ama bir kez derlenmiş). Harf
+        # duyarlı birleşik desen yalnızca "hiç gürültü var mı" ön kontrolü
+        # içindir: IGNORECASE'te "i" "ı" ile de eşleşirdi.
+        self._sirali = [
+            re.compile(r'\b' + re.escape(k) + r'(\s+\d+)?\b') for k in kelimeler
+        ]
+        self._duyarli_desen = re.compile(
+            r'\b(?:' + _trie_deseni(set(kelimeler)) + r')(?:\s+\d+)?\b'
+        )
+
+    def temizle(self, metin: str, yerine: str = ' ') -> str:
+        """
+        Metindeki gürültü kelimelerini tek geçişte sil (arama sorgusu için)
+
+        Args:
+            metin: Temizlenecek metin
+            yerine: Silinen kelimenin yerine konacak metin
+        """
+        if not metin:
+            return metin
+        return self._desen.sub(yerine, metin)
+
+    def sirali_temizle(self, metin: str) -> str:
+        """
+        Kelimeleri listedeki sırayla, harf duyarlı ve ardındaki sayıyla sil
+
+        Çıktı eski kelime başına re.sub döngüsüyle aynıdır (dosya: kayıt
+        anahtarları değişmez). Gürültü kelimesi içermeyen metinler tek
+        aramayla döner; döngü yalnızca eşleşme varsa çalışır.
+        """
+        if not metin or not self._duyarli_desen.search(metin):
+            return metin
+        for desen in self._sirali:
+            metin = desen.sub('', metin)
+        return metin
+
+    def gurultu_mu(self, metin: str) -> bool:
+        """Metnin tamamı bir gürültü kelimesi mi?"""
+        if not metin:
+            return False
+        aday = metin.strip()
+        return (
+            turkce_kucult(aday) in self.kelimeler
+            or aday.lower() in self.kelimeler
+        )
+
+
+gurultu_temizleyici = GurultuTemizleyici(GURULTU_KELIMELERI)
+
+
 def turkce_baslik_yap(metin: str) -> Optional[str]:
     if not metin:
         return None
@@ -35,19 +134,60 @@ def turkce_baslik_yap(metin: str) -> Optional[str]:
     return " ".join(yeni_kelimeler)
 
 
+# Kısa ve sık tekrar eden değerler (yayınevi, tür, yazar) önbelleğe alınır
+_ONBELLEK_MAX_UZUNLUK = 200
+# Bu uzunluğa kadar HTML parçaları BeautifulSoup yerine regex ile soyulur
+_HAFIF_ETIKET_MAX_UZUNLUK = 5000
+
+# ftfy'nin dokunmadığı karakterler (ASCII + Türkçe harfler + yaygın noktalama).
+# Mojibake her zaman bu küme dışında bir karakter içerir (Ã, Ä, Å, €, ’ ...).
+_TEMIZ_METIN = re.compile(
+    r'[\t\n\r\x20-\x25\x27-\x7eçÇğĞıİöÖşŞüÜâîÎûÛéÉèêëáàäíìïóòúùñ–—…«»°·×]*'
+)
+_HTML_ETIKETI = re.compile(r'<!--.*?-->|</?[A-Za-z][^<>]*>|<![^<>]*>', re.DOTALL)
+_AGIR_ETIKET = re.compile(r'<\s*(?:script|style)\b', re.IGNORECASE)
+
+
+def _etiketleri_temizle(metin: str) -> str:
+    """HTML etiketlerini sil (kısa parçalar için regex, gerisi için BeautifulSoup)"""
+    if len(metin) <= _HAFIF_ETIKET_MAX_UZUNLUK and not _AGIR_ETIKET.search(metin):
+        return _HTML_ETIKETI.sub(' ', metin)
+    try:
+        soup = BeautifulSoup(metin, 'html.parser')
+        return soup.get_text(separator=' ')
+    except:
+        return metin
+
+
+def _metin_duzelt(metin: str) -> str:
+    if "<" in metin and ">" in metin:
+        metin = _etiketleri_temizle(metin)
+    if "&" in metin:
+        metin = html.unescape(metin)
+    # Hızlı yol: temiz ASCII/UTF-8 metinde ftfy'ye gerek yok
+    if not _TEMIZ_METIN.fullmatch(metin):
+        metin = ftfy.fix_text(metin)
+    return " ".join(metin.split())
+
+
+@functools.lru_cache(maxsize=4096)
+def _metin_duzelt_onbellekli(metin: str) -> str:
+    return _metin_duzelt(metin)
+
+
 def metin_duzelt(metin: str) -> str:
+    """
+    Metni normalize et (HTML etiketleri, entity'ler, bozuk kodlama, boşluklar)
+
+    Kademeli çalışır: temiz metin ftfy'ye girmez, kısa HTML parçaları regex ile
+    soyulur, kısa değerler LRU önbellekten döner.
+    """
     if not metin:
         return ""
-    try:
-        if "<" in str(metin) and ">" in str(metin):
-            soup = BeautifulSoup(str(metin), 'html.parser')
-            metin = soup.get_text(separator=' ')
-    except:
-        pass
-    metin = html.unescape(str(metin))
-    metin = ftfy.fix_text(metin)
-    metin = re.sub(r'\s+', ' ', metin).strip()
-    return metin.strip()
+    metin = str(metin)
+    if len(metin) <= _ONBELLEK_MAX_UZUNLUK:
+        return _metin_duzelt_onbellekli(metin)
+    return _metin_duzelt(metin)
 
 
 def baslik_teknik_temizle(baslik: str) -> Optional[str]:
@@ -81,9 +221,7 @@ def metni_temizle(metin: str, manuel_mod: bool = False) -> str:
     temiz = re.sub(r'\(.*?\)', '', temiz)
     temiz = re.sub(r'\[.*?\]', '', temiz)
     temiz = temiz.replace('_', ' ')
-    for kelime in GURULTU_KELIMELERI:
-        pattern = r'\b' + re.escape(kelime) + r'(\s+\d+)?\b'
-        temiz = re.sub(pattern, '', temiz)
+    temiz = gurultu_temizleyici.sirali_temizle(temiz)
     if not manuel_mod:
         parcalar = temiz.split('-')
         if len(parcalar) >= 3:
@@ -97,7 +235,8 @@ def metni_temizle(metin: str, manuel_mod: bool = False) -> str:
 def benzerlik_orani(a: str, b: str) -> float:
     if not a or not b:
         return 0.0
-    return difflib.SequenceMatcher(None, turkce_kucult(a), turkce_kucult(b)).ratio()
+    from utils.similarity import benzerlik_motoru
+    return benzerlik_motoru.oran(a, b)
 
 
 def kelime_kumesi_orani(aranan: str, bulunan: str) -> float:
@@ -136,36 +275,8 @@ def durum_belirle(dosya_adi: str) -> str:
             return "Ham Tarama"
         return "Clear Scan"
     return "-"
-# utils/text_utils.py
 
-def dosya_adini_arama_icin_temizle(dosya_adi: str) -> str:
-    """
-    Dosya adını arama için optimize et
-    
-    Örnek:
-        "Sarah J. Maas - Cam Şato 2 - Karanlık Taç.epub"
-        → "Karanlık Taç Sarah J Maas"
-    """
-    
-    # Uzantıyı kaldır
-    ad = re.sub(r'\.(epub|pdf)$', '', dosya_adi, flags=re.IGNORECASE)
-    
-    # " - " ile böl (yazar - seri - kitap formatı)
-    parcalar = ad.split(' - ')
-    
-    if len(parcalar) >= 3:
-        yazar = parcalar[0].strip()
-        kitap = parcalar[-1].strip()  # Son parça kitap adı
-        return f"{kitap} {yazar}"  # Kitap adı önce
-    
-    elif len(parcalar) == 2:
-        return f"{parcalar[1]} {parcalar[0]}"
-    
-    # Alt çizgileri boşluğa çevir
-    ad = ad.replace('_', ' ')
-    ad = re.sub(r'\s+', ' ', ad).strip()
-    
-    return ad
+
 def temizle_dosya_adi(dosya_adi: str) -> str:
     """
     Dosya adını temizle ve normalize et